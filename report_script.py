@@ -1,93 +1,81 @@
 import os
 import sys
-import yaml
-import json
-import logging
-import pandas as pd
 from datetime import datetime, timezone
 
 # BATS 경로 추가
-bats_dir = "/Users/jkpark/.openclaw/workspace-jeff/bats-trading-system"
+bats_dir = os.path.dirname(os.path.abspath(__file__))
 os.chdir(bats_dir)
-sys.path.append(os.path.join(bats_dir, "src"))
+sys.path.append(bats_dir)
+
+from src.utils import load_config
+from src.utils.live_snapshot import SnapshotReader, DEFAULT_PATH, process_alive
+
+
+def _fmt(value, prefix="$"):
+    return f"{prefix}{value:,.2f}" if isinstance(value, (int, float)) else "N/A"
 
-from src.utils import load_config, JSONPersistence
-from src.core import ExchangeProvider, TechnicalAnalysisEngine, AdvancedTurtleManager
 
 def get_bats_report():
-    # 1. Config & State Load
+    # 1. 라이브 루프가 게시한 스냅샷 읽기 (거래소 API 호출 없음)
     config = load_config()
-    persistence = JSONPersistence()
-    state = persistence.load()
-    
+    snapshot_cfg = config.get('live_snapshot', {})
+    snapshot = SnapshotReader(snapshot_cfg.get('path', DEFAULT_PATH)).read()
+    if snapshot is None:
+        print("Error: No live snapshot found. Is the bot running with live_snapshot.enabled?")
+        return
+
     test_mode = config.get('system', {}).get('test_mode', True)
-    symbol = config['strategies'][0]['symbol']
-    interval = config['strategies'][0]['timeframe']
-    
-    # 2. Exchange Data
-    try:
-        exchange = ExchangeProvider(testnet=test_mode)
-        df = exchange.get_market_data(symbol, interval)
-        current_price = exchange.get_realtime_price(symbol)
-        
-        if df is None or current_price is None:
-            print("Error: Failed to fetch market data.")
-            return
+    running = process_alive(snapshot['pid'])
+    age = datetime.now(timezone.utc).timestamp() - snapshot['published_at']
+    published = datetime.fromtimestamp(snapshot['published_at'], timezone.utc)
+
+    # 2. Output Report
+    print(f"### BATS Daily Report (Mode: {'TESTNET' if test_mode else 'REAL'})")
+    print(f"- **현재 시각**: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC")
+    print(f"- **스냅샷 시각**: {published.strftime('%Y-%m-%d %H:%M:%S')} UTC ({age:.0f}초 전, "
+          f"iteration #{snapshot['iteration']}, {snapshot['duration_ms']}ms)")
+    print(f"- 시스템 프로세스: {'RUNNING' if running else 'STOPPED'} (pid {snapshot['pid']})")
+    if running and age > 3 * snapshot.get('polling_interval', 60):
+        print(f"- **경고**: 스냅샷이 {age:.0f}초 동안 갱신되지 않았습니다.")
+
+    print(f"\n#### [1] 계정")
+    for name, account in snapshot['accounts'].items():
+        print(f"- **{name}**: 잔고 {_fmt(account['balance'])}, Heat {account['total_heat'] * 100:.1f}%")
+
+    for symbol, info in snapshot['symbols'].items():
+        ind = info['indicators']
+        print(f"\n#### [{symbol}] {info['interval']} / {info['strategy']}{' (exit-only)' if info['exit_only'] else ''}")
+        print(f"- **현재 가격**: {_fmt(info['price'])}")
+        print(f"- **N (ATR 20)**: {_fmt(ind.get('N'), '')}")
+        print(f"- **ADX (14)**: {_fmt(ind.get('ADX'), '')}")
+        if 'rsi_14' in ind:
+            print(f"- **RSI (14)**: {_fmt(ind['rsi_14'], '')}")
+        print(f"- **EMA 200**: {_fmt(ind.get('ema_200'))}")
+        for channel in sorted(k for k in ind if k.startswith('dc_')):
+            print(f"- **Donchian ({channel[3:].replace('_high', 'H').replace('_low', 'L')})**: {_fmt(ind[channel])}")
+
+        for name, position in info['positions'].items():
+            levels = position['levels']
+            if position['units_held'] > 0:
+                print(f"- **{name} 포지션**: LONG {position['units_held']} / 4 units ({position['system_mode']}), "
+                      f"진입가 {position['entry_prices']}")
+                print(f"  - Hard Stop: {_fmt(levels.get('hard_stop'))}, Trailing Stop: {_fmt(levels.get('trailing_stop'))}, "
+                      f"다음 피라미딩: {_fmt(levels.get('pyramid'))}")
+            else:
+                entries = ", ".join(f"{k[:2].upper()} {_fmt(v)}" for k, v in levels.items())
+                print(f"- **{name} 포지션**: 무포지션 (Cash){f' / 진입 돌파선: {entries}' if entries else ''}")
 
-        # 3. Indicator Calculation
-        ta = TechnicalAnalysisEngine()
-        df_analyzed = ta.calculate_indicators(df)
-        last_row = df_analyzed.iloc[-1]
-        
-        # 4. Strategy Logic (AdvancedTurtleManager)
-        strategy_config = config.get('strategies', [{}])[0]
-        strategy_params = strategy_config.get('strategy_params', {})
-        # AdvancedTurtleManager의 기본값이나 config에서 가져옴
-        manager = AdvancedTurtleManager(**strategy_params)
-        
-        # Next Signal Preview
-        next_sig = manager.generate_signal(df_analyzed, current_price, state.copy())
+    if snapshot.get('shadow'):
+        print(f"\n#### 섀도 전략")
+        for name, row in snapshot['shadow'].items():
+            print(f"- **{name}**: trades {row['trades']}, win rate {row['win_rate']:.1f}%, "
+                  f"realized {row['realized_pnl']:.2f}, unrealized {row['unrealized_pnl']:.2f}")
 
-        # 5. Output Report
-        print(f"### BATS Daily Report (Mode: {'TESTNET' if test_mode else 'REAL'})")
-        print(f"- **현재 시각**: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC")
-        print(f"- **대상 심볼**: {symbol} ({interval})")
-        print(f"- **현재 가격**: ${current_price:,.2f}")
-        print(f"\n#### [1] 시스템 상태 (state.json)")
-        print(f"- **모드**: {state.get('system_mode', 'N/A')}")
-        print(f"- **보유 유닛**: {state.get('units_held', 0)} / 4")
-        print(f"- **진입 가격**: {state.get('entry_prices', [])}")
-        print(f"- **직전 결과**: {state.get('last_trade_result', 'N/A')}")
-        
-        print(f"\n#### [2] 주요 기술 지표")
-        print(f"- **N (ATR 20)**: {last_row['N']:.2f}")
-        print(f"- **ADX (14)**: {last_row['ADX']:.2f} (Threshold: {strategy_params.get('adx_filter_threshold', 30)})")
-        print(f"- **RSI (14)**: {last_row['rsi_14']:.2f} (Threshold: 55)")
-        print(f"- **EMA 200**: ${last_row['ema_200']:,.2f}")
-        print(f"- **Donchian (90H)**: ${last_row['dc_90_high']:,.2f}")
-        print(f"- **Donchian (45L)**: ${last_row['dc_45_low']:,.2f} (S3 Exit)")
-        
-        print(f"\n#### [3] 전략 분석")
-        if state.get('units_held', 0) > 0:
-            last_entry = state['entry_prices'][-1]
-            stop_multiplier = strategy_params.get('stop_n_multiplier', 3.0)
-            hard_stop = last_entry - (stop_multiplier * state.get('current_n', 0))
-            print(f"- **현재 포지션**: LONG 유지 중")
-            print(f"- **Hard Stop (Last Entry - {stop_multiplier}N)**: ${hard_stop:,.2f}")
-            print(f"- **Trailing Stop (DC 45L)**: ${last_row['dc_45_low']:,.2f}")
-        else:
-            print(f"- **현재 포지션**: 무포지션 (Cash)")
-            
-        print(f"- **다음 예상 시그널**: **{next_sig}**")
-        
-        # Log File Status
-        log_size = os.path.getsize("bats_real.log")
-        print(f"\n#### [4] 시스템 로그 상황")
-        print(f"- `bats_real.log` 크기: {log_size} bytes")
-        print(f"- 시스템 프로세스: {'RUNNING' if os.popen('ps aux | grep src/main.py | grep -v grep').read() else 'STOPPED'}")
+    # Log File Status
+    if os.path.exists("bats_real.log"):
+        print(f"\n#### 시스템 로그 상황")
+        print(f"- `bats_real.log` 크기: {os.path.getsize('bats_real.log')} bytes")
 
-    except Exception as e:
-        print(f"Error generating report: {e}")
 
 if __name__ == "__main__":
     get_bats_report()
@@ -15,6 +15,9 @@ cat <<EOF | sudo tee $SERVICE_FILE
 [Unit]
 Description=BATS Trading System
 After=network.target
+# 짧은 RestartSec로 연속 실패(잘못된 설정, 거래소 장애 등)가 나도 systemd 기본 시작 제한에
+# 걸려 영구 failed 상태로 남지 않도록 시작 횟수 제한을 끈다.
+StartLimitIntervalSec=0
 
 [Service]
 Type=simple
@@ -23,7 +26,10 @@ WorkingDirectory=$APP_DIR
 Environment="PYTHONPATH=$APP_DIR"
 ExecStart=$PYTHON_BIN $SCRIPT_PATH --daemon
 Restart=always
-RestartSec=10
+RestartSec=2
+# 연속 재시작 시 대기 시간을 2초에서 60초까지 늘린다 (systemd 254+, 이전 버전은 무시)
+RestartSteps=5
+RestartMaxDelaySec=60
 StandardOutput=append:$APP_DIR/bats.log
 StandardError=append:$APP_DIR/bats.log
 
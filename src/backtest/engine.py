@@ -3,7 +3,11 @@ import os
 import pandas as pd
 from datetime import datetime
 from urllib.request import urlopen
-from src.core import TechnicalAnalysisEngine, RiskManager, TurtleSignalManager, AdvancedTurtleManager
+from src.core import TechnicalAnalysisEngine, RiskManager
+from src.strategies import create_strategy, required_indicators
+from src.utils.kline_quality import check_klines, repair_klines
+from src.utils.kline_store import KlineStore, interval_to_ms
+from src.utils.resample import resample_frame
 
 class BacktestEngine:
     def __init__(self, config_path):
@@ -12,6 +16,9 @@ class BacktestEngine:
         
         self.symbol = self.config.get('symbol', 'BTCUSDT')
         self.interval = self.config.get('interval', '1h')
+        self.base_interval = self.config.get('base_interval')  # 예: "1h" -> interval 캔들을 1h에서 집계
+        self.data_dir = self.config.get('data_dir')  # 예: "data/klines" -> 받은 캔들 보관/재사용
+        self.data_quality = self.config.get('data_quality', 'repair')  # repair | flag | off
         self.limit = self.config.get('limit', 1000)
         self.start_time = self.config.get('start_time')
         self.end_time = self.config.get('end_time')
@@ -32,26 +39,54 @@ class BacktestEngine:
         self.equity_curve = []
 
     def fetch_data(self):
-        print(f"Fetching data for {self.symbol}...")
+        """
+        interval 캔들을 DataFrame으로 반환한다.
+        base_interval이 주어지면 그 캔들 하나만 받아 interval로 로컬 집계하고(resample),
+        data_dir이 주어지면 받은 캔들을 KlineStore에 보관해 다른 타임프레임 실행에서 재사용한다.
+        """
+        if self.base_interval and self.base_interval != self.interval:
+            ratio = interval_to_ms(self.interval) // interval_to_ms(self.base_interval)
+            base = self._load_klines(self.base_interval, self.limit * ratio)
+            print(f"Resampling {len(base)} {self.base_interval} candles to {self.interval}")
+            resampled = resample_frame(base, self.interval)
+            # 조회 시작 시각이 상위 봉 중간이면 첫 봉은 일부만 집계된 것이므로 버린다
+            if len(base) and resampled['timestamp'].iloc[0] != base['timestamp'].iloc[0]:
+                resampled = resampled.iloc[1:].reset_index(drop=True)
+            return resampled
+        return self._load_klines(self.interval, self.limit)
+
+    def _load_klines(self, interval, limit):
+        store = KlineStore(self.data_dir, max_bars=0) if self.data_dir else None
+        if store is not None and not (self.start_time or self.end_time):
+            columns = store.load(self.symbol, interval)
+            if columns is not None and len(columns['timestamp']) >= limit:
+                print(f"Loaded {limit} {interval} candles for {self.symbol} from {self.data_dir}")
+                return pd.DataFrame({col: values[-limit:] for col, values in columns.items()})
+
+        df = self._fetch_klines(interval, limit)
+        if store is not None and not df.empty:
+            store.update(self.symbol, interval, {col: df[col].to_numpy() for col in df.columns})
+        return df
+
+    def _fetch_klines(self, interval, limit, start_time=None, end_time=None):
+        print(f"Fetching data for {self.symbol} ({interval})...")
         all_klines = []
         
         # Calculate start time based on limit if not provided
         # Binance limit per request is 1000.
         limit_per_request = 1000
-        total_needed = self.limit
+        total_needed = limit
         
         # Interval in milliseconds
-        interval_ms = 3600000 # Default 1h
-        if self.interval == '4h': interval_ms *= 4
-        elif self.interval == '1d': interval_ms *= 24
+        interval_ms = interval_to_ms(interval)
         
-        end_time = self.end_time if self.end_time else int(datetime.now().timestamp() * 1000)
-        start_time = self.start_time if self.start_time else (end_time - (total_needed * interval_ms))
+        end_time = end_time or self.end_time or int(datetime.now().timestamp() * 1000)
+        start_time = start_time or self.start_time or (end_time - (total_needed * interval_ms))
         
         current_start = start_time
         while len(all_klines) < total_needed:
             fetch_limit = min(limit_per_request, total_needed - len(all_klines))
-            url = f"https://api.binance.com/api/v3/klines?symbol={self.symbol}&interval={self.interval}&startTime={current_start}&limit={fetch_limit}"
+            url = f"https://api.binance.com/api/v3/klines?symbol={self.symbol}&interval={interval}&startTime={current_start}&limit={fetch_limit}"
             
             try:
                 with urlopen(url) as response:
@@ -67,6 +102,8 @@ class BacktestEngine:
                 break
         
         print(f"Total candles fetched: {len(all_klines)}")
+        if len(all_klines) < total_needed:
+            print(f"Warning: expected {total_needed} candles for {self.symbol} ({interval}), got {len(all_klines)}")
         
         # Format to expected DataFrame structure
         formatted_data = []
@@ -80,20 +117,40 @@ class BacktestEngine:
                 'volume': float(k[5])
             })
             
-        return pd.DataFrame(formatted_data)
+        return pd.DataFrame(formatted_data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
         
+    def check_data(self, df):
+        """
+        캔들 품질 검사 (data_quality 설정).
+        - "repair"(기본): 누락 구간을 다시 조회하고, 그래도 비면 직전 종가로 채운다. 이상치는 경고만 한다.
+        - "flag": 검사 결과만 출력한다.
+        - "off": 검사하지 않는다.
+        """
+        if self.data_quality == 'off' or df is None or df.empty:
+            return df
+        if self.data_quality == 'flag':
+            _, report = check_klines(df, self.interval)
+            print(f"Data quality ({self.symbol} {self.interval}): {report.summary()}")
+            return df
+
+        def refetch(start, end):
+            bars = (end - start) // interval_to_ms(self.interval) + 1
+            gap = self._fetch_klines(self.interval, bars, start_time=start, end_time=end)
+            return {col: gap[col].to_numpy() for col in gap.columns}
+
+        repaired, report = repair_klines(df, self.interval, refetch=refetch)
+        print(f"Data quality ({self.symbol} {self.interval}): {report.summary()}")
+        if report.missing_bars:
+            print(f"Forward-filled {int(repaired['filled'].sum())} bars still missing after refetch")
+        return repaired.drop(columns=['filled', 'flagged'])
+
     def run(self):
-        raw_data = self.fetch_data()
-        ta = TechnicalAnalysisEngine()
-        analyzed_data = ta.calculate_indicators(raw_data)
-        
+        raw_data = self.check_data(self.fetch_data())
         strategy_params = self.config.get('strategy_params', {})
-        strategy_class_name = self.config.get('strategy', 'TurtleSignalManager')
-        
-        if strategy_class_name == 'AdvancedTurtleManager':
-            signal_manager = AdvancedTurtleManager(**strategy_params)
-        else:
-            signal_manager = TurtleSignalManager(**strategy_params)
+        signal_manager = create_strategy(self.config.get('strategy', 'TurtleSignalManager'), strategy_params)
+
+        ta = TechnicalAnalysisEngine()
+        analyzed_data = ta.calculate_indicators(raw_data, indicators=required_indicators([signal_manager]))
         
         print(f"Starting backtest for {self.symbol} ({self.interval})...")
         
@@ -1,5 +1,42 @@
-from .signal_manager import TurtleSignalManager, AdvancedTurtleManager
-from .exchange_provider import ExchangeProvider
-from .modules_impl import TechnicalAnalysisEngine, RiskManager, BinanceExecutionEngine
-from .notification_manager import NotificationManager
-from .discord_notification_channel import DiscordNotificationChannel
+"""
+BATS 핵심 컴포넌트.
+
+대부분의 모듈이 pandas / python-binance 같은 무거운 의존성을 불러오므로,
+패키지 import 시에는 아무것도 불러오지 않고 속성에 처음 접근할 때 해당 모듈만 import 한다 (PEP 562).
+"""
+import importlib
+
+_EXPORTS = {
+    'TurtleSignalManager': '.signal_manager',
+    'AdvancedTurtleManager': '.signal_manager',
+    'ExchangeProvider': '.exchange_provider',
+    'TechnicalAnalysisEngine': '.modules_impl',
+    'RiskManager': '.modules_impl',
+    'BinanceExecutionEngine': '.modules_impl',
+    'NotificationManager': '.notification_manager',
+    'DiscordNotificationChannel': '.discord_notification_channel',
+    'QueuedNotificationChannel': '.queued_notification_channel',
+    'FanOutNotificationChannel': '.fanout_notification_channel',
+    'FileNotificationChannel': '.file_notification_channel',
+    'WebhookNotificationChannel': '.webhook_notification_channel',
+    'IndicatorCheckpoint': '.indicator_checkpoint',
+    'IndicatorCache': '.indicator_cache',
+    'Account': '.account',
+    'AccountSnapshot': '.account',
+    'PanelIndicatorEngine': '.panel_indicators',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
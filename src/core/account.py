@@ -0,0 +1,92 @@
+import threading
+import time
+
+
+class Account:
+    """
+    주문 실행 계정.
+
+    잔고 조회(exchange), 주문(execution), 포지션 상태(persistence/state)와 포트폴리오 heat는
+    계정별로 분리된다. 시세 조회/지표 계산/전략 평가는 MainLoop가 모든 계정에 대해 한 번만 수행한다.
+    """
+
+    def __init__(self, name, exchange, execution, persistence, state=None, primary=False):
+        self.name = name
+        self.exchange = exchange
+        self.execution = execution
+        self.persistence = persistence
+        self.state = state if state is not None else persistence.load()
+        self.primary = primary
+        self.balance = None
+
+    def label(self, symbol):
+        """로그/알림용 심볼 표기. 기본 계정은 심볼만, 추가 계정은 계정 이름을 붙인다."""
+        return symbol if self.primary else f"{symbol}@{self.name}"
+
+
+QUOTE_ASSETS = ("USDT", "FDUSD", "USDC", "BUSD", "BTC", "ETH", "BNB")
+
+
+def split_symbol(symbol):
+    """'BTCUSDT' -> ('BTC', 'USDT'). 알려진 견적 자산으로 끝나지 않으면 (symbol, '')."""
+    for quote in QUOTE_ASSETS:
+        if symbol.endswith(quote) and len(symbol) > len(quote):
+            return symbol[:-len(quote)], quote
+    return symbol, ""
+
+
+class AccountSnapshot:
+    """
+    계좌 잔고 스냅샷.
+
+    - refresh(): client.get_account() 한 번으로 모든 자산의 free/locked 잔고를 갱신한다.
+      트레이딩 루프는 반복마다 한 번만 호출한다 (ExchangeProvider.get_asset_balance).
+    - apply_fill(order): 주문 응답(FULL)의 체결 수량/금액/수수료로 잔고를 로컬에서 갱신한다.
+      따라서 청산 시 잔고를 다시 조회하지 않고 주문 한 번으로 끝낼 수 있다.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.balances = {}
+        self.updated_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.updated_at is not None
+
+    def refresh(self):
+        account = self.client.get_account()
+        balances = {
+            b['asset']: {'free': float(b['free']), 'locked': float(b['locked'])}
+            for b in account.get('balances', [])
+        }
+        with self._lock:
+            self.balances = balances
+            self.updated_at = time.time()
+        return self
+
+    def free(self, asset) -> float:
+        with self._lock:
+            return self.balances.get(asset, {}).get('free', 0.0)
+
+    def _add(self, asset, amount):
+        balance = self.balances.setdefault(asset, {'free': 0.0, 'locked': 0.0})
+        balance['free'] = max(0.0, balance['free'] + amount)
+
+    def apply_fill(self, order):
+        """MARKET 주문 응답으로 base/quote/수수료 자산 잔고를 갱신한다."""
+        if not order or not self.loaded:
+            return
+        base, quote = split_symbol(order['symbol'])
+        executed = float(order.get('executedQty', 0) or 0)
+        quote_qty = float(order.get('cummulativeQuoteQty', 0) or 0)
+        sign = 1 if order.get('side') == 'BUY' else -1
+        with self._lock:
+            self._add(base, sign * executed)
+            if quote:
+                self._add(quote, -sign * quote_qty)
+            for fill in order.get('fills', []):
+                commission = float(fill.get('commission', 0) or 0)
+                if commission and fill.get('commissionAsset'):
+                    self._add(fill['commissionAsset'], -commission)
@@ -2,7 +2,7 @@ import json
 import logging
 from urllib import request, error
 
-from src.core.notification_channel import NotificationChannel
+from src.core.notification_channel import NotificationChannel, NotificationRateLimited
 
 
 class DiscordNotificationChannel(NotificationChannel):
@@ -24,6 +24,9 @@ class DiscordNotificationChannel(NotificationChannel):
 
         Returns:
             bool: 전송 성공 여부 (HTTP 204 시 True)
+
+        Raises:
+            NotificationRateLimited: HTTP 429 응답 시 (retry_after 포함)
         """
         if not self.webhook_url:
             return False
@@ -38,8 +41,27 @@ class DiscordNotificationChannel(NotificationChannel):
             with request.urlopen(req) as response:
                 return response.status == 204
         except error.HTTPError as e:
+            if e.code == 429:
+                raise NotificationRateLimited(self._parse_retry_after(e))
             self.logger.error(f"Discord API Error: {e.code} - {e.read().decode()}")
             return False
         except Exception as e:
             self.logger.error(f"Discord Notification Error: {e}")
             return False
+
+    @staticmethod
+    def _parse_retry_after(http_error) -> float:
+        """429 응답의 JSON body(retry_after) 또는 Retry-After 헤더에서 대기 시간(초)을 읽는다."""
+        try:
+            body = json.loads(http_error.read().decode() or "{}")
+            if "retry_after" in body:
+                return float(body["retry_after"])
+        except Exception:
+            pass
+        try:
+            header = http_error.headers.get("Retry-After") if http_error.headers else None
+            if header is not None:
+                return float(header)
+        except (TypeError, ValueError):
+            pass
+        return 1.0
@@ -1,26 +1,47 @@
 import os
-import pandas as pd
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 from dotenv import load_dotenv
 
+from src.core.account import AccountSnapshot
+from src.utils.single_flight import SingleFlight
+
 class ExchangeProvider:
     """
     Binance API Wrapper for Market Data and Account Info.
+
+    같은 (symbol, interval, limit) 캔들 / 같은 심볼 시세를 동시에 요청하면 하나의 REST 호출을
+    공유한다 (single-flight). 시세는 ticker_ttl 초 동안 재사용한다.
+    잔고는 account(AccountSnapshot)에 보관되어 BinanceExecutionEngine과 공유된다.
     """
-    def __init__(self, testnet=True):
+    def __init__(self, testnet=True, env_prefix="", ticker_ttl=1.0):
+        """
+        env_prefix: 추가 계정용 환경변수 접두사 (예: 'SUB1_' -> SUB1_BINANCE_API_KEY)
+        ticker_ttl: get_realtime_price 결과 재사용 시간(초). 0이면 동시 요청만 합친다.
+        """
         # Prefer .env.local, fallback to .env
         load_dotenv('.env.local')
         load_dotenv() # Fallback
-        api_key = os.getenv('BINANCE_API_KEY')
-        api_secret = os.getenv('BINANCE_API_SECRET')
+        api_key = os.getenv(f'{env_prefix}BINANCE_API_KEY')
+        api_secret = os.getenv(f'{env_prefix}BINANCE_API_SECRET')
         
         self.client = Client(api_key, api_secret, testnet=testnet)
-        
+        self.ticker_ttl = ticker_ttl
+        self._flight = SingleFlight()
+        self.account = AccountSnapshot(self.client)
+
     def get_market_data(self, symbol, interval, limit=100):
         """
         Fetch OHLCV data and return as a pandas DataFrame.
         """
+        df = self._flight.do(('klines', symbol, interval, limit),
+                             lambda: self._fetch_market_data(symbol, interval, limit))
+        # 같은 결과를 받은 호출자끼리 서로의 수정에 영향받지 않도록 복사본을 돌려준다
+        return None if df is None else df.copy()
+
+    def _fetch_market_data(self, symbol, interval, limit):
+        import pandas as pd  # 기동 시 pandas import를 거래소 클라이언트 초기화와 분리
+
         try:
             klines = self.client.get_klines(symbol=symbol, interval=interval, limit=limit)
             df = pd.DataFrame(klines, columns=[
@@ -42,6 +63,10 @@ class ExchangeProvider:
         """
         Fetch the latest price for a symbol.
         """
+        return self._flight.do(('ticker', symbol), lambda: self._fetch_realtime_price(symbol),
+                               ttl=self.ticker_ttl)
+
+    def _fetch_realtime_price(self, symbol):
         try:
             ticker = self.client.get_symbol_ticker(symbol=symbol)
             return float(ticker['price'])
@@ -52,10 +77,11 @@ class ExchangeProvider:
     def get_asset_balance(self, asset):
         """
         Fetch available balance for a specific asset.
+        계좌 스냅샷을 get_account 한 번으로 새로 고친 뒤 asset의 free 잔고를 반환한다.
         """
         try:
-            balance = self.client.get_asset_balance(asset=asset)
-            return float(balance['free']) if balance else 0.0
+            self._flight.do(('account',), self.account.refresh)
+            return self.account.free(asset)
         except BinanceAPIException as e:
             print(f"Error fetching balance for {asset}: {e}")
             return 0.0
@@ -0,0 +1,112 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from src.core.notification_channel import NotificationChannel, send_with_retry
+
+_STOP = object()
+
+
+class _Sink:
+    """FanOut 대상 채널 하나: bounded backlog 큐 + 전용 워커 스레드."""
+
+    def __init__(self, channel, max_backlog, max_retries, logger):
+        self.channel = channel
+        self.name = type(channel).__name__
+        self.max_retries = max_retries
+        self.logger = logger
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max_backlog)
+        self._worker = threading.Thread(target=self._run, name=f"FanOut-{self.name}", daemon=True)
+        self._worker.start()
+
+    @property
+    def backlog(self) -> int:
+        """아직 전송이 끝나지 않은 페이로드 수 (전송 중인 것 포함)."""
+        return self._queue.unfinished_tasks
+
+    def submit(self, payload):
+        """페이로드를 적재하고 Future를 반환한다. backlog가 가득 차면 버리고 None."""
+        future = Future()
+        try:
+            self._queue.put_nowait((payload, future))
+        except queue.Full:
+            self.dropped += 1
+            self.logger.warning(f"{self.name} backlog full, dropping payload (dropped total: {self.dropped})")
+            return None
+        return future
+
+    def close(self, timeout=None):
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            self.logger.warning(f"{self.name} backlog not drained before close ({self.backlog} pending)")
+        self._worker.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                payload, future = item
+                try:
+                    future.set_result(send_with_retry(self.channel, payload, self.max_retries, self.logger))
+                except Exception as e:
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+
+class FanOutNotificationChannel(NotificationChannel):
+    """
+    하나의 페이로드를 여러 NotificationChannel에 동시에 전송하는 채널.
+
+    - 채널마다 전용 워커 스레드와 bounded backlog(max_backlog)를 둔다. backlog가 가득 찬 채널에
+      보낼 페이로드는 버리고 dropped_counts에 센다 (멈춘 채널의 backlog가 무한히 쌓이지 않는다).
+    - send()는 대기 중이던 전송이 없는 채널의 결과만 채널별 timeout까지 기다린다. 이미 밀려 있는
+      채널에는 적재만 하고 기다리지 않으므로, 멈춘 webhook이 이후 알림을 매번 timeout만큼 늦추지 않는다.
+    - 하나 이상의 채널이 성공하면 True를 반환한다.
+    """
+
+    def __init__(self, channels, timeouts=None, default_timeout: float = 5.0, max_retries: int = 5,
+                 max_backlog: int = 100):
+        self.channels = list(channels)
+        timeouts = timeouts or [None] * len(self.channels)
+        self.timeouts = [t if t is not None else default_timeout for t in timeouts]
+        self.max_retries = max_retries
+        self.logger = logging.getLogger("FanOutNotificationChannel")
+        self._sinks = [_Sink(c, max_backlog, max_retries, self.logger) for c in self.channels]
+
+    @property
+    def dropped_counts(self) -> dict:
+        return {sink.name: sink.dropped for sink in self._sinks}
+
+    def send(self, payload: dict) -> bool:
+        submitted_at = time.monotonic()
+        pending = []
+        for sink, timeout in zip(self._sinks, self.timeouts):
+            behind = sink.backlog > 0
+            future = sink.submit(payload)
+            if future is not None and not behind:
+                pending.append((sink, future, timeout))
+            elif future is not None:
+                self.logger.debug(f"{sink.name} is behind ({sink.backlog} pending), not waiting")
+
+        delivered = False
+        for sink, future, timeout in pending:
+            remaining = max(0.0, submitted_at + timeout - time.monotonic())
+            try:
+                delivered = bool(future.result(timeout=remaining)) or delivered
+            except FutureTimeoutError:
+                self.logger.warning(f"{sink.name} did not respond within {timeout}s")
+            except Exception as e:
+                self.logger.error(f"{sink.name} failed: {e}")
+        return delivered
+
+    def close(self, timeout: float = None):
+        for sink in self._sinks:
+            sink.close(timeout)
+            sink.channel.close(timeout)
@@ -0,0 +1,34 @@
+import json
+import os
+import logging
+import threading
+from datetime import datetime, timezone
+
+from src.core.notification_channel import NotificationChannel
+
+
+class FileNotificationChannel(NotificationChannel):
+    """
+    페이로드를 로컬 JSONL 파일에 한 줄씩 추가 기록하는 NotificationChannel 구현체.
+    외부 채널 장애 시에도 알림 이력을 남기기 위한 로컬 싱크로 사용한다.
+    """
+
+    def __init__(self, path: str = "logs/notifications.jsonl"):
+        self.path = path
+        self.logger = logging.getLogger("FileNotificationChannel")
+        self._lock = threading.Lock()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def send(self, payload: dict) -> bool:
+        record = {"time": datetime.now(timezone.utc).isoformat(), "payload": payload}
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        try:
+            with self._lock:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            return True
+        except OSError as e:
+            self.logger.error(f"File Notification Error: {e}")
+            return False
@@ -0,0 +1,133 @@
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from src.core.indicator_checkpoint import OHLCV_COLUMNS, _to_ms
+from src.core.modules_impl import TechnicalAnalysisEngine
+
+
+class IndicatorCache:
+    """
+    TechnicalAnalysisEngine 앞단의 지표 결과 캐시.
+
+    키: (symbol, interval, 첫 봉 시각, 마지막 확정 봉 시각, 봉 수, 지표 집합, seed)
+    - 확정 봉 구간의 지표 결과를 보관한다. 같은 캔들 안의 다음 폴링에서는 형성 중인 봉(마지막 행)만
+      계산해 붙인다: EMA/Wilder 계열은 직전 확정 봉의 seed에서 이어서 계산하고, rolling 지표
+      (Donchian, RSI, 거래량 SMA)는 창 길이만큼의 끝부분만 사용한다. 결과는 전체 재계산과 같다.
+    - 형성 중인 봉의 OHLCV까지 이전 호출과 같으면 마지막으로 계산한 행을 그대로 쓴다.
+    - 새 봉이 확정되면(마지막 확정 봉 시각이 바뀌면) 전체를 다시 계산한다.
+    - max_entries / max_bytes 를 넘으면 가장 오래 사용하지 않은 항목부터 제거한다 (LRU).
+    - 여러 스레드에서 동시에 사용할 수 있다. 반환되는 DataFrame은 호출자 소유의 복사본이다.
+    """
+
+    def __init__(self, ta, max_entries=128, max_bytes=64 * 1024 * 1024):
+        self.ta = ta
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def calculate_indicators(self, data, seed=None, indicators=None, symbol=None, interval=None):
+        """TechnicalAnalysisEngine.calculate_indicators와 같은 인자에 캐시 키용 symbol/interval을 더한 형태."""
+        if (symbol is None or not isinstance(data, pd.DataFrame) or len(data) < 2
+                or 'timestamp' not in data.columns):
+            return self.ta.calculate_indicators(data, seed=seed, indicators=indicators)
+
+        timestamps = _to_ms(data['timestamp'])
+        key = (
+            symbol, interval, int(timestamps[0]), int(timestamps[-2]), len(data),
+            None if indicators is None else frozenset(indicators),
+            None if not seed else tuple(sorted(seed.items())),
+        )
+        forming = (int(timestamps[-1]),) + tuple(float(data[col].iloc[-1]) for col in OHLCV_COLUMNS)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            result = self._from_entry(entry, data, forming)
+            if result is not None:
+                with self._lock:
+                    self.hits += 1
+                return result
+
+        result = self.ta.calculate_indicators(data, seed=seed, indicators=indicators)
+        with self._lock:
+            self.misses += 1
+        self._store(key, forming, result, indicators)
+        return result.copy()
+
+    def _from_entry(self, entry, data, forming):
+        """
+        저장된 확정 봉 결과에 형성 중인 봉 한 행을 계산해 붙인다. 형성 중인 봉이 이전 호출과 같으면
+        마지막으로 계산한 행을 그대로 쓴다. 필요한 seed가 없으면(초기 NaN 구간 등) None.
+        """
+        with entry.lock:
+            if entry.forming != forming:
+                if len(data) <= entry.rows:
+                    return None
+                tail = {col: data[col].to_numpy()[-entry.rows:] for col in ('high', 'low', 'close', 'volume')}
+                values = TechnicalAnalysisEngine.next_row(tail, entry.seed, entry.plan)
+                if values is None:
+                    return None
+                last = data.iloc[-1]
+                entry.block[-1] = [values[col] if col in values else last[col] for col in entry.float_columns]
+                entry.forming = forming
+            block = entry.block.copy()
+
+        df = pd.DataFrame(block, index=data.index, columns=entry.float_columns, copy=False)
+        for position, col in entry.other_columns:
+            df.insert(position, col, data[col].to_numpy(copy=True))
+        return df
+
+    def _store(self, key, forming, result, indicators):
+        entry = _Entry(result, forming, indicators)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+
+class _Entry:
+    """
+    캐시 항목: 지표 결과의 float64 컬럼을 하나의 2차원 배열로 보관한다 (마지막 행 = 형성 중인 봉).
+    그 외 컬럼(timestamp 등 입력 컬럼)은 반환할 때 입력 데이터에서 가져온다.
+    """
+
+    def __init__(self, result, forming, indicators):
+        float_mask = [dtype == 'float64' for dtype in result.dtypes]
+        self.float_columns = [col for col, is_float in zip(result.columns, float_mask) if is_float]
+        self.other_columns = [(i, col) for i, (col, is_float) in enumerate(zip(result.columns, float_mask))
+                              if not is_float]
+        self.block = result[self.float_columns].to_numpy(dtype=float, copy=True)
+        self.forming = forming
+        self.plan = TechnicalAnalysisEngine.resolve(indicators)
+        self.rows = TechnicalAnalysisEngine.window(self.plan)
+        self.seed = TechnicalAnalysisEngine.extract_seed(result, -2)  # 마지막 확정 봉
+        self.size = self.block.nbytes
+        self.lock = threading.Lock()
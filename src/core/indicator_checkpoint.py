@@ -0,0 +1,208 @@
+import json
+import os
+import time
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.core.modules_impl import TechnicalAnalysisEngine
+from src.utils.snapshot_writer import AtomicSnapshotWriter
+
+logger = logging.getLogger("BATS-Indicators")
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+# seed로 이어 계산하는 지표. 전략이 요청하지 않아도 항상 계산해 seed에 포함시킨다
+# (나중에 필요해진 지표가 seed 없이 계산되어 전체 이력 기준 값과 달라지지 않도록).
+SEED_INDICATORS = frozenset(('N', 'ADX', 'ema_200'))
+
+
+def _to_ms(timestamps):
+    """timestamp 컬럼(datetime 또는 epoch ms)을 epoch ms int 배열로 변환한다."""
+    if pd.api.types.is_datetime64_any_dtype(timestamps):
+        return pd.DatetimeIndex(timestamps).as_unit('ms').asi8
+    return np.asarray(timestamps, dtype='int64')
+
+
+def _from_ms(ms, like):
+    """epoch ms 배열을 like(기존 timestamp 컬럼)와 같은 형식으로 되돌린다."""
+    if not pd.api.types.is_datetime64_any_dtype(like):
+        return pd.Series(ms, dtype='int64')
+    tz = getattr(like.dt, 'tz', None)
+    converted = pd.to_datetime(ms, unit='ms', utc=tz is not None)
+    if tz is not None:
+        converted = converted.tz_convert(tz)
+    return pd.Series(converted).astype(like.dtype)
+
+
+class IndicatorCheckpoint:
+    """
+    재시작 간 지표 계산 상태를 이어가기 위한 체크포인트 (warm start).
+
+    심볼/타임프레임별로 최근 history_bars 개의 확정(closed) 봉과, 그 첫 봉 직전 시점의
+    EMA/Wilder 누적값(seed)을 indicator_state.json에 보관한다.
+    - calculate(): 보관된 봉 + 새로 받은 봉을 이어 붙이고 seed부터 지표를 계산한다.
+      따라서 거래소에서 100봉만 받아도 dc_90, ema_200 등이 긴 이력 기준 값과 같다.
+    - 복원 시 겹치는 구간의 OHLCV가 새 데이터와 다르거나 봉 사이에 공백이 있으면
+      해당 심볼의 체크포인트를 버리고 새 데이터만으로 계산한다.
+    - 마지막 봉은 아직 형성 중인 봉으로 보고 저장하지 않는다.
+    - indicators로 일부 지표만 요청해도 SEED_INDICATORS는 함께 계산해 seed가 항상 모든 누적 지표를
+      포함하게 한다. seed가 일부만 포함하면(이전 버전 체크포인트) seed 없이 보관된 이력 전체로 다시 계산한다.
+    - cache(IndicatorCache)가 주어지면 지표 계산을 캐시를 거쳐 수행한다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, ta, filepath="indicator_state.json", history_bars=300,
+                 checkpoint_interval=300, rtol=1e-9, cache=None):
+        self.ta = ta
+        self.cache = cache
+        self.filepath = filepath
+        self.history_bars = history_bars
+        self.checkpoint_interval = checkpoint_interval
+        self.rtol = rtol
+        self._buffers = {}
+        self._writer = AtomicSnapshotWriter(filepath, debounce=0, max_delay=0, fsync_interval=0, indent=None)
+        self._last_checkpoint = time.monotonic()
+        self.load()
+
+    @staticmethod
+    def _key(symbol, interval):
+        return f"{symbol}|{interval}"
+
+    def has(self, symbol, interval) -> bool:
+        return self._key(symbol, interval) in self._buffers
+
+    # ── Persistence ──
+    def load(self):
+        if not os.path.exists(self.filepath):
+            return
+        try:
+            with open(self.filepath, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load indicator checkpoint {self.filepath}: {e}")
+            return
+        if data.get('version') != self.VERSION:
+            logger.warning(f"Ignoring indicator checkpoint with version {data.get('version')}")
+            return
+        self._buffers = data.get('symbols', {})
+        logger.info(f"Indicator checkpoint loaded from {self.filepath}: {len(self._buffers)} series")
+
+    def checkpoint(self, force=False):
+        """checkpoint_interval 초가 지났거나 force이면 백그라운드로 저장한다."""
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < self.checkpoint_interval:
+            return False
+        if not self._buffers:
+            return False
+        self._last_checkpoint = now
+        self._writer.submit({'version': self.VERSION, 'saved_at': time.time(), 'symbols': self._buffers})
+        return True
+
+    def close(self, timeout=None):
+        self.checkpoint(force=True)
+        return self._writer.close(timeout)
+
+    # ── Calculation ──
+    def calculate(self, symbol, interval, df, indicators=None):
+        """보관된 이력과 seed를 이어 붙여 지표를 계산하고 체크포인트를 갱신한다."""
+        if not isinstance(df, pd.DataFrame) or df.empty or 'timestamp' not in df.columns:
+            return self._compute(symbol, interval, df, None, indicators)
+
+        key = self._key(symbol, interval)
+        if indicators is not None:
+            indicators = set(indicators) | SEED_INDICATORS
+        merged, seed = df, None
+        buffer = self._buffers.get(key)
+        if buffer is not None:
+            restored = self._restore(key, buffer, df)
+            if restored is not None:
+                merged, seed = restored
+                if seed and not self._covers(seed):
+                    logger.info(f"[{key}] Checkpoint seed does not cover all seeded indicators, "
+                                f"recomputing from buffered history")
+                    seed = None
+
+        df_analyzed = self._compute(symbol, interval, merged, seed, indicators)
+        self._update(key, interval, df_analyzed, seed)
+        return df_analyzed
+
+    def _compute(self, symbol, interval, df, seed, indicators):
+        if self.cache is not None:
+            return self.cache.calculate_indicators(df, seed=seed, indicators=indicators,
+                                                   symbol=symbol, interval=interval)
+        return self.ta.calculate_indicators(df, seed=seed, indicators=indicators)
+
+    def _restore(self, key, buffer, df):
+        saved_ts = np.asarray(buffer['timestamp'], dtype='int64')
+        fresh_ts = _to_ms(df['timestamp'])
+        if len(saved_ts) == 0:
+            return None
+
+        prefix_len = int(np.searchsorted(saved_ts, fresh_ts[0]))
+        if prefix_len == 0:
+            return None
+
+        overlap = fresh_ts <= saved_ts[-1]
+        if overlap.any():
+            idx = np.searchsorted(saved_ts, fresh_ts[overlap])
+            if not np.array_equal(saved_ts[idx], fresh_ts[overlap]):
+                return self._discard(key, "timestamps do not line up")
+            for col in OHLCV_COLUMNS:
+                saved = np.asarray(buffer[col], dtype=float)[idx]
+                fresh = df[col].to_numpy(dtype=float)[overlap]
+                if not np.allclose(saved, fresh, rtol=self.rtol, atol=0):
+                    return self._discard(key, f"'{col}' differs from fresh data")
+        else:
+            step = np.median(np.diff(fresh_ts)) if len(fresh_ts) > 1 else None
+            if step is None or fresh_ts[0] - saved_ts[-1] > step:
+                return self._discard(key, "gap between checkpoint and fresh data")
+
+        prefix = pd.DataFrame({col: np.asarray(buffer[col][:prefix_len], dtype=float) for col in OHLCV_COLUMNS})
+        prefix.insert(0, 'timestamp', _from_ms(saved_ts[:prefix_len], df['timestamp']))
+        merged = pd.concat([prefix, df], ignore_index=True)
+        return merged, buffer.get('seed')
+
+    @staticmethod
+    def _covers(seed):
+        """seed에 SEED_INDICATORS(및 ADX의 Wilder 중간값) 누적값이 모두 있는지."""
+        needed = {key for node in TechnicalAnalysisEngine.resolve(SEED_INDICATORS)
+                  for key in TechnicalAnalysisEngine.SEEDED.get(node, ())}
+        return needed <= set(seed)
+
+    def _first_seed(self, df_analyzed, position, n_closed):
+        """position 이후 처음으로 seed가 모든 누적 지표를 포함하는 봉과 그 seed.
+
+        seed 없이 계산한 첫 봉들(warm-up)은 ADX 등이 NaN이라 seed에서 빠진다. 그런 봉에서 seed를 잡으면
+        다음 계산에서 _covers에 걸려 매번 seed 없이 다시 계산하게 되므로, 해당 봉들은 버퍼에서 제외한다.
+        """
+        for pos in range(position, n_closed - 1):
+            seed = self.ta.extract_seed(df_analyzed, pos)
+            if self._covers(seed):
+                return pos, seed
+        return position, self.ta.extract_seed(df_analyzed, position)
+
+    def _discard(self, key, reason):
+        logger.warning(f"[{key}] Indicator checkpoint discarded: {reason}")
+        self._buffers.pop(key, None)
+        return None
+
+    def _update(self, key, interval, df_analyzed, seed):
+        n_closed = len(df_analyzed) - 1
+        if n_closed <= 0:
+            return
+        start = max(0, n_closed - self.history_bars)
+        if start > 0:
+            position, seed = self._first_seed(df_analyzed, start - 1, n_closed)
+            start = position + 1
+
+        closed = df_analyzed.iloc[start:n_closed]
+        buffer = {
+            'interval': interval,
+            'timestamp': _to_ms(closed['timestamp']).tolist(),
+            'seed': seed,
+        }
+        for col in OHLCV_COLUMNS:
+            buffer[col] = closed[col].astype(float).tolist()
+        self._buffers[key] = buffer
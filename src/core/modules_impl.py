@@ -1,8 +1,152 @@
 import pandas as pd
 import numpy as np
 
+from src.core.account import split_symbol
+
+# 이전 구간의 지수이동평균 누적값(seed)으로 이어서 계산할 수 있는 지표들.
+# prev_* 는 첫 행의 True Range / DM 계산에 필요한 직전 봉 값이다.
+SEED_KEYS = ('N', 'smooth_tr', 'smooth_dm_plus', 'smooth_dm_minus', 'ADX', 'ema_200',
+             'prev_high', 'prev_low', 'prev_close')
+
+
+def _ewm_mean(series, seed=None, **ewm_kwargs):
+    """adjust=False EWM. seed가 주어지면 직전 봉의 누적값에서 이어서 계산한다."""
+    if seed is None:
+        return series.ewm(adjust=False, **ewm_kwargs).mean()
+    extended = pd.concat([pd.Series([seed], dtype=float), series.astype(float)], ignore_index=True)
+    result = extended.ewm(adjust=False, **ewm_kwargs).mean().iloc[1:]
+    result.index = series.index
+    return result
+
+
 class TechnicalAnalysisEngine:
-    def calculate_indicators(self, data) -> pd.DataFrame:
+    # 지표 의존성 그래프: 노드 -> (선행 노드, 계산 메서드, 인자).
+    # '_'로 시작하는 노드는 다른 지표의 중간값이다. 선행 노드는 항상 먼저 정의되어야 한다.
+    GRAPH = {
+        '_tr': ((), '_calc_true_range', {}),
+        'N': (('_tr',), '_calc_n', {}),
+        '_dm': (('_tr',), '_calc_directional_movement', {}),
+        'ADX': (('_dm',), '_calc_adx', {}),
+        'dc_90_high': ((), '_calc_donchian', {'column': 'high', 'period': 90}),
+        'dc_55_high': ((), '_calc_donchian', {'column': 'high', 'period': 55}),
+        'dc_20_high': ((), '_calc_donchian', {'column': 'high', 'period': 20}),
+        'dc_45_low': ((), '_calc_donchian', {'column': 'low', 'period': 45}),
+        'dc_20_low': ((), '_calc_donchian', {'column': 'low', 'period': 20}),
+        'dc_10_low': ((), '_calc_donchian', {'column': 'low', 'period': 10}),
+        'ema_200': ((), '_calc_ema', {'span': 200}),
+        'rsi_14': ((), '_calc_rsi', {'period': 14}),
+        'vol_sma_20': ((), '_calc_volume_sma', {'period': 20}),
+    }
+    # calculate_indicators(indicators=...)로 선택 계산할 수 있는 지표 목록
+    INDICATORS = tuple(name for name in GRAPH if not name.startswith('_'))
+    # seed로 이어서 계산하는 노드 -> 필요한 seed 키 (prev_* 제외)
+    SEEDED = {'N': ('N',), '_dm': ('smooth_tr', 'smooth_dm_plus', 'smooth_dm_minus'),
+              'ADX': ('ADX',), 'ema_200': ('ema_200',)}
+
+    @classmethod
+    def resolve(cls, indicators=None) -> list:
+        """요청한 지표와 그 선행 노드를 계산 순서대로 반환한다. None이면 전체."""
+        if indicators is None:
+            return list(cls.GRAPH)
+        unknown = set(indicators) - set(cls.INDICATORS)
+        if unknown:
+            raise ValueError(f"Unknown indicators: {sorted(unknown)}")
+
+        needed = set()
+        pending = list(indicators)
+        while pending:
+            node = pending.pop()
+            if node not in needed:
+                needed.add(node)
+                pending.extend(cls.GRAPH[node][0])
+        return [node for node in cls.GRAPH if node in needed]
+
+    @classmethod
+    def window(cls, plan) -> int:
+        """
+        직전 봉의 seed가 있을 때 plan의 마지막 행을 계산하는 데 필요한 끝부분 행 수.
+        EMA/Wilder 계열은 seed만으로 충분하고(1행), rolling 지표는 창 길이만큼 필요하다.
+        """
+        rows = 1
+        for node in plan:
+            _, method, kwargs = cls.GRAPH[node]
+            if method in ('_calc_donchian', '_calc_rsi'):
+                rows = max(rows, kwargs['period'] + 1)  # shift(1) / diff() 때문에 한 행 더
+            elif method == '_calc_volume_sma':
+                rows = max(rows, kwargs['period'])
+        return rows
+
+    @classmethod
+    def next_row(cls, tail, seed, plan):
+        """
+        calculate_indicators 결과의 마지막 행만 스칼라 연산으로 계산한다 (형성 중인 봉 갱신용).
+        tail: 마지막 window(plan) 개 봉의 'high'/'low'/'close'/'volume' 배열 (마지막 원소가 대상 봉)
+        seed: 직전 봉 기준 extract_seed() 값
+        반환: {컬럼: 값}. seed가 부족하거나 값이 정의되지 않으면 None (전체 재계산 필요).
+        """
+        if any(k not in seed for node in plan for k in cls.SEEDED.get(node, ())):
+            return None
+
+        def ewm(prev, value, alpha):
+            # pandas ewm(adjust=False) 한 단계와 같은 식
+            return ((1 - alpha) * prev + alpha * value) / ((1 - alpha) + alpha)
+
+        high, low, close = float(tail['high'][-1]), float(tail['low'][-1]), float(tail['close'][-1])
+        row = {}
+        for node in plan:
+            _, method, kwargs = cls.GRAPH[node]
+            if node == '_tr':
+                row['h_l'] = high - low
+                row['h_pc'] = abs(high - seed['prev_close'])
+                row['l_pc'] = abs(low - seed['prev_close'])
+                row['tr'] = max(row['h_l'], row['h_pc'], row['l_pc'])
+            elif node == 'N':
+                row['N'] = ewm(seed['N'], row['tr'], 2 / 21)
+            elif node == '_dm':
+                up_move, down_move = high - seed['prev_high'], seed['prev_low'] - low
+                dm_plus = up_move if up_move > down_move and up_move > 0 else 0.0
+                dm_minus = down_move if down_move > up_move and down_move > 0 else 0.0
+                row['smooth_tr'] = ewm(seed['smooth_tr'], row['tr'], 1 / 14)
+                row['smooth_dm_plus'] = ewm(seed['smooth_dm_plus'], dm_plus, 1 / 14)
+                row['smooth_dm_minus'] = ewm(seed['smooth_dm_minus'], dm_minus, 1 / 14)
+            elif node == 'ADX':
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    di_plus = 100 * np.float64(row['smooth_dm_plus']) / row['smooth_tr']
+                    di_minus = 100 * np.float64(row['smooth_dm_minus']) / row['smooth_tr']
+                    dx = 100 * abs(di_plus - di_minus) / (di_plus + di_minus)
+                if not np.isfinite(dx):
+                    return None
+                row['ADX'] = ewm(seed['ADX'], float(dx), 1 / 14)
+            elif method == '_calc_donchian':
+                window = np.asarray(tail[kwargs['column']][-kwargs['period'] - 1:-1], dtype=float)
+                if len(window) < kwargs['period']:
+                    row[node] = np.nan
+                else:
+                    row[node] = float(window.max() if kwargs['column'] == 'high' else window.min())
+            elif method == '_calc_ema':
+                row[node] = ewm(seed[node], close, 2 / (kwargs['span'] + 1))
+            elif method == '_calc_rsi':
+                delta = np.diff(np.asarray(tail['close'][-kwargs['period'] - 1:], dtype=float))
+                if len(delta) < kwargs['period']:
+                    row[node] = np.nan
+                    continue
+                gain, loss = np.where(delta > 0, delta, 0).mean(), np.where(delta < 0, -delta, 0).mean()
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    row[node] = float(100 - (100 / (1 + np.float64(gain) / loss)))
+            elif method == '_calc_volume_sma':
+                volume = np.asarray(tail['volume'][-kwargs['period']:], dtype=float)
+                row[node] = float(volume.mean()) if len(volume) == kwargs['period'] else np.nan
+        return row
+
+    def calculate_indicators(self, data, seed=None, indicators=None) -> pd.DataFrame:
+        """
+        seed: extract_seed()로 얻은 직전 봉 기준 누적값. 주어지면 EMA/Wilder 계열 지표를
+              과거 전체 이력으로 계산한 것과 동일하게 이어서 계산한다 (warm start).
+        indicators: 계산할 지표 이름 집합 (INDICATORS 중). 요청한 지표와 그 의존 노드만 계산하며,
+                    None이면 전체를 계산한다.
+        """
+        plan = self.resolve(indicators)
+
         if data is None:
             return pd.DataFrame()
             
@@ -13,59 +157,81 @@ class TechnicalAnalysisEngine:
 
         if df.empty:
             return df
-        
-        # 1. True Range & N (ATR 20)
+        seed = seed or {}
+
+        for node in plan:
+            _, method, kwargs = self.GRAPH[node]
+            getattr(self, method)(df, seed, **kwargs)
+        return df
+
+    @staticmethod
+    def _previous(df, seed, column):
+        # 첫 행의 직전 봉 값은 seed에서 가져온다 (warm start). 없으면 NaN.
+        prev = df[column].shift(1)
+        if f'prev_{column}' in seed:
+            prev.iloc[0] = seed[f'prev_{column}']
+        return prev
+
+    def _calc_true_range(self, df, seed):
+        prev_close = self._previous(df, seed, 'close')
         df['h_l'] = df['high'] - df['low']
-        df['h_pc'] = abs(df['high'] - df['close'].shift(1))
-        df['l_pc'] = abs(df['low'] - df['close'].shift(1))
+        df['h_pc'] = abs(df['high'] - prev_close)
+        df['l_pc'] = abs(df['low'] - prev_close)
         df['tr'] = df[['h_l', 'h_pc', 'l_pc']].max(axis=1)
-        df['N'] = df['tr'].ewm(span=20, adjust=False).mean()
-        
-        # 2. ADX-14 (Required by SignalManager)
-        high = df['high']
-        low = df['low']
-        tr = df['tr']
-        up_move = high.diff()
-        down_move = low.shift(1) - low
+
+    def _calc_n(self, df, seed):
+        # N (ATR 20)
+        df['N'] = _ewm_mean(df['tr'], seed.get('N'), span=20)
+
+    def _calc_directional_movement(self, df, seed):
+        up_move = df['high'] - self._previous(df, seed, 'high')
+        down_move = self._previous(df, seed, 'low') - df['low']
         
         dm_plus = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
         dm_minus = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
-        
-        def wilders_smoothing(series, period):
-            return series.ewm(alpha=1/period, adjust=False).mean()
 
-        smooth_tr = wilders_smoothing(tr, 14)
-        smooth_dm_plus = wilders_smoothing(pd.Series(dm_plus), 14)
-        smooth_dm_minus = wilders_smoothing(pd.Series(dm_minus), 14)
-        
-        di_plus = 100 * (smooth_dm_plus / smooth_tr)
-        di_minus = 100 * (smooth_dm_minus / smooth_tr)
+        # Wilder's smoothing (period 14)
+        df['smooth_tr'] = _ewm_mean(df['tr'], seed.get('smooth_tr'), alpha=1/14)
+        df['smooth_dm_plus'] = _ewm_mean(pd.Series(dm_plus, index=df.index), seed.get('smooth_dm_plus'), alpha=1/14)
+        df['smooth_dm_minus'] = _ewm_mean(pd.Series(dm_minus, index=df.index), seed.get('smooth_dm_minus'), alpha=1/14)
+
+    def _calc_adx(self, df, seed):
+        # ADX-14 (Regime Filter)
+        di_plus = 100 * (df['smooth_dm_plus'] / df['smooth_tr'])
+        di_minus = 100 * (df['smooth_dm_minus'] / df['smooth_tr'])
         dx = 100 * (di_plus - di_minus).abs() / (di_plus + di_minus)
-        df['ADX'] = wilders_smoothing(dx, 14)
+        df['ADX'] = _ewm_mean(dx, seed.get('ADX'), alpha=1/14)
 
-        # 3. Donchian Channels
-        df['dc_90_high'] = df['high'].shift(1).rolling(window=90).max()
-        df['dc_55_high'] = df['high'].shift(1).rolling(window=55).max()
-        df['dc_20_high'] = df['high'].shift(1).rolling(window=20).max()
-        
-        df['dc_45_low'] = df['low'].shift(1).rolling(window=45).min()
-        df['dc_20_low'] = df['low'].shift(1).rolling(window=20).min()
-        df['dc_10_low'] = df['low'].shift(1).rolling(window=10).min()
-        
-        # 4. Trend Filter (EMA 200)
-        df['ema_200'] = df['close'].ewm(span=200, adjust=False).mean()
+    def _calc_donchian(self, df, seed, column, period):
+        # Donchian Channel: 현재 봉을 제외한 직전 period 개 봉의 최고가/최저가
+        window = df[column].shift(1).rolling(window=period)
+        if column == 'high':
+            df[f'dc_{period}_high'] = window.max()
+        else:
+            df[f'dc_{period}_low'] = window.min()
+
+    def _calc_ema(self, df, seed, span):
+        # Trend Filter
+        df[f'ema_{span}'] = _ewm_mean(df['close'], seed.get(f'ema_{span}'), span=span)
 
-        # 5. RSI(14)
+    def _calc_rsi(self, df, seed, period):
         delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
         rs = gain / loss
-        df['rsi_14'] = 100 - (100 / (1 + rs))
+        df[f'rsi_{period}'] = 100 - (100 / (1 + rs))
 
-        # 6. Volume Filter (SMA 20)
-        df['vol_sma_20'] = df['volume'].rolling(window=20).mean()
-        
-        return df
+    def _calc_volume_sma(self, df, seed, period):
+        # Volume Filter
+        df[f'vol_sma_{period}'] = df['volume'].rolling(window=period).mean()
+
+    @staticmethod
+    def extract_seed(df_analyzed, position=-1) -> dict:
+        """position 번째 봉의 누적값을 seed로 반환한다. 그 다음 봉부터 이어서 계산할 때 사용."""
+        row = df_analyzed.iloc[position]
+        seed = {key: float(row[key]) for key in SEED_KEYS[:6] if key in row.index and pd.notna(row[key])}
+        seed.update(prev_high=float(row['high']), prev_low=float(row['low']), prev_close=float(row['close']))
+        return seed
 
 class RiskManager:
     def calculate_unit_size(self, balance: float, n_value: float, price: float, n_avg_20=None) -> float:
@@ -93,31 +259,62 @@ class RiskManager:
         return (current_heat + new_unit_risk) <= max_heat
 
 class BinanceExecutionEngine:
-    def __init__(self, client):
+    def __init__(self, client, account=None):
+        """
+        account: ExchangeProvider.account(AccountSnapshot). 주어지면 수량 0 청산 시 잔고를
+        다시 조회하지 않고 스냅샷에서 읽으며, 체결 응답으로 스냅샷을 갱신한다.
+        """
         self.client = client
+        self.account = account
+
+    def _sell_quantity(self, symbol):
+        if self.account is not None:
+            if not self.account.loaded:
+                self.account.refresh()
+            return self.account.free(split_symbol(symbol)[0])
+        base_asset = symbol.replace("USDT", "")
+        balance = self.client.get_asset_balance(asset=base_asset)
+        return float(balance['free'])
+
+    def _market_order(self, symbol, side, quantity):
+        order = self.client.create_order(
+            symbol=symbol,
+            side=side,
+            type='MARKET',
+            quantity=quantity
+        )
+        if self.account is not None:
+            self.account.apply_fill(order)
+        return order
 
     def execute_order(self, symbol: str, side: str, quantity: float):
         try:
             if side == "BUY":
-                order = self.client.create_order(
-                    symbol=symbol,
-                    side='BUY',
-                    type='MARKET',
-                    quantity=quantity
-                )
+                self._market_order(symbol, 'BUY', quantity)
             elif side == "SELL":
                 if quantity == 0:
-                    base_asset = symbol.replace("USDT", "")
-                    balance = self.client.get_asset_balance(asset=base_asset)
-                    quantity = float(balance['free'])
-                
-                if quantity > 0:
-                    order = self.client.create_order(
-                        symbol=symbol,
-                        side='SELL',
-                        type='MARKET',
-                        quantity=quantity
-                    )
+                    quantity = self._sell_quantity(symbol)
+                    if quantity <= 0 and self.account is not None:
+                        # 스냅샷의 0 잔고가 오래된 값일 수 있다 -> 새로 조회해 다시 확인
+                        self.account.refresh()
+                        quantity = self.account.free(split_symbol(symbol)[0])
+                        if quantity <= 0:
+                            print(f"Exit skipped: no free {split_symbol(symbol)[0]} balance to sell")
+                            return False
+                    if quantity > 0:
+                        try:
+                            self._market_order(symbol, 'SELL', quantity)
+                        except Exception as e:
+                            if self.account is None:
+                                raise
+                            # 스냅샷이 실제 잔고와 어긋났을 수 있다 -> 한 번만 새로 조회해 재시도
+                            print(f"Exit with cached balance failed ({e}), retrying with fresh balance")
+                            self.account.refresh()
+                            quantity = self.account.free(split_symbol(symbol)[0])
+                            if quantity > 0:
+                                self._market_order(symbol, 'SELL', quantity)
+                elif quantity > 0:
+                    self._market_order(symbol, 'SELL', quantity)
             return True
         except Exception as e:
             print(f"Order Execution Failed: {e}")
@@ -1,6 +1,16 @@
+import logging
+import time
 from abc import ABC, abstractmethod
 
 
+class NotificationRateLimited(Exception):
+    """채널이 rate limit(HTTP 429)에 걸렸을 때 발생. retry_after 초 후 재시도해야 한다."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limited, retry after {retry_after:.2f}s")
+        self.retry_after = retry_after
+
+
 class NotificationChannel(ABC):
     """
     Abstract base class for notification channels.
@@ -18,3 +28,25 @@ class NotificationChannel(ABC):
             bool: 전송 성공 여부
         """
         pass
+
+    def close(self, timeout: float = None):
+        """채널이 보유한 리소스(워커 스레드 등)를 정리한다. 기본 구현은 아무것도 하지 않는다."""
+        pass
+
+
+def send_with_retry(channel: NotificationChannel, payload: dict, max_retries: int = 5, logger=None) -> bool:
+    """NotificationRateLimited 발생 시 retry_after 만큼 대기하며 최대 max_retries 회 재전송한다."""
+    logger = logger or logging.getLogger("NotificationChannel")
+    for attempt in range(max_retries + 1):
+        try:
+            return channel.send(payload)
+        except NotificationRateLimited as e:
+            if attempt == max_retries:
+                break
+            logger.warning(f"Notification rate limited, retrying in {e.retry_after:.2f}s")
+            time.sleep(e.retry_after)
+        except Exception as e:
+            logger.error(f"Notification Error: {e}")
+            return False
+    logger.error("Notification dropped after exhausting rate limit retries.")
+    return False
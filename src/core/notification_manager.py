@@ -24,6 +24,15 @@ class NotificationManager:
             self.logger.error(f"Notification Error: {e}")
             return False
 
+    def close(self, timeout=5.0):
+        """채널에 남은 알림을 전송하고 리소스를 정리한다 (종료 시 호출)."""
+        if not self.channel:
+            return
+        try:
+            self.channel.close(timeout)
+        except Exception as e:
+            self.logger.error(f"Notification channel close error: {e}")
+
     def send_trade(self, side, symbol, price, quantity, status="SUCCESS"):
         """매매 체결 알림 (Embed 형식)"""
         color = 0x00ff00 if side.upper() == "BUY" else 0xff0000
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from src.core.modules_impl import TechnicalAnalysisEngine
+from src.utils.kline_store import KLINE_COLUMNS
+
+
+class PanelIndicatorEngine:
+    """
+    여러 심볼의 지표를 (봉 x 심볼) 패널 단위로 한 번에 계산한다.
+
+    TechnicalAnalysisEngine과 같은 식(EMA/Wilder adjust=False, 직전 봉 기준 Donchian)을 쓰되
+    심볼마다 DataFrame을 만들지 않고 필드별 2차원 배열에 대해 pandas/numpy 연산을 한 번씩 수행한다.
+    상장 시점이 달라 앞부분이 비어 있는(NaN) 심볼도 심볼별 계산과 같은 값을 낸다.
+    """
+
+    SUPPORTED = ('N', 'ADX', 'ema_200') + tuple(
+        name for name, (_, method, _) in TechnicalAnalysisEngine.GRAPH.items() if method == '_calc_donchian')
+
+    @staticmethod
+    def build_panel(columns_by_symbol):
+        """{symbol: 컬럼 dict} -> {필드: DataFrame(index=timestamp ms, columns=symbol)}."""
+        panel = {}
+        for field in KLINE_COLUMNS[1:]:
+            panel[field] = pd.DataFrame({
+                symbol: pd.Series(columns[field], index=columns['timestamp'])
+                for symbol, columns in columns_by_symbol.items() if len(columns['timestamp'])
+            }).sort_index()
+        return panel
+
+    def calculate(self, panel, indicators=('N', 'ADX', 'ema_200', 'dc_90_high')):
+        unknown = set(indicators) - set(self.SUPPORTED)
+        if unknown:
+            raise ValueError(f"Unsupported panel indicators: {sorted(unknown)}")
+        high, low, close = panel['high'], panel['low'], panel['close']
+        out = {}
+
+        if {'N', 'ADX'} & set(indicators):
+            prev_close = close.shift(1)
+            tr = np.fmax(high - low, np.fmax((high - prev_close).abs(), (low - prev_close).abs()))
+            if 'N' in indicators:
+                out['N'] = tr.ewm(span=20, adjust=False).mean()
+            if 'ADX' in indicators:
+                out['ADX'] = self._adx(high, low, tr)
+
+        for name in indicators:
+            if name.startswith('dc_'):
+                _, _, kwargs = TechnicalAnalysisEngine.GRAPH[name]
+                window = panel[kwargs['column']].shift(1).rolling(window=kwargs['period'])
+                out[name] = window.max() if kwargs['column'] == 'high' else window.min()
+        if 'ema_200' in indicators:
+            out['ema_200'] = close.ewm(span=200, adjust=False).mean()
+        return out
+
+    @staticmethod
+    def _adx(high, low, tr):
+        up_move = high - high.shift(1)
+        down_move = low.shift(1) - low
+        present = high.notna()
+        # 아직 상장 전인 구간은 0이 아닌 NaN으로 두어야 EWM 시작점이 심볼별 계산과 같아진다
+        dm_plus = up_move.where((up_move > down_move) & (up_move > 0), 0.0).where(present)
+        dm_minus = down_move.where((down_move > up_move) & (down_move > 0), 0.0).where(present)
+
+        smooth_tr = tr.ewm(alpha=1 / 14, adjust=False).mean()
+        di_plus = 100 * dm_plus.ewm(alpha=1 / 14, adjust=False).mean() / smooth_tr
+        di_minus = 100 * dm_minus.ewm(alpha=1 / 14, adjust=False).mean() / smooth_tr
+        dx = 100 * (di_plus - di_minus).abs() / (di_plus + di_minus)
+        return dx.ewm(alpha=1 / 14, adjust=False).mean()
@@ -0,0 +1,131 @@
+import logging
+import queue
+import threading
+import time
+
+from src.core.notification_channel import NotificationChannel, send_with_retry
+
+# Discord Webhook은 메시지당 최대 10개의 Embed를 허용한다.
+MAX_EMBEDS_PER_MESSAGE = 10
+
+_STOP = object()
+
+
+class QueuedNotificationChannel(NotificationChannel):
+    """
+    다른 NotificationChannel을 감싸 백그라운드 워커 스레드에서 전송하는 채널.
+
+    - send()는 bounded queue에 페이로드를 적재만 하고 즉시 반환한다 (트레이딩 루프 비블로킹).
+    - 워커는 coalesce_window 동안 모인 페이로드의 Embed를 최대 10개씩 묶어 한 메시지로 전송한다.
+    - 채널이 NotificationRateLimited(429)를 던지면 retry_after 만큼 대기 후 같은 메시지를 재전송한다.
+    """
+
+    def __init__(self, channel: NotificationChannel, max_queue_size: int = 1000,
+                 coalesce_window: float = 0.5, max_retries: int = 5):
+        self.channel = channel
+        self.coalesce_window = coalesce_window
+        self.max_retries = max_retries
+        self.logger = logging.getLogger("QueuedNotificationChannel")
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._pending = 0
+        self._pending_cond = threading.Condition()
+        self._dropped = 0
+        self._worker = threading.Thread(target=self._run, name="NotificationWorker", daemon=True)
+        self._worker.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped
+
+    def send(self, payload: dict) -> bool:
+        """페이로드를 큐에 적재한다. 큐가 가득 차면 버리고 False를 반환한다."""
+        with self._pending_cond:
+            self._pending += 1
+        try:
+            self._queue.put_nowait(payload)
+            return True
+        except queue.Full:
+            self._mark_done(1)
+            self._dropped += 1
+            self.logger.warning(f"Notification queue full, dropping payload (dropped total: {self._dropped})")
+            return False
+
+    def flush(self, timeout: float = None) -> bool:
+        """큐에 적재된 모든 페이로드가 처리될 때까지 대기한다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._pending_cond:
+            while self._pending > 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._pending_cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = None):
+        """남은 알림을 모두 전송한 뒤 워커를 종료한다."""
+        if not self._worker.is_alive():
+            return
+        if not self.flush(timeout):
+            self.logger.warning(f"Notification queue not drained before close ({self._pending} pending).")
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+        self.channel.close(timeout)
+
+    def _mark_done(self, count: int):
+        with self._pending_cond:
+            self._pending -= count
+            if self._pending <= 0:
+                self._pending_cond.notify_all()
+
+    # ── Worker ──
+    def _run(self):
+        carry = None
+        while True:
+            item = carry if carry is not None else self._queue.get()
+            carry = None
+            if item is _STOP:
+                return
+
+            batch = [item]
+            stop_after = False
+            if self._is_mergeable(item):
+                embed_count = len(item["embeds"])
+                deadline = time.monotonic() + self.coalesce_window
+                while embed_count < MAX_EMBEDS_PER_MESSAGE:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        nxt = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is _STOP:
+                        stop_after = True
+                        break
+                    if not self._is_mergeable(nxt) or embed_count + len(nxt["embeds"]) > MAX_EMBEDS_PER_MESSAGE:
+                        carry = nxt
+                        break
+                    batch.append(nxt)
+                    embed_count += len(nxt["embeds"])
+
+            if len(batch) == 1:
+                message = batch[0]
+            else:
+                message = {"embeds": [embed for p in batch for embed in p["embeds"]]}
+            self._deliver(message)
+            self._mark_done(len(batch))
+
+            if stop_after:
+                return
+
+    @staticmethod
+    def _is_mergeable(payload) -> bool:
+        """Embed만으로 구성된 페이로드만 다른 페이로드와 합칠 수 있다."""
+        return (isinstance(payload, dict) and set(payload.keys()) == {"embeds"}
+                and 0 < len(payload["embeds"]) <= MAX_EMBEDS_PER_MESSAGE)
+
+    def _deliver(self, message) -> bool:
+        return send_with_retry(self.channel, message, self.max_retries, self.logger)
@@ -10,6 +10,13 @@ class TurtleSignalManager:
     - Trend Filter: Price > 200 EMA
     - Regime Filter: ADX > 25 (Improved)
     """
+    # 시스템별 (진입 돌파 채널, 청산 트레일링 채널)
+    SYSTEM_CHANNELS = {
+        'S1': ('dc_20_high', 'dc_10_low'),
+        'S2': ('dc_55_high', 'dc_20_low'),
+        'S3': ('dc_90_high', 'dc_45_low'),
+    }
+
     def __init__(self, use_s1=False, use_s2=False, use_s3=True, 
                  adx_filter_threshold=25.0, stop_n_multiplier=5.0):
         self.use_s1 = use_s1
@@ -18,6 +25,62 @@ class TurtleSignalManager:
         self.adx_filter_threshold = adx_filter_threshold
         self.stop_n_multiplier = stop_n_multiplier
 
+    @property
+    def required_indicators(self):
+        """활성화된 시스템(use_s1/s2/s3)에 필요한 지표만 요구한다."""
+        needed = {'N', 'ADX', 'ema_200'}
+        for system, enabled in (('S1', self.use_s1), ('S2', self.use_s2), ('S3', self.use_s3)):
+            if enabled:
+                needed.update(self.SYSTEM_CHANNELS[system])
+        return frozenset(needed)
+
+    def indicators_for(self, state):
+        """보유 포지션이 있으면 그 포지션 시스템의 청산 채널도 포함한다 (설정 변경 전 진입한 포지션 대비)."""
+        needed = set(self.required_indicators)
+        if state.get('units_held', 0) > 0:
+            needed.add(self.SYSTEM_CHANNELS.get(state.get('system_mode', 'S3'), self.SYSTEM_CHANNELS['S1'])[1])
+        return needed
+
+    def stop_level(self, entry_price, n_value):
+        """하드 스톱 가격: 마지막 진입가 - stop_n_multiplier * N."""
+        return entry_price - (self.stop_n_multiplier * n_value)
+
+    def skip_rule_applied(self, state):
+        """S1 Skip Rule이 적용 중인지 (S1 사용 중이고 직전 매매가 수익)."""
+        return bool(self.use_s1 and state.get('last_trade_result') == 'win')
+
+    def exit_trigger(self, current_price, state):
+        """EXIT 신호의 원인 (일지 기록용). 하드 스톱이면 'hard_stop_5n' 형식, 아니면 트레일링 채널 이탈."""
+        entry_prices = state.get('entry_prices', [])
+        current_n = state.get('current_n', 0)
+        if entry_prices and current_n > 0 and current_price < self.stop_level(entry_prices[-1], current_n):
+            return f"hard_stop_{self.stop_n_multiplier:g}n"
+        exit_channel = self.SYSTEM_CHANNELS.get(state.get('system_mode', 'S3'), self.SYSTEM_CHANNELS['S1'])[1]
+        return f"trailing_stop ({exit_channel})"
+
+    def trigger_levels(self, row, state):
+        """
+        리포트/모니터링용 가격 수준. row: 마지막 봉 지표 dict.
+        무포지션이면 활성 시스템별 진입 돌파선, 보유 중이면 트레일링/하드 스톱과 다음 피라미딩 가격.
+        """
+        levels = {}
+        units_held = state.get('units_held', 0)
+        if units_held > 0:
+            exit_channel = self.SYSTEM_CHANNELS.get(state.get('system_mode', 'S3'), self.SYSTEM_CHANNELS['S1'])[1]
+            levels['trailing_stop'] = row.get(exit_channel)
+            entry_prices = state.get('entry_prices', [])
+            current_n = state.get('current_n', 0)
+            if entry_prices and current_n > 0:
+                levels['hard_stop'] = self.stop_level(entry_prices[-1], current_n)
+                if units_held < 4:
+                    levels['pyramid'] = entry_prices[-1] + 0.5 * current_n
+            return levels
+
+        for system, enabled in (('S1', self.use_s1), ('S2', self.use_s2), ('S3', self.use_s3)):
+            if enabled:
+                levels[f'{system.lower()}_entry'] = row.get(self.SYSTEM_CHANNELS[system][0])
+        return levels
+
     def generate_signal(self, df, current_price, state):
         units_held = state.get('units_held', 0)
         system_mode = state.get('system_mode', 'S3')
@@ -36,7 +99,7 @@ class TurtleSignalManager:
             # 1a. Hard Stop: last entry - 5N (Improved priority)
             if entry_prices and current_n > 0:
                 last_entry = entry_prices[-1]
-                hard_stop = last_entry - (self.stop_n_multiplier * current_n)
+                hard_stop = self.stop_level(last_entry, current_n)
                 if current_price < hard_stop:
                     return "EXIT"
 
@@ -106,6 +169,13 @@ class AdvancedTurtleManager(TurtleSignalManager):
         self.rsi_threshold = rsi_threshold
         self.volume_filter = volume_filter
 
+    @property
+    def required_indicators(self):
+        needed = set(super().required_indicators) | {'rsi_14'}
+        if self.volume_filter:
+            needed.add('vol_sma_20')
+        return frozenset(needed)
+
     def generate_signal(self, df, current_price, state):
         # 1. Exit Logic (Inherit)
         units_held = state.get('units_held', 0)
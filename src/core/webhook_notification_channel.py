@@ -0,0 +1,40 @@
+import json
+import logging
+from urllib import request, error
+
+from src.core.notification_channel import NotificationChannel, NotificationRateLimited
+
+
+class WebhookNotificationChannel(NotificationChannel):
+    """
+    임의의 HTTP 엔드포인트로 페이로드를 JSON POST 하는 범용 Webhook 채널.
+    2xx 응답을 성공으로 간주한다.
+    """
+
+    def __init__(self, url: str = None, timeout: float = 10.0, headers: dict = None):
+        self.url = url
+        self.timeout = timeout
+        self.headers = {'Content-Type': 'application/json', 'User-Agent': 'BATS-Notifier/1.0'}
+        self.headers.update(headers or {})
+        self.logger = logging.getLogger("WebhookNotificationChannel")
+        if not self.url:
+            self.logger.warning("Webhook url is not set. Webhook notifications will be disabled.")
+
+    def send(self, payload: dict) -> bool:
+        if not self.url:
+            return False
+
+        try:
+            data = json.dumps(payload).encode('utf-8')
+            req = request.Request(self.url, data=data, headers=self.headers)
+            with request.urlopen(req, timeout=self.timeout) as response:
+                return 200 <= response.status < 300
+        except error.HTTPError as e:
+            if e.code == 429:
+                retry_after = e.headers.get("Retry-After") if e.headers else None
+                raise NotificationRateLimited(float(retry_after) if retry_after else 1.0)
+            self.logger.error(f"Webhook Error: {e.code}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Webhook Notification Error: {e}")
+            return False
@@ -1,16 +1,18 @@
 import os
 import sys
+import time
 import logging
-import yaml
+
+_STARTED_AT = time.perf_counter()
 
 # Ensure the project root is in sys.path for direct execution
 root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
-from src.utils import load_config
-from src.main_loop import MainLoop
-from src.core import ExchangeProvider, BinanceExecutionEngine, TechnicalAnalysisEngine, RiskManager, TurtleSignalManager
+# 무거운 모듈(pandas, python-binance)은 필요한 시점에 import 한다. 기동 시간이 곧
+# 크래시 후 포지션이 감시되지 않는 시간이므로 첫 run_once까지의 경로를 최소화한다.
+from src.utils.startup import StartupTimer
 
 def setup_logging():
     logger = logging.getLogger()
@@ -24,6 +26,9 @@ def setup_logging():
     return logger
 
 def main():
+    timer = StartupTimer(_STARTED_AT)
+    # pandas/numpy는 거래소 클라이언트 초기화(네트워크 대기)와 겹치도록 백그라운드에서 미리 불러온다.
+    timer.preload('numpy', 'pandas')
     setup_logging()
     
     logging.info("==========================================")
@@ -31,7 +36,9 @@ def main():
     logging.info("==========================================")
     
     # Load config using layered approach
-    config = load_config()
+    with timer.measure("config"):
+        from src.utils import load_config
+        config = load_config()
     if not config:
         logging.error("Failed to load configuration.")
         sys.exit(1)
@@ -41,13 +48,19 @@ def main():
     
     # Core Components Initialization
     try:
-        exchange = ExchangeProvider(testnet=test_mode)
-        execution = BinanceExecutionEngine(exchange.client)
+        with timer.measure("exchange"):
+            from src.core import ExchangeProvider
+            exchange = ExchangeProvider(testnet=test_mode, ticker_ttl=system_cfg.get('ticker_ttl', 1.0))
+        with timer.measure("execution"):
+            from src.core import BinanceExecutionEngine
+            execution = BinanceExecutionEngine(exchange.client, account=exchange.account)
         logging.info(f"Initialized Binance Exchange Provider (Testnet: {test_mode})")
     except Exception as e:
         logging.error(f"Failed to initialize core components: {e}")
         sys.exit(1)
 
+    from src.core import TechnicalAnalysisEngine, RiskManager
+    from src.strategies import create_strategy
     ta = TechnicalAnalysisEngine()
     
     # Strategy parameters from config
@@ -59,11 +72,21 @@ def main():
         'stop_n_multiplier': 5.0
     })
     
-    signal_manager = TurtleSignalManager(**strategy_params)
+    # 심볼별 strategy / strategy_params가 없는 심볼에 쓰는 기본 전략
+    signal_manager = create_strategy(None, strategy_params)
     risk = RiskManager()
     
+    def build_account(account_cfg):
+        # 추가 계정: 계정별 API 키(env_prefix)로 잔고 조회/주문만 수행. 시세는 기본 계정 것을 공유
+        account_exchange = ExchangeProvider(testnet=test_mode, env_prefix=account_cfg.get('env_prefix', ''))
+        return account_exchange, BinanceExecutionEngine(account_exchange.client, account=account_exchange.account)
+
     # Start Main Loop
-    bot = MainLoop(config, exchange, ta, signal_manager, risk, execution)
+    with timer.measure("main_loop"):
+        from src.main_loop import MainLoop
+        bot = MainLoop(config, exchange, ta, signal_manager, risk, execution,
+                       strategy_factory=create_strategy, account_factory=build_account)
+    logging.info(timer.summary())
     
     # Start bot
     bot.start()
@@ -1,57 +1,430 @@
+import os
 import time
 import logging
 import signal
-from src.utils import JSONPersistence
-from src.core import NotificationManager, DiscordNotificationChannel
+import threading
+from datetime import datetime, timezone
+from src.strategies import strategy_params_for, required_indicators
+from src.utils import JSONPersistence, SQLitePersistence, TradeJournal, BackgroundWorker, ConfigWatcher
+from src.core import (
+    NotificationManager, DiscordNotificationChannel, QueuedNotificationChannel,
+    FanOutNotificationChannel, FileNotificationChannel, WebhookNotificationChannel, Account
+)
 
 logger = logging.getLogger("BATS-Main")
 
 class MainLoop:
-    def __init__(self, config, exchange, ta, signal_manager, risk, execution):
+    # 시작 시 한 번만 구성되어 설정 리로드로는 반영되지 않는 섹션 (변경 시 재시작 필요)
+    RESTART_SECTIONS = ('persistence', 'accounts', 'notification', 'health', 'journal',
+                        'indicator_cache', 'indicator_checkpoint', 'live_snapshot', 'memory', 'config_reload')
+
+    def __init__(self, config, exchange, ta, signal_manager, risk, execution, strategy_factory=None,
+                 account_factory=None):
+        """
+        exchange / execution / state: 기본(primary) 계정. exchange는 모든 계정이 공유하는 시세 조회에도 쓰인다.
+        signal_manager: 심볼별 전략 설정이 없는 심볼에 쓰는 기본 signal manager
+        strategy_factory: (strategy 이름, params) -> signal manager (예: strategies.create_strategy).
+                          주어지면 심볼별 strategy / strategy_params 설정을 적용하고,
+                          설정 리로드 시 signal manager를 다시 만든다.
+        account_factory: accounts 설정 항목 -> (exchange, execution). 주어지면 추가 계정을 구성한다.
+        """
         self.config = config
         self.exchange = exchange
         self.ta = ta
         self.signal_manager = signal_manager
         self.risk = risk
         self.execution = execution
-        self.persistence = JSONPersistence()
+        self.strategy_factory = strategy_factory
+        self.account_factory = account_factory
+        self.persistence = self._create_persistence()
         self.state = self.persistence.load()
+        self.extra_accounts = self._create_accounts()
         self.is_running = False
         self.notifier = self._create_notifier()
+        self.journal, self.journal_worker = self._create_journal()
+        self.account_journals = self._create_account_journals()
+        self.indicator_cache = self._create_indicator_cache()
+        self.indicator_checkpoint = self._create_indicator_checkpoint()
+        self.config_watcher = self._create_config_watcher()
+        self.shadow = self._create_shadow()
+        self.live_snapshot = self._create_live_snapshot()
+        self.iteration = 0
+        # 마지막 반복이 끝날 때 만든 상태 스냅샷 (health endpoint는 이 값만 읽는다)
+        self.status_snapshot = None
+        self.last_success_at = None
+        self.last_error = None
+        self.health_server = self._create_health_server()
+        # 샘플링 프로파일러: profiler.enabled 또는 SIGUSR1로 켜고 끈다 (처음 켤 때 생성)
+        self.profiler = None
+        self._loop_thread_id = None
+        self.memory_watchdog = self._create_memory_watchdog()
+        # 설정에서 제거/비활성화되었지만 포지션이 남아 있는 심볼: 청산 신호만 처리한다.
+        self.exit_only_symbols = {}
+        # 심볼별 strategy / strategy_params로 생성한 signal manager (필요 시 생성)
+        self.symbol_strategies = {}
         
         # Register signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._handle_interrupt)
         signal.signal(signal.SIGTERM, self._handle_interrupt)
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, self._handle_profiler_signal)
 
     def _handle_interrupt(self, signum, frame):
         logger.info(f"Received signal {signum}. Initiating safe shutdown...")
         self.stop()
 
+    def _handle_profiler_signal(self, signum, frame):
+        self.set_profiling(not (self.profiler and self.profiler.running))
+
+    def set_profiling(self, enabled):
+        """트레이딩 루프 스레드에 대한 샘플링 프로파일러를 켜거나 끈다 (profiler 설정)."""
+        if not enabled:
+            if self.profiler:
+                self.profiler.stop()
+            return
+        if self.profiler is None:
+            from src.utils.sampling_profiler import SamplingProfiler
+            profiler_config = self.config.get('profiler', {})
+            self.profiler = SamplingProfiler(
+                thread_id=self._loop_thread_id,
+                interval=profiler_config.get('interval', 0.01),
+                window=profiler_config.get('window', 300),
+                output_dir=profiler_config.get('dir', 'logs/profiles'),
+                max_overhead=profiler_config.get('max_overhead', 0.02)
+            )
+        self.profiler.start()
+
+    def _create_persistence(self, path=None):
+        """config.yaml의 persistence 설정(backend: json | sqlite)에 따라 상태 저장소를 생성한다.
+
+        path: 지정하면 설정의 path 대신 사용한다 (추가 계정별 상태 파일, JSON migration 없음).
+        """
+        persistence_config = self.config.get('persistence', {})
+        backend = persistence_config.get('backend', 'json')
+        if backend == 'sqlite':
+            return SQLitePersistence(
+                filepath=path or persistence_config.get('path', 'state.db'),
+                json_path=persistence_config.get('migrate_from', 'state.json') if path is None else None,
+                synchronous=persistence_config.get('synchronous', 'NORMAL')
+            )
+        if backend != 'json':
+            logger.warning(f"Unknown persistence backend: {backend}, falling back to json")
+        return JSONPersistence(
+            path or persistence_config.get('path', 'state.json'),
+            async_write=persistence_config.get('async_write', False),
+            debounce=persistence_config.get('debounce', 0.2),
+            fsync_interval=persistence_config.get('fsync_interval', 5.0)
+        )
+
+    def _create_accounts(self):
+        """accounts 설정의 추가 계정을 생성한다. 계정마다 별도 잔고/주문/상태 파일(state_path)을 가진다."""
+        accounts_config = [a for a in self.config.get('accounts', []) if a.get('enabled', True)]
+        if not accounts_config:
+            return []
+        if not self.account_factory:
+            logger.warning("accounts configured but no account_factory given, running primary account only.")
+            return []
+        backend = self.config.get('persistence', {}).get('backend', 'json')
+        accounts = []
+        for account_cfg in accounts_config:
+            name = account_cfg['name']
+            exchange, execution = self.account_factory(account_cfg)
+            default_path = f"state_{name}.db" if backend == 'sqlite' else f"state_{name}.json"
+            persistence = self._create_persistence(path=account_cfg.get('state_path', default_path))
+            accounts.append(Account(name, exchange, execution, persistence))
+            logger.info(f"Account '{name}' attached to shared market data pipeline.")
+        return accounts
+
+    def _accounts(self):
+        """기본 계정(현재 exchange/execution/persistence/state) + 추가 계정."""
+        primary = Account("primary", self.exchange, self.execution, self.persistence, self.state, primary=True)
+        return [primary] + self.extra_accounts
+
+    def _create_journal(self):
+        """config.yaml의 journal 설정으로 TradeJournal과 전용 백그라운드 writer를 생성한다."""
+        journal_config = self.config.get('journal', {})
+        if not journal_config.get('enabled', False):
+            return None, None
+        journal = TradeJournal(
+            journal_dir=journal_config.get('dir', 'logs/journal'),
+            backend=journal_config.get('backend', 'jsonl'),
+            analytics=journal_config.get('analytics', True)
+        )
+        return journal, BackgroundWorker(name="JournalWriter")
+
+    def _create_account_journals(self):
+        """추가 계정별 TradeJournal (journal.dir/<계정 이름>, 계정 설정의 journal_dir로 변경 가능)."""
+        if not self.journal:
+            return {}
+        journal_config = self.config.get('journal', {})
+        accounts_config = {a['name']: a for a in self.config.get('accounts', []) if a.get('enabled', True)}
+        journals = {}
+        for account in self.extra_accounts:
+            journals[account.name] = TradeJournal(
+                journal_dir=accounts_config.get(account.name, {}).get(
+                    'journal_dir', os.path.join(journal_config.get('dir', 'logs/journal'), account.name)),
+                backend=journal_config.get('backend', 'jsonl'),
+                analytics=journal_config.get('analytics', True)
+            )
+        return journals
+
+    def _create_indicator_checkpoint(self):
+        """config.yaml의 indicator_checkpoint 설정으로 지표 warm-start 체크포인트를 생성한다."""
+        checkpoint_config = self.config.get('indicator_checkpoint', {})
+        if not checkpoint_config.get('enabled', False):
+            return None
+        from src.core.indicator_checkpoint import IndicatorCheckpoint  # pandas/numpy 의존
+        return IndicatorCheckpoint(
+            self.ta,
+            filepath=checkpoint_config.get('path', 'indicator_state.json'),
+            history_bars=checkpoint_config.get('history_bars', 300),
+            checkpoint_interval=checkpoint_config.get('interval', 300),
+            cache=self.indicator_cache
+        )
+
+    def _create_shadow(self):
+        """shadow 설정의 후보 전략들을 주문 없이 라이브 데이터로 평가하는 ShadowEvaluator를 생성한다."""
+        shadow_config = self.config.get('shadow', {})
+        if not shadow_config.get('enabled', False) or not shadow_config.get('strategies'):
+            return None
+        from src.strategies.shadow import ShadowEvaluator
+        return ShadowEvaluator(
+            shadow_config['strategies'], self.risk,
+            base_params=self.config.get('strategy_params', {}),
+            virtual_balance=shadow_config.get('virtual_balance', 10000.0),
+            filepath=shadow_config.get('path', 'shadow_state.json'),
+            **({'strategy_factory': self.strategy_factory} if self.strategy_factory else {})
+        )
+
+    def _create_live_snapshot(self):
+        """report_script 등 외부 도구가 API 호출 없이 읽는 공유 메모리 스냅샷 (live_snapshot 설정)."""
+        snapshot_config = self.config.get('live_snapshot', {})
+        if not snapshot_config.get('enabled', False):
+            return None
+        from src.utils.live_snapshot import SnapshotPublisher, DEFAULT_PATH
+        try:
+            return SnapshotPublisher(snapshot_config.get('path', DEFAULT_PATH),
+                                     capacity=snapshot_config.get('capacity', 1 << 20))
+        except OSError as e:
+            logger.warning(f"Live snapshot disabled: {e}")
+            return None
+
+    def _create_health_server(self):
+        """로컬 /health, /status HTTP 엔드포인트 (health 설정)."""
+        health_config = self.config.get('health', {})
+        if not health_config.get('enabled', False):
+            return None
+        from src.utils.health_server import HealthServer
+        polling_interval = self.config.get('system', {}).get('polling_interval', 60)
+        try:
+            return HealthServer(
+                lambda: self.status_snapshot,
+                host=health_config.get('host', '127.0.0.1'),
+                port=health_config.get('port', 8787),
+                stale_after=health_config.get('stale_after', max(3 * polling_interval, 60))
+            )
+        except OSError as e:
+            logger.warning(f"Health endpoint disabled: {e}")
+            return None
+
+    def _create_memory_watchdog(self):
+        """RSS / tracemalloc 기반 메모리 증가 감시 (memory 설정)."""
+        memory_config = self.config.get('memory', {})
+        if not memory_config.get('enabled', False):
+            return None
+        from src.utils.memory_watchdog import MemoryWatchdog
+        return MemoryWatchdog(
+            interval=memory_config.get('interval', 600),
+            growth_threshold_mb=memory_config.get('growth_threshold_mb', 256),
+            top=memory_config.get('top', 10),
+            trace=memory_config.get('tracemalloc', False),
+            frames=memory_config.get('frames', 1),
+            notify=lambda title, message: self.notifier.send_status(title, message)
+        )
+
+    def _create_indicator_cache(self):
+        """같은 캔들 안의 반복 폴링에서 지표를 다시 계산하지 않도록 하는 캐시 (indicator_cache 설정)."""
+        cache_config = self.config.get('indicator_cache', {})
+        if not cache_config.get('enabled', False):
+            return None
+        from src.core.indicator_cache import IndicatorCache  # pandas 의존
+        return IndicatorCache(
+            self.ta,
+            max_entries=cache_config.get('max_entries', 128),
+            max_bytes=int(cache_config.get('max_mb', 64) * 1024 * 1024)
+        )
+
+    def _create_config_watcher(self):
+        reload_config = self.config.get('config_reload', {})
+        if not reload_config.get('enabled', False):
+            return None
+        validator = None
+        if self.strategy_factory:
+            # 새 설정의 모든 심볼 전략이 만들어지는지 감시 스레드에서 미리 확인
+            validator = self._build_strategies
+        return ConfigWatcher(
+            base_path=reload_config.get('base_path', 'config.yaml'),
+            local_path=reload_config.get('local_path', 'config.local.yaml'),
+            poll_interval=reload_config.get('poll_interval', 5.0),
+            validator=validator
+        )
+
+    def apply_config(self, new_config):
+        """검증된 새 설정으로 교체한다. 반복과 반복 사이에서만 호출된다."""
+        old_config = self.config
+        old_active = {s['name']: s for s in old_config.get('symbols', []) if s.get('enabled', True)}
+        new_active = {s['name'] for s in new_config.get('symbols', []) if s.get('enabled', True)}
+
+        for name in new_active:
+            self.exit_only_symbols.pop(name, None)
+        for name, symbol_cfg in old_active.items():
+            if name in new_active:
+                continue
+            if any(account.state.get('symbols', {}).get(name, {}).get('units_held', 0) > 0
+                   for account in self._accounts()):
+                self.exit_only_symbols[name] = symbol_cfg
+                logger.warning(f"[{name}] Removed from config with open position, managing exits only.")
+
+        if self.strategy_factory:
+            self.signal_manager, self.symbol_strategies = self._build_strategies(new_config)
+            logger.info("Signal managers rebuilt from new strategy configuration.")
+
+        if self.shadow:
+            self.shadow.configure(new_config.get('shadow', {}).get('strategies', []),
+                                  new_config.get('strategy_params', {}))
+
+        profiling = new_config.get('profiler', {}).get('enabled', False)
+        if profiling != old_config.get('profiler', {}).get('enabled', False):
+            self.config = new_config
+            self.set_profiling(profiling)
+
+        self.config = new_config
+        added = sorted(new_active - set(old_active))
+        removed = sorted(set(old_active) - new_active)
+        restart_required = [section for section in self.RESTART_SECTIONS
+                            if old_config.get(section) != new_config.get(section)]
+        for section in restart_required:
+            logger.warning(f"Config section '{section}' changed but is only applied at startup, restart required.")
+        logger.info(f"Configuration reloaded (added: {added or '-'}, removed: {removed or '-'})")
+        message = f"Added: {', '.join(added) or '-'} / Removed: {', '.join(removed) or '-'}"
+        if restart_required:
+            message += f"\nRestart required for: {', '.join(restart_required)}"
+        self.notifier.send_status("Config Reloaded", message)
+
+    def _build_strategies(self, config):
+        """config로 기본 signal manager와 심볼별 signal manager를 생성한다. 잘못된 설정은 예외."""
+        default = self.strategy_factory(None, config.get('strategy_params', {}))
+        symbol_strategies = {}
+        for symbol_cfg in config.get('symbols', []):
+            if 'strategy' in symbol_cfg or 'strategy_params' in symbol_cfg:
+                symbol_strategies[symbol_cfg['name']] = self.strategy_factory(
+                    symbol_cfg.get('strategy'), strategy_params_for(symbol_cfg, config))
+        return default, symbol_strategies
+
+    def _strategy_for(self, symbol_cfg):
+        if not self.strategy_factory or not ('strategy' in symbol_cfg or 'strategy_params' in symbol_cfg):
+            return self.signal_manager
+        symbol = symbol_cfg['name']
+        if symbol not in self.symbol_strategies:
+            self.symbol_strategies[symbol] = self.strategy_factory(
+                symbol_cfg.get('strategy'), strategy_params_for(symbol_cfg, self.config))
+        return self.symbol_strategies[symbol]
+
+    def _fetch_market_data(self, symbol, interval):
+        # 체크포인트가 없는 심볼은 최초 1회만 충분한 이력을 받아 지표를 수렴시킨다.
+        if self.indicator_checkpoint and not self.indicator_checkpoint.has(symbol, interval):
+            return self.exchange.get_market_data(symbol, interval, limit=self.indicator_checkpoint.history_bars)
+        return self.exchange.get_market_data(symbol, interval)
+
+    def _calculate_indicators(self, symbol, interval, df, indicators=None):
+        if self.indicator_checkpoint:
+            return self.indicator_checkpoint.calculate(symbol, interval, df, indicators=indicators)
+        if self.indicator_cache:
+            return self.indicator_cache.calculate_indicators(df, indicators=indicators,
+                                                             symbol=symbol, interval=interval)
+        if indicators is None:
+            return self.ta.calculate_indicators(df)
+        return self.ta.calculate_indicators(df, indicators=indicators)
+
+    def _record_journal(self, account, method, **kwargs):
+        """계정의 일지 기록을 백그라운드 writer에 넘긴다. 주문 경로에서는 디스크에 접근하지 않는다."""
+        journal = self.journal if account.primary else self.account_journals.get(account.name)
+        if not journal:
+            return
+        kwargs['timestamp'] = datetime.now(timezone.utc)
+        self.journal_worker.submit(getattr(journal, method), **kwargs)
+
+    @staticmethod
+    def _last_value(df, key):
+        if hasattr(df, 'iloc'):
+            return float(df[key].iloc[-1]) if key in df.columns else None
+        return df[-1].get(key)
+
     def _create_notifier(self):
-        """config.yaml의 notification 설정을 기반으로 NotificationManager를 생성한다."""
+        """config.yaml의 notification 설정을 기반으로 NotificationManager를 생성한다.
+
+        - notification.channel: 단일 채널
+        - notification.channels: 여러 채널에 동시 전송 (FanOutNotificationChannel)
+        """
         notification_config = self.config.get('notification')
         if not notification_config:
             return NotificationManager(channel=None)
 
-        channel_config = notification_config.get('channel', {})
-        channel_type = channel_config.get('type')
-        if not channel_type:
-            return NotificationManager(channel=None)
-
-        channel = None
-        if channel_type == 'discord':
-            webhook_url = channel_config.get('webhook_url')
-            channel = DiscordNotificationChannel(webhook_url=webhook_url)
+        channels_config = notification_config.get('channels')
+        if channels_config:
+            channels, timeouts = [], []
+            for channel_config in channels_config:
+                built = self._build_channel(channel_config)
+                if built is not None:
+                    channels.append(built)
+                    # fan-out 대기 시간은 채널 자체의 전송 timeout(webhook 등)과 별도로 설정한다
+                    timeouts.append(channel_config.get('fanout_timeout'))
+            channel = FanOutNotificationChannel(
+                channels, timeouts=timeouts, max_backlog=notification_config.get('max_backlog', 100)
+            ) if channels else None
         else:
-            logger.warning(f"Unknown notification channel type: {channel_type}")
+            channel_config = notification_config.get('channel', {})
+            if not channel_config.get('type'):
+                return NotificationManager(channel=None)
+            channel = self._build_channel(channel_config)
+
+        # 기본적으로 백그라운드 큐를 통해 전송하여 트레이딩 루프가 채널 지연에 묶이지 않도록 한다.
+        queue_config = notification_config.get('queue', {})
+        if channel is not None and queue_config.get('enabled', True):
+            channel = QueuedNotificationChannel(
+                channel,
+                max_queue_size=queue_config.get('max_size', 1000),
+                coalesce_window=queue_config.get('coalesce_window', 0.5),
+                max_retries=queue_config.get('max_retries', 5)
+            )
 
         return NotificationManager(channel=channel)
 
+    @staticmethod
+    def _build_channel(channel_config):
+        channel_type = channel_config.get('type')
+        if channel_type == 'discord':
+            return DiscordNotificationChannel(webhook_url=channel_config.get('webhook_url'))
+        if channel_type == 'file':
+            return FileNotificationChannel(path=channel_config.get('path', 'logs/notifications.jsonl'))
+        if channel_type == 'webhook':
+            return WebhookNotificationChannel(url=channel_config.get('url'),
+                                              timeout=channel_config.get('timeout', 10.0))
+        logger.warning(f"Unknown notification channel type: {channel_type}")
+        return None
+
     def run_once(self):
         """A single iteration of the trading loop for all symbols."""
+        started = time.monotonic()
+        snapshot_symbols = {}
         try:
+            if self.config_watcher:
+                new_config = self.config_watcher.poll()
+                if new_config is not None:
+                    self.apply_config(new_config)
+
             symbols_config = self.config.get('symbols', [])
-            if not symbols_config:
+            if not symbols_config and not self.exit_only_symbols:
                 logger.warning("No symbols configured, skipping iteration.")
                 return
 
@@ -59,37 +432,40 @@ class MainLoop:
             risk_cfg = self.config.get('risk', {})
             unit_risk_percent = risk_cfg.get('unit_risk_percent', 0.01)
             max_portfolio_heat = risk_cfg.get('max_portfolio_heat', 0.2)
+            accounts = self._accounts()
             
-            # 2. Global API Calls (Optimization: Fetch balance once per loop)
-            usdt_balance = self.exchange.get_asset_balance("USDT")
+            for account in accounts:
+                # 2. Global API Calls (Optimization: Fetch balance once per loop per account)
+                account.balance = account.exchange.get_asset_balance("USDT")
 
-            # 3. Update Portfolio-level Total Heat
-            if 'symbols' not in self.state:
-                self.state['symbols'] = {}
-            
-            total_heat = self.risk.calculate_total_heat(self.state['symbols'], unit_risk_percent)
-            self.state['total_heat'] = total_heat
+                # 3. Update Portfolio-level Total Heat
+                if 'symbols' not in account.state:
+                    account.state['symbols'] = {}
+                account.state['total_heat'] = self.risk.calculate_total_heat(account.state['symbols'], unit_risk_percent)
 
-            for symbol_cfg in symbols_config:
+            for symbol_cfg in symbols_config + list(self.exit_only_symbols.values()):
                 if not symbol_cfg.get('enabled', True):
                     continue
                 
                 symbol = symbol_cfg['name']
+                exit_only = symbol in self.exit_only_symbols
                 interval = symbol_cfg.get('timeframe', '1h')
                 
                 # Get or create symbol-specific state
-                sym_state = self.persistence.get_symbol_state(self.state, symbol)
+                sym_states = [account.persistence.get_symbol_state(account.state, symbol) for account in accounts]
                 
-                # 4. Fetch Market Data
-                df = self.exchange.get_market_data(symbol, interval)
+                # 4. Fetch Market Data (모든 계정이 공유)
+                df = self._fetch_market_data(symbol, interval)
                 current_price = self.exchange.get_realtime_price(symbol)
                 
                 if df is None or current_price is None:
                     logger.error(f"[{symbol}] Failed to fetch data, skipping.")
                     continue
 
-                # 5. Technical Analysis
-                df_analyzed = self.ta.calculate_indicators(df)
+                # 5. Technical Analysis (전략이 요구하는 지표 + 유닛 계산용 N만 계산)
+                strategy = self._strategy_for(symbol_cfg)
+                indicators = self._required_indicators(symbol, strategy, sym_states)
+                df_analyzed = self._calculate_indicators(symbol, interval, df, indicators)
                 
                 # N_avg_20 for Volatility Cap
                 if hasattr(df_analyzed, 'iloc'):
@@ -102,67 +478,220 @@ class MainLoop:
                     n_value = df_analyzed[-1]['N']
                     n_avg_20 = sum(d['N'] for d in df_analyzed[-20:]) / len(df_analyzed[-20:])
 
-                # 6. Signal Generation
-                sig = self.signal_manager.generate_signal(df_analyzed, current_price, sym_state)
-                
-                if sig == "HOLD":
-                    continue
+                # Shadow strategies: 같은 지표로 가상 포지션만 평가 (주문 없음)
+                if self.shadow:
+                    try:
+                        self.shadow.on_bar(symbol, df_analyzed, current_price, n_value, n_avg_20)
+                    except Exception as e:
+                        logger.error(f"[{symbol}] Shadow evaluation failed: {e}")
 
-                logger.info(f"[{symbol}] Signal Generated: {sig} at {current_price}")
+                # 6~7. 계정별 Signal Generation & Execution (지표는 공유, 포지션 상태는 계정별)
+                for account, sym_state in zip(accounts, sym_states):
+                    self._trade_account(account, symbol, sym_state, strategy, df_analyzed, current_price,
+                                        n_value, n_avg_20, exit_only, unit_risk_percent, max_portfolio_heat)
 
-                # 7. Risk Management & Execution
-                if sig in ["BUY", "PYRAMID"]:
-                    # Optimization: Shared usdt_balance used here
-                    unit_size = self.risk.calculate_unit_size(usdt_balance, n_value, current_price, n_avg_20)
-                    
-                    if unit_size > 0 and self.risk.can_entry(self.state['total_heat'], max_portfolio_heat, unit_risk_percent):
-                        success = self.execution.execute_order(symbol, "BUY", unit_size)
-                        if success:
-                            sym_state['units_held'] += 1
-                            if 'entry_prices' not in sym_state: sym_state['entry_prices'] = []
-                            sym_state['entry_prices'].append(current_price)
-                            sym_state['current_n'] = n_value
-                            
-                            # Update total heat for next symbol in same iteration
-                            self.state['total_heat'] += unit_risk_percent
-                            self.persistence.save(self.state)
-                            
-                            logger.info(f"[{symbol}] Executed {sig}: {unit_size} units at {current_price}")
-                            self.notifier.send_trade(sig, symbol, current_price, unit_size)
-                        else:
-                            logger.error(f"[{symbol}] Order execution failed.")
-                    else:
-                        logger.info(f"[{symbol}] Entry blocked by Risk Manager (Heat: {self.state['total_heat']:.2f})")
-                
-                elif sig == "EXIT":
-                    if sym_state.get('units_held', 0) > 0:
-                        success = self.execution.execute_order(symbol, "SELL", 0)
-                        if success:
-                            last_entry = sym_state['entry_prices'][-1] if sym_state.get('entry_prices') else current_price
-                            trade_result = "win" if current_price > last_entry else "loss"
-                            sym_state['last_trade_result'] = trade_result
-                            
-                            units_freed = sym_state['units_held']
-                            sym_state['units_held'] = 0
-                            sym_state['entry_prices'] = []
-                            sym_state['current_n'] = 0
-                            
-                            # Update total heat
-                            self.state['total_heat'] -= (units_freed * unit_risk_percent)
-                            self.persistence.save(self.state)
-                            
-                            logger.info(f"[{symbol}] Executed EXIT at {current_price} (Result: {trade_result})")
-                            self.notifier.send_trade("EXIT", symbol, current_price, 0, status=f"RESULT: {trade_result.upper()}")
-                        else:
-                            logger.error(f"[{symbol}] Exit order execution failed.")
+                if self.live_snapshot or self.health_server:
+                    snapshot_symbols[symbol] = self._snapshot_symbol(
+                        interval, strategy, df_analyzed, current_price, accounts, sym_states, exit_only)
+
+                if exit_only and all(sym_state.get('units_held', 0) == 0 for sym_state in sym_states):
+                    self.exit_only_symbols.pop(symbol, None)
+
+            if self.indicator_checkpoint:
+                self.indicator_checkpoint.checkpoint()
+
+            self.last_success_at = time.time()
+            if self.memory_watchdog:
+                self.memory_watchdog.check()
+            if self.live_snapshot or self.health_server:
+                self._publish_snapshot(accounts, snapshot_symbols, started)
 
         except Exception as e:
             logger.error(f"Error in main loop iteration: {e}")
+            self.last_error = {'at': time.time(), 'message': str(e)}
+            if self.status_snapshot is not None:
+                self.status_snapshot = dict(self.status_snapshot, last_error=self.last_error)
             self.notifier.send_error(f"Main Loop Error: {str(e)}")
 
+    SNAPSHOT_INDICATORS = ('N', 'ADX', 'ema_200', 'rsi_14', 'vol_sma_20')
+
+    def _snapshot_symbol(self, interval, strategy, df_analyzed, current_price, accounts, sym_states, exit_only):
+        """스냅샷용 심볼 요약: 마지막 봉 지표, 계정별 포지션과 진입/청산 가격 수준."""
+        row = df_analyzed.iloc[-1].to_dict() if hasattr(df_analyzed, 'iloc') else dict(df_analyzed[-1])
+        indicators = {key: float(value) for key, value in row.items()
+                      if (key in self.SNAPSHOT_INDICATORS or key.startswith('dc_')) and value == value}
+        positions = {}
+        for account, sym_state in zip(accounts, sym_states):
+            positions[account.name] = {
+                'units_held': sym_state.get('units_held', 0),
+                'entry_prices': sym_state.get('entry_prices', []),
+                'system_mode': sym_state.get('system_mode'),
+                'current_n': float(sym_state.get('current_n', 0) or 0),
+                'levels': strategy.trigger_levels(indicators, sym_state) if hasattr(strategy, 'trigger_levels') else {},
+            }
+        return {
+            'interval': interval,
+            'price': float(current_price),
+            'strategy': type(strategy).__name__,
+            'exit_only': exit_only,
+            'indicators': indicators,
+            'positions': positions,
+        }
+
+    def _publish_snapshot(self, accounts, symbols, started):
+        self.iteration += 1
+        snapshot = {
+            'pid': os.getpid(),
+            'published_at': time.time(),
+            'iteration': self.iteration,
+            'duration_ms': round((time.monotonic() - started) * 1000, 1),
+            'polling_interval': self.config.get('system', {}).get('polling_interval', 60),
+            'last_success_at': self.last_success_at,
+            'last_error': self.last_error,
+            'accounts': {account.name: {'balance': account.balance, 'total_heat': account.state.get('total_heat', 0.0)}
+                         for account in accounts},
+            'symbols': symbols,
+            'queues': self._queue_depths(),
+        }
+        if self.memory_watchdog and self.memory_watchdog.last_report:
+            snapshot['memory'] = self.memory_watchdog.last_report
+        if self.shadow:
+            snapshot['shadow'] = self.shadow.summary()
+        self.status_snapshot = snapshot
+        if self.live_snapshot:
+            try:
+                self.live_snapshot.publish(snapshot)
+            except Exception as e:
+                logger.error(f"Failed to publish live snapshot: {e}")
+
+    def _queue_depths(self):
+        """백그라운드 큐 적재량 (알림 전송, 일지 기록)."""
+        queues = {}
+        channel = getattr(self.notifier, 'channel', None)
+        if isinstance(channel, QueuedNotificationChannel):
+            queues['notifications'] = channel.queue_depth
+            queues['notifications_dropped'] = channel.dropped_count
+            channel = channel.channel
+        if isinstance(channel, FanOutNotificationChannel):
+            queues['notifications_sink_dropped'] = channel.dropped_counts
+        if self.journal_worker:
+            queues['journal'] = self.journal_worker.queue_depth
+        return queues
+
+    def _required_indicators(self, symbol, strategy, sym_states):
+        """모든 계정의 포지션 상태와 섀도 전략이 요구하는 지표의 합집합 (+N). None이면 전체 계산."""
+        indicators = set()
+        for sym_state in sym_states:
+            required = required_indicators([strategy], sym_state)
+            if required is None:
+                return None
+            indicators |= required
+        if self.shadow:
+            shadow_indicators = self.shadow.required_indicators(symbol)
+            if shadow_indicators is None:
+                return None
+            indicators |= shadow_indicators
+        indicators.add('N')
+        return indicators
+
+    def _trade_account(self, account, symbol, sym_state, strategy, df_analyzed, current_price,
+                       n_value, n_avg_20, exit_only, unit_risk_percent, max_portfolio_heat):
+        label = account.label(symbol)
+
+        # 6. Signal Generation
+        sig = strategy.generate_signal(df_analyzed, current_price, sym_state)
+        
+        if sig == "HOLD" or (exit_only and sig != "EXIT"):
+            return
+
+        logger.info(f"[{label}] Signal Generated: {sig} at {current_price}")
+
+        # 7. Risk Management & Execution
+        if sig in ["BUY", "PYRAMID"]:
+            # 신호 직후의 상태로 판단한다 (체결 후 last_trade_result 등이 바뀌기 전)
+            skip_rule_applied = (bool(strategy.skip_rule_applied(sym_state))
+                                 if hasattr(strategy, 'skip_rule_applied') else False)
+            # Optimization: Shared balance (fetched once per iteration) used here
+            unit_size = self.risk.calculate_unit_size(account.balance, n_value, current_price, n_avg_20)
+            
+            if unit_size > 0 and self.risk.can_entry(account.state['total_heat'], max_portfolio_heat, unit_risk_percent):
+                success = account.execution.execute_order(symbol, "BUY", unit_size)
+                if success:
+                    sym_state['units_held'] += 1
+                    if 'entry_prices' not in sym_state: sym_state['entry_prices'] = []
+                    sym_state['entry_prices'].append(current_price)
+                    sym_state['current_n'] = n_value
+                    
+                    # Update total heat for next symbol in same iteration
+                    account.state['total_heat'] += unit_risk_percent
+                    account.persistence.save_symbol(account.state, symbol)
+                    
+                    stop_level = (float(strategy.stop_level(current_price, n_value))
+                                  if hasattr(strategy, 'stop_level') else None)
+                    if sig == "BUY":
+                        self._record_journal(
+                            account, 'record_entry', symbol=symbol, direction="LONG",
+                            entry_price=current_price, unit_size=unit_size, n_value=float(n_value),
+                            system_mode=sym_state.get('system_mode'),
+                            entry_trigger=f"{sym_state.get('system_mode')} breakout",
+                            ema_200=self._last_value(df_analyzed, 'ema_200'),
+                            skip_rule_applied=skip_rule_applied,
+                            volatility_cap_applied=bool(n_avg_20 and n_value > n_avg_20 * 1.5),
+                            balance=account.balance,
+                            stop_loss_level=stop_level
+                        )
+                    else:
+                        self._record_journal(account, 'record_pyramid', symbol=symbol, price=current_price,
+                                             new_n=float(n_value), stop_loss_level=stop_level)
+
+                    logger.info(f"[{label}] Executed {sig}: {unit_size} units at {current_price}")
+                    self.notifier.send_trade(sig, label, current_price, unit_size)
+                else:
+                    logger.error(f"[{label}] Order execution failed.")
+            else:
+                logger.info(f"[{label}] Entry blocked by Risk Manager (Heat: {account.state['total_heat']:.2f})")
+        
+        elif sig == "EXIT":
+            if sym_state.get('units_held', 0) > 0:
+                # 청산 원인(하드 스톱/트레일링)은 포지션 상태를 지우기 전에 판단한다
+                exit_trigger = (str(strategy.exit_trigger(current_price, sym_state))
+                                if hasattr(strategy, 'exit_trigger')
+                                else f"{sym_state.get('system_mode')} exit signal")
+                success = account.execution.execute_order(symbol, "SELL", 0)
+                if success:
+                    last_entry = sym_state['entry_prices'][-1] if sym_state.get('entry_prices') else current_price
+                    trade_result = "win" if current_price > last_entry else "loss"
+                    sym_state['last_trade_result'] = trade_result
+                    
+                    units_freed = sym_state['units_held']
+                    sym_state['units_held'] = 0
+                    sym_state['entry_prices'] = []
+                    sym_state['current_n'] = 0
+                    
+                    # Update total heat
+                    account.state['total_heat'] -= (units_freed * unit_risk_percent)
+                    account.persistence.save_symbol(account.state, symbol)
+                    
+                    self._record_journal(account, 'record_exit', symbol=symbol, exit_price=current_price,
+                                         exit_trigger=exit_trigger)
+
+                    logger.info(f"[{label}] Executed EXIT at {current_price} (Result: {trade_result})")
+                    self.notifier.send_trade("EXIT", label, current_price, 0, status=f"RESULT: {trade_result.upper()}")
+                else:
+                    logger.error(f"[{label}] Exit order execution failed.")
+
     def start(self):
         self.is_running = True
+        self._loop_thread_id = threading.get_ident()
         logger.info("Starting BATS Main Loop (Multi-Symbol Mode)...")
+        if self.config.get('profiler', {}).get('enabled', False):
+            self.set_profiling(True)
+        if self.config_watcher:
+            self.config_watcher.start()
+        if self.health_server:
+            self.health_server.start()
+        if self.memory_watchdog:
+            self.memory_watchdog.start()
         self.notifier.send_status(
             "System Online",
             "BATS Trading System has started successfully in Multi-Symbol mode."
@@ -189,12 +718,32 @@ class MainLoop:
         """Final cleanup and persistence before exiting."""
         logger.info("Performing final shutdown tasks...")
         try:
+            if self.config_watcher:
+                self.config_watcher.close()
+
             # 1. Save final state
-            self.persistence.save(self.state)
+            for account in self._accounts():
+                account.persistence.save(account.state)
+                account.persistence.close()
             logger.info("Final state saved successfully.")
+            if self.journal_worker:
+                self.journal_worker.close()
+            if self.indicator_checkpoint:
+                self.indicator_checkpoint.close()
+            if self.shadow:
+                self.shadow.close()
+            if self.live_snapshot:
+                self.live_snapshot.close()
+            if self.health_server:
+                self.health_server.close()
+            if self.profiler:
+                self.profiler.stop()
+            if self.memory_watchdog:
+                self.memory_watchdog.stop()
             
             # 2. Notify shutdown
             self.notifier.send_status("System Offline", "BATS Trading System has been shut down safely.")
+            self.notifier.close()
             
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
@@ -4,6 +4,8 @@ import sys
 import pandas as pd
 from datetime import datetime
 from src.backtest import BacktestEngine, BacktestReporter
+from src.utils.kline_quality import repair_klines
+from src.utils.kline_store import interval_to_ms
 
 class MultiSymbolBacktestEngine:
     def __init__(self, config_path):
@@ -42,9 +44,7 @@ class MultiSymbolBacktestEngine:
             all_klines = []
             limit_per_request = 1000
             total_needed = self.limit
-            interval_ms = 3600000 # Default 1h
-            if self.interval == '4h': interval_ms *= 4
-            elif self.interval == '1d': interval_ms *= 24
+            interval_ms = interval_to_ms(self.interval)
             
             end_time = int(datetime.now().timestamp() * 1000)
             start_time = (end_time - (total_needed * interval_ms))
@@ -65,26 +65,42 @@ class MultiSymbolBacktestEngine:
                 except: break
             
             formatted_data = [{'timestamp': k[0], 'open': float(k[1]), 'high': float(k[2]), 'low': float(k[3]), 'close': float(k[4]), 'volume': float(k[5])} for k in all_klines]
-            symbol_data[symbol] = ta.calculate_indicators(pd.DataFrame(formatted_data))
+            if not formatted_data:
+                print(f"No data for {symbol}, skipping")
+                continue
+            # 중복 제거 + 누락 봉은 직전 종가로 채움 (이상치는 경고만)
+            df, report = repair_klines(pd.DataFrame(formatted_data), self.interval)
+            print(f"[{symbol}] Data quality: {report.summary()}")
+            symbol_data[symbol] = ta.calculate_indicators(df.drop(columns=['filled', 'flagged']))
 
         print("Starting Multi-Symbol Backtest...")
         
-        from src.core import TurtleSignalManager, AdvancedTurtleManager
+        from src.strategies import create_strategy
         strategy_params = self.config.get('strategy_params', {})
-        strategy_class = AdvancedTurtleManager if self.config.get('strategy') == 'AdvancedTurtleManager' else TurtleSignalManager
-        managers = {symbol: strategy_class(**strategy_params) for symbol in self.symbols}
+        managers = {symbol: create_strategy(self.config.get('strategy'), strategy_params) for symbol in self.symbols}
 
-        # Find common timestamps or use the first one's length
-        length = min(len(df) for df in symbol_data.values())
+        # 심볼마다 상장 시점/데이터 길이가 달라도 같은 시각의 봉끼리 처리한다 (timestamp 기준 정렬).
+        # 각 심볼은 자기 이력이 90봉(lookback)을 넘은 뒤부터 거래한다.
+        positions = {symbol: {ts: i for i, ts in enumerate(df['timestamp'])} for symbol, df in symbol_data.items()}
+        timeline = sorted(set().union(*positions.values())) if positions else []
+        warmed_up = [df['timestamp'].iloc[90] for df in symbol_data.values() if len(df) > 90]
+        timeline = [ts for ts in timeline if warmed_up and ts >= min(warmed_up)]
+        last_close = {}
         
-        for i in range(90, length):
+        for ts in timeline:
             current_total_heat = sum(s['units_held'] * self.risk_per_trade for s in self.symbol_states.values())
             
             # Process each symbol in the same time step
             for symbol in self.symbols:
+                i = positions.get(symbol, {}).get(ts)
+                if i is None:
+                    continue
                 df = symbol_data[symbol]
                 current_bar = df.iloc[i]
                 price = current_bar['close']
+                last_close[symbol] = price
+                if i < 90:
+                    continue
                 state = self.symbol_states[symbol]
                 state['current_n'] = current_bar['N']
                 
@@ -138,14 +154,14 @@ class MultiSymbolBacktestEngine:
             current_equity = self.balance
             for symbol, state in self.symbol_states.items():
                 if state['units_held'] > 0:
-                    current_price = symbol_data[symbol].iloc[i]['close']
+                    current_price = last_close[symbol]
                     for i_pos in range(len(state['entry_prices'])):
                         entry_price = state['entry_prices'][i_pos]
                         notional = state['notionals'][i_pos]
                         current_equity += notional * (current_price / entry_price)
             
             self.equity_curve.append({
-                'timestamp': str(symbol_data[self.symbols[0]].iloc[i]['timestamp']),
+                'timestamp': str(ts),
                 'equity': current_equity
             })
 
@@ -0,0 +1,167 @@
+"""
+전체 USDT 마켓 S3 돌파 스캐너.
+
+config.yaml의 심볼과 관계없이 거래소의 모든 USDT 페어에 대해 S3 진입 조건
+(ADX >= adx_filter_threshold, 가격 >= EMA200, 가격 > dc_90_high)을 만족하는 종목을 찾아
+돌파 폭(N 단위) 순으로 출력한다.
+
+    python -m src.scanner [--interval 4h] [--top 30] [--json candidates.json]
+"""
+import argparse
+import json
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.panel_indicators import PanelIndicatorEngine
+from src.utils.kline_store import KlineStore, klines_to_columns, interval_to_ms
+from src.utils.rate_limiter import RateLimiter, klines_weight
+
+logger = logging.getLogger("BATS-Scanner")
+
+EXCHANGE_INFO_WEIGHT = 20
+
+
+class UniverseScanner:
+    """
+    - universe(): exchangeInfo 한 번으로 거래 중인 quote_asset 페어 목록을 얻는다.
+    - download(): workers 개 스레드로 캔들을 받되 RateLimiter로 분당 weight 한도를 지킨다.
+      KlineStore에 이력이 있으면 마지막 봉 이후만 받는다 (재스캔 시 페어당 weight 1).
+    - evaluate(): 모든 심볼을 하나의 패널로 묶어 지표를 한 번에 계산하고 조건을 벡터 연산으로 검사한다.
+    """
+
+    def __init__(self, client, store=None, limiter=None, interval="4h", history_bars=500,
+                 quote_asset="USDT", adx_threshold=25.0, workers=8, exclude=(), clock=time.time):
+        self.client = client
+        self.store = store or KlineStore()
+        self.limiter = limiter or RateLimiter()
+        self.interval = interval
+        self.history_bars = history_bars
+        self.quote_asset = quote_asset
+        self.adx_threshold = adx_threshold
+        self.workers = workers
+        self.exclude = set(exclude)
+        self.clock = clock
+        self.panel_engine = PanelIndicatorEngine()
+
+    def universe(self):
+        self.limiter.acquire(EXCHANGE_INFO_WEIGHT)
+        info = self.client.get_exchange_info()
+        return sorted(
+            s['symbol'] for s in info.get('symbols', [])
+            if s.get('status') == 'TRADING' and s.get('quoteAsset') == self.quote_asset
+            and s.get('isSpotTradingAllowed', True) and s['symbol'] not in self.exclude
+        )
+
+    def _request(self, **params):
+        weight = klines_weight(params['limit'])
+        for attempt in range(3):
+            self.limiter.acquire(weight)
+            try:
+                return self.client.get_klines(interval=self.interval, **params)
+            except Exception as e:
+                status = getattr(e, 'status_code', None)
+                if status not in (418, 429) or attempt == 2:
+                    raise
+                headers = getattr(getattr(e, 'response', None), 'headers', None) or {}
+                retry_after = float(headers.get('Retry-After', 60))
+                logger.warning(f"Rate limited ({status}), pausing {retry_after}s")
+                self.limiter.pause(retry_after)
+
+    def _fetch(self, symbol):
+        last_ts = self.store.last_timestamp(symbol, self.interval)
+        if last_ts is not None:
+            missing = (int(self.clock() * 1000) - last_ts) // interval_to_ms(self.interval) + 1
+            if missing < self.history_bars:
+                # 마지막(형성 중이던) 봉부터 다시 받아 덮어쓴다
+                klines = self._request(symbol=symbol, limit=int(min(1000, missing + 1)), startTime=last_ts)
+                return self.store.update(symbol, self.interval, klines_to_columns(klines))
+        klines = self._request(symbol=symbol, limit=self.history_bars)
+        return self.store.update(symbol, self.interval, klines_to_columns(klines), replace=True)
+
+    def download(self, symbols):
+        def fetch(symbol):
+            try:
+                return symbol, self._fetch(symbol)
+            except Exception as e:
+                logger.warning(f"[{symbol}] Kline download failed: {e}")
+                return symbol, None
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="Scanner") as pool:
+            return {symbol: columns for symbol, columns in pool.map(fetch, symbols) if columns is not None}
+
+    def evaluate(self, columns_by_symbol):
+        """S3 진입 조건을 만족하는 심볼을 돌파 폭((가격 - dc_90_high) / N) 내림차순으로 반환한다."""
+        panel = self.panel_engine.build_panel(columns_by_symbol)
+        close = panel['close']
+        if close.empty:
+            return []
+        ind = self.panel_engine.calculate(panel)
+
+        last = {name: frame.iloc[-1] for name, frame in ind.items()}
+        price = close.iloc[-1]
+        # 마지막 봉이 없는 심볼(거래 중단 등)은 제외
+        mask = (price.notna() & (last['ADX'] >= self.adx_threshold)
+                & (price >= last['ema_200']) & (price > last['dc_90_high']))
+        breakout_n = ((price - last['dc_90_high']) / last['N'])[mask].sort_values(ascending=False)
+
+        return [{
+            'symbol': symbol,
+            'price': float(price[symbol]),
+            'adx': float(last['ADX'][symbol]),
+            'ema_200': float(last['ema_200'][symbol]),
+            'dc_90_high': float(last['dc_90_high'][symbol]),
+            'N': float(last['N'][symbol]),
+            'breakout_n': float(score),
+        } for symbol, score in breakout_n.items()]
+
+    def scan(self, symbols=None):
+        started = time.monotonic()
+        symbols = symbols or self.universe()
+        columns_by_symbol = self.download(symbols)
+        candidates = self.evaluate(columns_by_symbol)
+        logger.info(f"Scanned {len(columns_by_symbol)}/{len(symbols)} {self.quote_asset} pairs in "
+                    f"{time.monotonic() - started:.1f}s (weight used: {self.limiter.used_weight}), "
+                    f"{len(candidates)} candidates")
+        return candidates
+
+
+def main(argv=None):
+    from binance.client import Client
+    from src.utils import load_config
+
+    config = load_config()
+    scanner_cfg = config.get('scanner', {})
+    parser = argparse.ArgumentParser(description="Scan all USDT pairs for S3 breakout candidates")
+    parser.add_argument('--interval', default=scanner_cfg.get('interval', '4h'))
+    parser.add_argument('--top', type=int, default=scanner_cfg.get('top', 30))
+    parser.add_argument('--json', dest='json_path', help="write the ranked candidates to this file")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    scanner = UniverseScanner(
+        Client(None, None),  # 공개 시세만 사용하므로 API 키가 필요 없다
+        store=KlineStore(scanner_cfg.get('store_dir', 'data/klines'), max_bars=scanner_cfg.get('history_bars', 500)),
+        limiter=RateLimiter(scanner_cfg.get('max_weight_per_minute', 1200)),
+        interval=args.interval,
+        history_bars=scanner_cfg.get('history_bars', 500),
+        quote_asset=scanner_cfg.get('quote_asset', 'USDT'),
+        adx_threshold=config.get('strategy_params', {}).get('adx_filter_threshold', 25.0),
+        workers=scanner_cfg.get('workers', 8),
+        exclude=scanner_cfg.get('exclude', []),
+    )
+    candidates = scanner.scan()
+
+    print(f"{'Symbol':<14} | {'Price':>12} | {'ADX':>6} | {'DC90 High':>12} | {'Breakout (N)':>12}")
+    print("-" * 68)
+    for c in candidates[:args.top]:
+        print(f"{c['symbol']:<14} | {c['price']:>12.6g} | {c['adx']:>6.1f} | {c['dc_90_high']:>12.6g} | "
+              f"{c['breakout_n']:>12.2f}")
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(candidates, f, indent=2)
+    return candidates
+
+
+if __name__ == "__main__":
+    main()
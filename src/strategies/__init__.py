@@ -0,0 +1,5 @@
+from .registry import (
+    STRATEGIES, DEFAULT_STRATEGY, register_strategy, get_strategy_class, create_strategy,
+    strategy_params_for, required_indicators
+)
+from .shadow import ShadowEvaluator
@@ -0,0 +1,55 @@
+import copy
+
+from src.core.signal_manager import TurtleSignalManager, AdvancedTurtleManager
+
+DEFAULT_STRATEGY = "TurtleTrendFollowing"
+
+# config.yaml의 symbols[].strategy 값 -> signal manager 클래스
+STRATEGIES = {
+    "TurtleTrendFollowing": TurtleSignalManager,
+    "TurtleSignalManager": TurtleSignalManager,
+    "AdvancedTurtle": AdvancedTurtleManager,
+    "AdvancedTurtleManager": AdvancedTurtleManager,
+}
+
+
+def register_strategy(name, strategy_class):
+    """새 전략을 이름으로 등록한다. strategy_class는 generate_signal과 required_indicators를 제공해야 한다."""
+    STRATEGIES[name] = strategy_class
+
+
+def get_strategy_class(name=None):
+    name = name or DEFAULT_STRATEGY
+    try:
+        return STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown strategy: {name} (available: {', '.join(sorted(STRATEGIES))})")
+
+
+def create_strategy(name=None, params=None):
+    """이름과 파라미터로 signal manager 인스턴스를 생성한다. 알 수 없는 이름/파라미터는 예외."""
+    return get_strategy_class(name)(**(params or {}))
+
+
+def strategy_params_for(symbol_cfg, config):
+    """전역 strategy_params에 심볼별 strategy_params를 덮어쓴 파라미터."""
+    params = copy.deepcopy(config.get('strategy_params', {}))
+    params.update(symbol_cfg.get('strategy_params', {}))
+    return params
+
+
+def required_indicators(strategies, state=None):
+    """
+    전략들이 요구하는 지표의 합집합. state(심볼 상태)가 주어지면 전략의 indicators_for(state)를 사용한다.
+    하나라도 요구 지표를 선언하지 않았으면 None(전체 계산)을 반환한다.
+    """
+    union = set()
+    for strategy in strategies:
+        if state is not None and hasattr(strategy, 'indicators_for'):
+            declared = strategy.indicators_for(state)
+        else:
+            declared = getattr(strategy, 'required_indicators', None)
+        if not isinstance(declared, (set, frozenset, list, tuple)):
+            return None
+        union.update(declared)
+    return union
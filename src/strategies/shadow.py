@@ -0,0 +1,174 @@
+import copy
+import json
+import os
+import logging
+
+from src.strategies.registry import create_strategy
+from src.utils.snapshot_writer import AtomicSnapshotWriter
+
+logger = logging.getLogger("BATS-Shadow")
+
+
+def _new_position():
+    return {
+        "units_held": 0,
+        "entry_prices": [],
+        "unit_sizes": [],
+        "current_n": 0,
+        "system_mode": "S3",
+        "last_trade_result": None,
+    }
+
+
+def _new_stats():
+    return {"signals": 0, "trades": 0, "wins": 0, "realized_pnl": 0.0, "unrealized_pnl": 0.0}
+
+
+class ShadowEvaluator:
+    """
+    라이브 데이터로 후보 전략(파라미터 세트)을 주문 없이 평가하는 섀도 모드.
+
+    - 라이브 루프가 이미 계산한 지표의 마지막 봉만 각 섀도 전략에 넘긴다
+      (generate_signal의 list-of-dict 경로를 사용하므로 전략당 dict 조회 몇 번으로 끝난다).
+    - 섀도 전략마다 심볼별 가상 포지션(유닛, 진입가, 유닛 크기)과 실현/평가 손익을 추적한다.
+    - 가상 체결이 있을 때만 shadow_state.json에 백그라운드로 저장한다.
+
+    shadow_configs 예:
+        [{"name": "adx30", "strategy": "TurtleTrendFollowing",
+          "strategy_params": {"adx_filter_threshold": 30.0}, "symbols": ["BTCUSDT"]}]
+    """
+
+    def __init__(self, shadow_configs, risk, base_params=None, virtual_balance=10000.0,
+                 filepath="shadow_state.json", strategy_factory=create_strategy):
+        self.risk = risk
+        self.virtual_balance = virtual_balance
+        self.filepath = filepath
+        self.strategy_factory = strategy_factory
+        self.shadows = {}
+        self.positions = {}
+        self.stats = {}
+        self._load()
+        self.configure(shadow_configs, base_params)
+        self._writer = AtomicSnapshotWriter(filepath, fsync_interval=60.0) if filepath else None
+
+    def configure(self, shadow_configs, base_params=None):
+        """섀도 전략 목록을 (재)구성한다. 이름이 같은 섀도의 가상 포지션/통계는 유지된다."""
+        shadows = {}
+        for shadow_cfg in shadow_configs or []:
+            params = copy.deepcopy(base_params or {})
+            params.update(shadow_cfg.get("strategy_params", {}))
+            shadows[shadow_cfg["name"]] = {
+                "strategy": self.strategy_factory(shadow_cfg.get("strategy"), params),
+                "symbols": set(shadow_cfg["symbols"]) if shadow_cfg.get("symbols") else None,
+            }
+        self.shadows = shadows
+
+    def _applies(self, shadow, symbol):
+        return shadow["symbols"] is None or symbol in shadow["symbols"]
+
+    def _position(self, name, symbol):
+        return self.positions.setdefault(name, {}).setdefault(symbol, _new_position())
+
+    def required_indicators(self, symbol):
+        """이 심볼에 적용되는 섀도 전략들의 요구 지표 합집합. 선언하지 않은 전략이 있으면 None."""
+        union = set()
+        for name, shadow in self.shadows.items():
+            if not self._applies(shadow, symbol):
+                continue
+            strategy = shadow["strategy"]
+            if hasattr(strategy, "indicators_for"):
+                declared = strategy.indicators_for(self._position(name, symbol))
+            else:
+                declared = getattr(strategy, "required_indicators", None)
+            if not isinstance(declared, (set, frozenset, list, tuple)):
+                return None
+            union.update(declared)
+        return union
+
+    def on_bar(self, symbol, df_analyzed, current_price, n_value, n_avg_20):
+        """라이브 루프의 지표 계산 결과로 섀도 전략들을 한 번씩 평가한다. 주문은 내지 않는다."""
+        if not self.shadows:
+            return
+        if hasattr(df_analyzed, "iloc"):
+            last_bar = [df_analyzed.iloc[-1].to_dict()]
+        else:
+            last_bar = df_analyzed[-1:]
+
+        filled = False
+        for name, shadow in self.shadows.items():
+            if not self._applies(shadow, symbol):
+                continue
+            position = self._position(name, symbol)
+            stats = self.stats.setdefault(name, {}).setdefault(symbol, _new_stats())
+            sig = shadow["strategy"].generate_signal(last_bar, current_price, position)
+            if sig != "HOLD":
+                stats["signals"] += 1
+                filled |= self._apply_signal(name, symbol, sig, position, stats, current_price, n_value, n_avg_20)
+            stats["unrealized_pnl"] = sum((current_price - entry) * size for entry, size
+                                          in zip(position["entry_prices"], position["unit_sizes"]))
+        if filled:
+            self.save()
+
+    def _apply_signal(self, name, symbol, sig, position, stats, price, n_value, n_avg_20):
+        if sig in ("BUY", "PYRAMID"):
+            unit_size = self.risk.calculate_unit_size(self.virtual_balance, n_value, price, n_avg_20)
+            if unit_size <= 0:
+                return False
+            position["units_held"] += 1
+            position["entry_prices"].append(price)
+            position["unit_sizes"].append(unit_size)
+            position["current_n"] = float(n_value)
+            logger.info(f"[SHADOW {name}] [{symbol}] Virtual {sig}: {unit_size} at {price}")
+            return True
+
+        if sig == "EXIT" and position["units_held"] > 0:
+            pnl = sum((price - entry) * size for entry, size in zip(position["entry_prices"], position["unit_sizes"]))
+            stats["trades"] += 1
+            stats["wins"] += 1 if pnl > 0 else 0
+            stats["realized_pnl"] += pnl
+            position.update(units_held=0, entry_prices=[], unit_sizes=[], current_n=0,
+                            last_trade_result="win" if pnl > 0 else "loss")
+            logger.info(f"[SHADOW {name}] [{symbol}] Virtual EXIT at {price} (PnL: {pnl:.2f})")
+            return True
+        return False
+
+    def summary(self):
+        """섀도 전략별 성과 합계: trades, win_rate, realized_pnl, unrealized_pnl, open_units."""
+        rows = {}
+        for name in self.shadows:
+            symbol_stats = self.stats.get(name, {})
+            trades = sum(s["trades"] for s in symbol_stats.values())
+            wins = sum(s["wins"] for s in symbol_stats.values())
+            rows[name] = {
+                "trades": trades,
+                "win_rate": wins / trades * 100 if trades else 0.0,
+                "realized_pnl": sum(s["realized_pnl"] for s in symbol_stats.values()),
+                "unrealized_pnl": sum(s["unrealized_pnl"] for s in symbol_stats.values()),
+                "open_units": sum(p["units_held"] for p in self.positions.get(name, {}).values()),
+            }
+        return rows
+
+    # ── Persistence ──
+    def _load(self):
+        if not self.filepath or not os.path.exists(self.filepath):
+            return
+        try:
+            with open(self.filepath, "r") as f:
+                data = json.load(f)
+            self.positions = data.get("positions", {})
+            self.stats = data.get("stats", {})
+            logger.info(f"Shadow state loaded from {self.filepath}")
+        except Exception as e:
+            logger.warning(f"Failed to load shadow state {self.filepath}: {e}")
+
+    def save(self):
+        if self._writer:
+            self._writer.submit({"positions": self.positions, "stats": self.stats})
+
+    def close(self, timeout=None):
+        for name, row in self.summary().items():
+            logger.info(f"[SHADOW {name}] trades={row['trades']} win_rate={row['win_rate']:.1f}% "
+                        f"realized={row['realized_pnl']:.2f} unrealized={row['unrealized_pnl']:.2f}")
+        if self._writer:
+            self.save()
+            self._writer.close(timeout)
@@ -1,2 +1,44 @@
-from .config_loader import load_config, deep_merge
-from .persistence import JSONPersistence
+"""
+공용 유틸리티. src.core와 마찬가지로 속성에 처음 접근할 때 해당 모듈만 import 한다.
+"""
+import importlib
+
+_EXPORTS = {
+    'load_config': '.config_loader',
+    'deep_merge': '.config_loader',
+    'JSONPersistence': '.persistence',
+    'SQLitePersistence': '.sqlite_persistence',
+    'TradeJournal': '.journal',
+    'BackgroundWorker': '.background_worker',
+    'StartupTimer': '.startup',
+    'ConfigWatcher': '.config_watcher',
+    'validate_config': '.config_watcher',
+    'SingleFlight': '.single_flight',
+    'KlineStore': '.kline_store',
+    'RateLimiter': '.rate_limiter',
+    'resample_frame': '.resample',
+    'resample_columns': '.resample',
+    'KlineArchiveImporter': '.kline_archive',
+    'check_klines': '.kline_quality',
+    'repair_klines': '.kline_quality',
+    'SnapshotPublisher': '.live_snapshot',
+    'SnapshotReader': '.live_snapshot',
+    'HealthServer': '.health_server',
+    'SamplingProfiler': '.sampling_profiler',
+    'MemoryWatchdog': '.memory_watchdog',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
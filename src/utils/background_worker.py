@@ -0,0 +1,69 @@
+import queue
+import threading
+import time
+import logging
+
+logger = logging.getLogger("BATS-Worker")
+
+_STOP = object()
+
+
+class BackgroundWorker:
+    """
+    제출된 작업을 단일 백그라운드 스레드에서 제출 순서대로 실행하는 워커.
+    트레이딩 루프에서 디스크 I/O 등 느린 작업을 떼어내는 데 사용한다.
+    작업 중 발생한 예외는 로그로만 남기며 이후 작업은 계속 실행된다.
+    """
+
+    def __init__(self, name="BackgroundWorker", max_queue_size=0):
+        self.name = name
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._closed = False
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def submit(self, fn, *args, **kwargs):
+        if self._closed:
+            raise RuntimeError(f"{self.name} is closed")
+        self._queue.put((fn, args, kwargs))
+
+    def flush(self, timeout=None) -> bool:
+        """지금까지 제출된 작업이 모두 끝날 때까지 대기한다."""
+        if timeout is None:
+            self._queue.join()
+            return True
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout=None) -> bool:
+        """남은 작업을 모두 실행한 뒤 스레드를 종료한다."""
+        if self._closed:
+            return True
+        self._closed = True
+        flushed = self.flush(timeout)
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if not flushed:
+            logger.warning(f"{self.name} closed with {self.queue_depth} unfinished tasks.")
+        return flushed
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                fn, args, kwargs = item
+                fn(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{self.name} task failed: {e}")
+            finally:
+                self._queue.task_done()
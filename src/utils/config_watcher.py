@@ -0,0 +1,122 @@
+import os
+import threading
+import logging
+
+from src.utils.config_loader import load_config
+
+logger = logging.getLogger("BATS-Config")
+
+
+def validate_config(config):
+    """병합된 설정의 구조를 검사하고 오류 메시지 목록을 반환한다 (비어 있으면 유효)."""
+    errors = []
+    if not config:
+        return ["configuration is empty"]
+
+    symbols = config.get('symbols', [])
+    if not isinstance(symbols, list):
+        errors.append("symbols must be a list")
+        symbols = []
+    seen = set()
+    for i, symbol_cfg in enumerate(symbols):
+        if not isinstance(symbol_cfg, dict) or not isinstance(symbol_cfg.get('name'), str):
+            errors.append(f"symbols[{i}] must have a string 'name'")
+            continue
+        if symbol_cfg['name'] in seen:
+            errors.append(f"duplicate symbol: {symbol_cfg['name']}")
+        seen.add(symbol_cfg['name'])
+        if not isinstance(symbol_cfg.get('timeframe', '1h'), str):
+            errors.append(f"{symbol_cfg['name']}: timeframe must be a string")
+
+    if not isinstance(config.get('strategy_params', {}), dict):
+        errors.append("strategy_params must be a mapping")
+
+    risk = config.get('risk', {})
+    if not isinstance(risk, dict):
+        errors.append("risk must be a mapping")
+    else:
+        for key in ('max_portfolio_heat', 'unit_risk_percent'):
+            value = risk.get(key)
+            if value is not None and (not isinstance(value, (int, float)) or not 0 < value <= 1):
+                errors.append(f"risk.{key} must be in (0, 1]")
+
+    polling_interval = config.get('system', {}).get('polling_interval', 60)
+    if not isinstance(polling_interval, int) or polling_interval <= 0:
+        errors.append("system.polling_interval must be a positive integer")
+    return errors
+
+
+class ConfigWatcher:
+    """
+    config.yaml / config.local.yaml 변경 감시.
+
+    - 백그라운드 스레드가 poll_interval 초마다 두 파일의 mtime/size를 확인한다.
+    - 변경되면 load_config로 다시 병합하고 validate_config(및 validator)를 통과한 경우에만
+      대기 설정으로 보관한다. 파싱/검증은 모두 감시 스레드에서 수행된다.
+    - 트레이딩 루프는 반복 사이에 poll()로 대기 설정을 가져가 한 번에 교체한다.
+    """
+
+    def __init__(self, base_path="config.yaml", local_path="config.local.yaml",
+                 poll_interval=5.0, validator=None):
+        self.base_path = base_path
+        self.local_path = local_path
+        self.poll_interval = poll_interval
+        self.validator = validator
+        self._fingerprint = self._stat()
+        self._lock = threading.Lock()
+        self._pending = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _stat(self):
+        fingerprint = []
+        for path in (self.base_path, self.local_path):
+            try:
+                st = os.stat(path)
+                fingerprint.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ConfigWatcher", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.poll_interval + 1)
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            self.check()
+
+    def check(self) -> bool:
+        """파일이 바뀌었으면 다시 읽고 검증한다. 새 설정이 대기열에 올라가면 True."""
+        fingerprint = self._stat()
+        if fingerprint == self._fingerprint:
+            return False
+        self._fingerprint = fingerprint
+
+        try:
+            config = load_config(self.base_path, self.local_path)
+            errors = validate_config(config)
+            if not errors and self.validator:
+                self.validator(config)
+        except Exception as e:
+            errors = [str(e)]
+        if errors:
+            logger.error(f"Config change rejected, keeping current configuration: {'; '.join(errors)}")
+            return False
+
+        with self._lock:
+            self._pending = config
+        logger.info("Config change detected and validated, will apply before next iteration.")
+        return True
+
+    def poll(self):
+        """검증된 새 설정이 있으면 반환하고 비운다. 없으면 None."""
+        with self._lock:
+            config, self._pending = self._pending, None
+        return config
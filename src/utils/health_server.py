@@ -0,0 +1,86 @@
+import json
+import threading
+import time
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger("BATS-Health")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "BATS-Health/1"
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0].rstrip('/') or '/health'
+        if path == '/health':
+            code, body = self.server.owner.health()
+        elif path == '/status':
+            code, body = 200, self.server.owner.status()
+        else:
+            code, body = 404, {'error': f"unknown path {path}"}
+        payload = json.dumps(body, separators=(',', ':'), default=str).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # 고빈도 폴링이 로그를 채우지 않도록 요청 로그는 남기지 않는다
+        pass
+
+
+class HealthServer:
+    """
+    로컬 상태 확인용 HTTP 엔드포인트 (전용 스레드, ThreadingHTTPServer).
+
+    - GET /health: 마지막 성공 반복 이후 경과 시간으로 ok(200) / stale·starting(503) 판정
+    - GET /status: 마지막 반복이 끝날 때 만들어 둔 상태 스냅샷 전체
+    응답은 status_provider()가 돌려주는 캐시된 dict만 사용한다. 요청 처리 중에
+    거래소 API, 디스크, 트레이딩 루프 상태에는 접근하지 않는다.
+    """
+
+    def __init__(self, status_provider, host="127.0.0.1", port=8787, stale_after=180.0, clock=time.time):
+        self.status_provider = status_provider
+        self.stale_after = stale_after
+        self.clock = clock
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.owner = self
+        self._thread = None
+
+    @property
+    def address(self):
+        return self._server.server_address
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="HealthServer", daemon=True)
+            self._thread.start()
+            logger.info(f"Health endpoint listening on http://{self.address[0]}:{self.address[1]}")
+
+    def close(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join(5)
+        self._server.server_close()
+
+    def status(self):
+        return self.status_provider() or {}
+
+    def health(self):
+        status = self.status()
+        last_success = status.get('last_success_at')
+        body = {
+            'pid': status.get('pid'),
+            'iteration': status.get('iteration', 0),
+            'last_success_at': last_success,
+            'last_error': status.get('last_error'),
+        }
+        if last_success is None:
+            return 503, dict(body, status='starting')
+        body['age'] = round(self.clock() - last_success, 1)
+        if body['age'] > self.stale_after:
+            return 503, dict(body, status='stale')
+        return 200, dict(body, status='ok')
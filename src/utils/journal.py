@@ -3,6 +3,10 @@ import os
 import logging
 from datetime import datetime, timezone
 
+from src.utils.snapshot_writer import write_json_atomic
+from src.utils.journal_store import MonthlyJSONJournalStore, AppendOnlyJournalStore
+from src.utils.journal_analytics import JournalAnalytics
+
 logger = logging.getLogger("BATS-Journal")
 
 
@@ -10,39 +14,82 @@ class TradeJournal:
     """
     Manages trade journal entries per docs/TRADE_JOURNAL_DESIGN.md.
     Auto-records basic info & strategy data on entry/pyramid/exit.
+
+    backend:
+        - "json": 월별 JSON 배열 파일 (기존 방식, 청산마다 월 파일 전체 재기록)
+        - "jsonl": append-only JSONL + trade_id 인덱스 (기록 O(1), 전체 기간 조회 지원)
+    analytics=True이면 청산마다 JournalAnalytics 집계를 갱신한다 (journal.analytics.query(...)).
+
+    진행 중인 거래는 심볼별로 관리되며(다중 심볼 동시 보유), 재시작 시 이어서 기록할 수 있도록
+    journal_dir/active.json에 저장된다. symbol 인자를 생략하면 진행 중인 거래가 하나일 때 그 거래를 사용한다.
     """
 
-    def __init__(self, journal_dir="logs/journal"):
-        self.journal_dir = journal_dir
-        os.makedirs(journal_dir, exist_ok=True)
-        self._active_trade = None
-        self._trade_counter = 0
+    ACTIVE_FILE = "active.json"
 
-    def _get_filepath(self, dt):
-        return os.path.join(self.journal_dir, f"{dt.strftime('%Y-%m')}.json")
+    STORES = {
+        "json": MonthlyJSONJournalStore,
+        "jsonl": AppendOnlyJournalStore,
+    }
 
-    def _load_month(self, filepath):
-        if not os.path.exists(filepath):
-            return []
-        with open(filepath, "r") as f:
-            return json.load(f)
+    def __init__(self, journal_dir="logs/journal", backend="json", analytics=False):
+        self.journal_dir = journal_dir
+        if backend not in self.STORES:
+            raise ValueError(f"Unknown journal backend: {backend}")
+        self.store = self.STORES[backend](journal_dir)
+        self.analytics = JournalAnalytics(self.store, journal_dir) if analytics else None
+        self._active_path = os.path.join(journal_dir, self.ACTIVE_FILE)
+        self._active_trades = self._load_active()
+        self._last_symbol = next(reversed(self._active_trades), None)
+        self._trade_counter = 0
 
-    def _save_month(self, filepath, entries):
-        with open(filepath, "w") as f:
-            json.dump(entries, f, indent=2, ensure_ascii=False)
+    def _load_active(self):
+        if not os.path.exists(self._active_path):
+            return {}
+        try:
+            with open(self._active_path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Journal: Failed to load active trades: {e}")
+            return {}
+
+    def _save_active(self):
+        try:
+            if not self._active_trades:
+                if os.path.exists(self._active_path):
+                    os.remove(self._active_path)
+                return
+            write_json_atomic(self._active_path, self._active_trades, fsync=False, indent=2)
+        except Exception as e:
+            logger.error(f"Journal: Failed to save active trades: {e}")
+
+    def _resolve_symbol(self, symbol):
+        if symbol is not None:
+            return symbol if symbol in self._active_trades else None
+        if len(self._active_trades) == 1:
+            return next(iter(self._active_trades))
+        return None
 
     def _generate_trade_id(self, dt):
-        self._trade_counter += 1
-        return f"T-{dt.strftime('%Y%m%d')}-{self._trade_counter:03d}"
+        # 재시작 후 카운터가 초기화되어도 기존 거래와 ID가 겹치지 않도록 한다.
+        while True:
+            self._trade_counter += 1
+            trade_id = f"T-{dt.strftime('%Y%m%d')}-{self._trade_counter:03d}"
+            active_ids = {t["trade_id"] for t in self._active_trades.values()}
+            if trade_id not in active_ids and trade_id not in self.store:
+                return trade_id
 
     # ── Entry ──
     def record_entry(self, symbol, direction, entry_price, unit_size, n_value,
                      system_mode, entry_trigger, ema_200, skip_rule_applied,
-                     volatility_cap_applied, balance):
-        now = datetime.now(timezone.utc)
+                     volatility_cap_applied, balance, stop_loss_level=None, timestamp=None):
+        """stop_loss_level: 전략의 손절가. 생략하면 기본 터틀 규칙(진입가 - 2N)."""
+        now = timestamp or datetime.now(timezone.utc)
         trade_id = self._generate_trade_id(now)
+        if symbol in self._active_trades:
+            logger.warning(f"Journal: {symbol} already has an active trade "
+                           f"[{self._active_trades[symbol]['trade_id']}], replacing it.")
 
-        self._active_trade = {
+        trade = {
             # [가] Basic Info
             "trade_id": trade_id,
             "symbol": symbol,
@@ -67,7 +114,7 @@ class TradeJournal:
             "unit_size": unit_size,
             "pyramid_entries": [{"price": entry_price, "time": now.isoformat()}],
             "max_units": 1,
-            "stop_loss_level": entry_price - (2 * n_value),
+            "stop_loss_level": stop_loss_level if stop_loss_level is not None else entry_price - (2 * n_value),
             "ema_200_at_entry": ema_200,
             "volatility_cap": volatility_cap_applied,
             "skip_rule": skip_rule_applied,
@@ -82,104 +129,128 @@ class TradeJournal:
             "what_went_well": None,
             "what_to_improve": None,
         }
+        self._active_trades[symbol] = trade
+        self._last_symbol = symbol
+        self._save_active()
 
         logger.info(f"Journal: Entry recorded [{trade_id}] {symbol} {direction} @ {entry_price}")
         return trade_id
 
     # ── Pyramid ──
-    def record_pyramid(self, price, new_n=None):
-        if not self._active_trade:
+    def record_pyramid(self, price, new_n=None, symbol=None, stop_loss_level=None, timestamp=None):
+        """stop_loss_level: 전략의 새 손절가. 생략하면 new_n 기준 기본 규칙(진입가 - 2N)."""
+        symbol = self._resolve_symbol(symbol)
+        if symbol is None:
             logger.warning("Journal: No active trade to add pyramid.")
             return
+        trade = self._active_trades[symbol]
 
-        self._active_trade["total_units"] += 1
-        self._active_trade["max_units"] = self._active_trade["total_units"]
-        self._active_trade["pyramid_entries"].append({
+        trade["total_units"] += 1
+        trade["max_units"] = trade["total_units"]
+        trade["pyramid_entries"].append({
             "price": price,
-            "time": datetime.now(timezone.utc).isoformat()
+            "time": (timestamp or datetime.now(timezone.utc)).isoformat()
         })
 
-        # Update stop loss to last entry - 2N
-        if new_n:
-            self._active_trade["stop_loss_level"] = price - (2 * new_n)
+        # Update stop loss to the strategy's level (default: last entry - 2N)
+        if stop_loss_level is not None:
+            trade["stop_loss_level"] = stop_loss_level
+        elif new_n:
+            trade["stop_loss_level"] = price - (2 * new_n)
+        self._last_symbol = symbol
+        self._save_active()
 
-        logger.info(f"Journal: Pyramid #{self._active_trade['total_units']} @ {price}")
+        logger.info(f"Journal: Pyramid #{trade['total_units']} {symbol} @ {price}")
 
     # ── Exit ──
     def record_exit(self, exit_price, exit_trigger, fees=0,
-                    signal_followed=True, deviation_reason=None):
-        if not self._active_trade:
+                    signal_followed=True, deviation_reason=None, symbol=None, timestamp=None):
+        symbol = self._resolve_symbol(symbol)
+        if symbol is None:
             logger.warning("Journal: No active trade to close.")
             return None
+        trade = self._active_trades[symbol]
 
-        now = datetime.now(timezone.utc)
-        entry_time = datetime.fromisoformat(self._active_trade["entry_time"])
+        now = timestamp or datetime.now(timezone.utc)
+        entry_time = datetime.fromisoformat(trade["entry_time"])
         holding = now - entry_time
 
         # PnL calculation
-        direction = self._active_trade["direction"]
-        total_qty = self._active_trade["position_size"] * self._active_trade["total_units"]
+        direction = trade["direction"]
+        total_qty = trade["position_size"] * trade["total_units"]
 
         if direction == "LONG":
-            avg_entry = sum(p["price"] for p in self._active_trade["pyramid_entries"]) / len(self._active_trade["pyramid_entries"])
+            avg_entry = sum(p["price"] for p in trade["pyramid_entries"]) / len(trade["pyramid_entries"])
             pnl = (exit_price - avg_entry) * total_qty
         else:
-            avg_entry = sum(p["price"] for p in self._active_trade["pyramid_entries"]) / len(self._active_trade["pyramid_entries"])
+            avg_entry = sum(p["price"] for p in trade["pyramid_entries"]) / len(trade["pyramid_entries"])
             pnl = (avg_entry - exit_price) * total_qty
 
-        balance = self._active_trade["balance_at_entry"]
+        balance = trade["balance_at_entry"]
         pnl_percent = (pnl / balance * 100) if balance > 0 else 0
 
-        # Stop loss compliance check
-        stop_level = self._active_trade["stop_loss_level"]
+        # Stop loss compliance check (하드 스톱으로 청산했다면 손절 규칙을 지킨 것)
+        stop_level = trade["stop_loss_level"]
+        hard_stop = str(exit_trigger).startswith("hard_stop")
         if direction == "LONG":
-            stop_honored = exit_price >= stop_level or exit_trigger == "hard_stop_2n"
+            stop_honored = exit_price >= stop_level or hard_stop
         else:
-            stop_honored = exit_price <= stop_level or exit_trigger == "hard_stop_2n"
+            stop_honored = exit_price <= stop_level or hard_stop
 
         # Fill exit fields
-        self._active_trade["exit_time"] = now.isoformat()
-        self._active_trade["exit_price"] = exit_price
-        self._active_trade["pnl"] = round(pnl, 2)
-        self._active_trade["pnl_percent"] = round(pnl_percent, 4)
-        self._active_trade["fees"] = fees
-        self._active_trade["holding_period"] = str(holding)
-        self._active_trade["exit_trigger"] = exit_trigger
-        self._active_trade["signal_followed"] = signal_followed
-        self._active_trade["deviation_reason"] = deviation_reason
-        self._active_trade["stop_loss_honored"] = stop_honored
+        trade["exit_time"] = now.isoformat()
+        trade["exit_price"] = exit_price
+        trade["pnl"] = round(pnl, 2)
+        trade["pnl_percent"] = round(pnl_percent, 4)
+        trade["fees"] = fees
+        trade["holding_period"] = str(holding)
+        trade["exit_trigger"] = exit_trigger
+        trade["signal_followed"] = signal_followed
+        trade["deviation_reason"] = deviation_reason
+        trade["stop_loss_honored"] = stop_honored
 
         # Persist to monthly file
-        filepath = self._get_filepath(now)
-        entries = self._load_month(filepath)
-        entries.append(self._active_trade)
-        self._save_month(filepath, entries)
+        self.store.append(trade, now)
+        if self.analytics:
+            self.analytics.ingest(trade)
 
-        trade_id = self._active_trade["trade_id"]
-        result = self._active_trade.copy()
-        self._active_trade = None
+        trade_id = trade["trade_id"]
+        result = trade.copy()
+        del self._active_trades[symbol]
+        if self._last_symbol == symbol:
+            self._last_symbol = next(reversed(self._active_trades), None)
+        self._save_active()
 
         logger.info(f"Journal: Exit recorded [{trade_id}] PnL: {pnl:.2f} ({pnl_percent:.2f}%)")
         return result
 
     # ── Review (manual) ──
     def add_review(self, trade_id, what_went_well, what_to_improve):
-        """Update the review fields for a completed trade."""
-        now = datetime.now(timezone.utc)
-        filepath = self._get_filepath(now)
-        entries = self._load_month(filepath)
-
-        for entry in entries:
-            if entry["trade_id"] == trade_id:
-                entry["what_went_well"] = what_went_well
-                entry["what_to_improve"] = what_to_improve
-                self._save_month(filepath, entries)
-                logger.info(f"Journal: Review added to [{trade_id}]")
-                return True
+        """Update the review fields for a completed trade (any month)."""
+        updated = self.store.update(trade_id, {
+            "what_went_well": what_went_well,
+            "what_to_improve": what_to_improve,
+        })
+        if updated:
+            logger.info(f"Journal: Review added to [{trade_id}]")
+            return True
 
         logger.warning(f"Journal: Trade [{trade_id}] not found.")
         return False
 
+    # ── Lookup ──
+    def get_trade(self, trade_id):
+        """완료된 거래를 trade_id로 조회한다. 없으면 None."""
+        return self.store.get(trade_id)
+
+    def get_active_trade(self, symbol):
+        return self._active_trades.get(symbol)
+
+    @property
+    def active_trades(self):
+        return dict(self._active_trades)
+
     @property
     def active_trade(self):
-        return self._active_trade
+        """가장 최근에 진입/피라미딩한 진행 중 거래 (단일 심볼 사용 시 호환용)."""
+        return self._active_trades.get(self._last_symbol) if self._last_symbol else None
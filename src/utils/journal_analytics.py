@@ -0,0 +1,199 @@
+import json
+import os
+import logging
+from datetime import datetime, timezone
+
+from src.utils.snapshot_writer import write_json_atomic
+
+logger = logging.getLogger("BATS-Journal")
+
+GROUP_KEYS = ("month", "symbol", "system")
+
+_SUM_FIELDS = (
+    "trades", "wins", "pnl", "gross_profit", "gross_loss",
+    "r_sum", "r_count", "holding_seconds", "stop_checked", "stop_honored",
+)
+
+
+def _empty_cell():
+    return {field: 0 for field in _SUM_FIELDS}
+
+
+def r_multiple(entry):
+    """초기 리스크(첫 유닛 기준 2N 손절폭 × 유닛 크기) 대비 손익 배수. 계산 불가 시 None."""
+    n_value = entry.get("n_at_entry") or 0
+    unit_size = entry.get("unit_size") or entry.get("position_size") or 0
+    initial_risk = 2 * n_value * unit_size
+    if initial_risk <= 0 or entry.get("pnl") is None:
+        return None
+    return entry["pnl"] / initial_risk
+
+
+class JournalAnalytics:
+    """
+    거래 일지에 대한 집계 질의 계층.
+
+    청산된 거래가 들어올 때마다 (월, 심볼, 시스템) 단위 집계 셀을 갱신해 aggregates.json에 저장한다.
+    질의는 원본 거래를 다시 읽지 않고 집계 셀만 합산하므로 거래 수와 무관하게 즉시 응답한다.
+    집계 파일이 없으면 최초 1회 store 전체를 스캔해 재구성한다.
+    """
+
+    AGGREGATES_FILE = "aggregates.json"
+
+    def __init__(self, store, journal_dir):
+        self.store = store
+        self.path = os.path.join(journal_dir, self.AGGREGATES_FILE)
+        self._cells = {}
+        self._trade_count = 0
+        # 반영한 store 거래 수 (청산 정보가 없어 집계에서 제외된 거래 포함). store 크기와 비교한다.
+        self._entry_count = 0
+        if not self._load() or self._is_stale():
+            self.rebuild()
+
+    # ── Maintenance ──
+    def _load(self):
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            self._cells = {tuple(cell["key"]): cell["values"] for cell in data["cells"]}
+            self._trade_count = data["trade_count"]
+            self._entry_count = data.get("entry_count", -1)  # 이전 형식 파일은 한 번 재구성한다
+            return True
+        except Exception as e:
+            logger.warning(f"Journal: Failed to load aggregates ({e}), rebuilding.")
+            return False
+
+    def _is_stale(self):
+        # 인덱스를 가진 store(jsonl)는 거래 수를 스캔 없이 알 수 있으므로 누락 여부를 확인한다.
+        if hasattr(self.store, "__len__") and len(self.store) != self._entry_count:
+            logger.info("Journal: Aggregates out of date with journal store, rebuilding.")
+            return True
+        return False
+
+    def _save(self):
+        data = {
+            "trade_count": self._trade_count,
+            "entry_count": self._entry_count,
+            "cells": [{"key": list(key), "values": values} for key, values in self._cells.items()],
+        }
+        write_json_atomic(self.path, data, fsync=False, indent=None)
+
+    def rebuild(self):
+        """store의 모든 거래로 집계를 처음부터 다시 만든다."""
+        self._cells = {}
+        self._trade_count = 0
+        self._entry_count = 0
+        for entry in self.store.iter_entries():
+            self._apply(entry)
+        self._save()
+        logger.info(f"Journal: Aggregates rebuilt from {self._trade_count} trades")
+
+    def ingest(self, entry):
+        """청산 완료된 거래 하나를 집계에 반영한다."""
+        self._apply(entry)
+        self._save()
+
+    def _apply(self, entry):
+        self._entry_count += 1
+        if entry.get("exit_time") is None or entry.get("pnl") is None:
+            return
+        key = (entry["exit_time"][:7], entry.get("symbol"), entry.get("system"))
+        cell = self._cells.setdefault(key, _empty_cell())
+
+        pnl = entry["pnl"]
+        cell["trades"] += 1
+        cell["pnl"] += pnl
+        if pnl > 0:
+            cell["wins"] += 1
+            cell["gross_profit"] += pnl
+        else:
+            cell["gross_loss"] += -pnl
+
+        r = r_multiple(entry)
+        if r is not None:
+            cell["r_sum"] += r
+            cell["r_count"] += 1
+
+        try:
+            held = datetime.fromisoformat(entry["exit_time"]) - datetime.fromisoformat(entry["entry_time"])
+            cell["holding_seconds"] += held.total_seconds()
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        if entry.get("stop_loss_honored") is not None:
+            cell["stop_checked"] += 1
+            cell["stop_honored"] += 1 if entry["stop_loss_honored"] else 0
+
+        self._trade_count += 1
+
+    @property
+    def trade_count(self):
+        return self._trade_count
+
+    # ── Query ──
+    def query(self, symbols=None, systems=None, since=None, until=None, group_by=("symbol",)):
+        """집계 셀을 필터링/그룹핑해 지표를 반환한다.
+
+        Args:
+            symbols: 포함할 심볼 목록 (None이면 전체)
+            systems: 포함할 시스템(S1/S2/S3) 목록 (None이면 전체)
+            since, until: "YYYY-MM" 월 범위 (양끝 포함)
+            group_by: GROUP_KEYS 중 그룹핑 키 (빈 튜플이면 전체 합계 1행)
+
+        Returns:
+            list[dict]: 그룹 키 + trades, win_rate, total_pnl, avg_pnl, avg_r,
+                        avg_holding_hours, profit_factor, stop_honored_ratio
+        """
+        for key in group_by:
+            if key not in GROUP_KEYS:
+                raise ValueError(f"Unknown group_by key: {key}")
+        symbols = set(symbols) if symbols else None
+        systems = set(systems) if systems else None
+
+        groups = {}
+        for (month, symbol, system), cell in self._cells.items():
+            if symbols is not None and symbol not in symbols:
+                continue
+            if systems is not None and system not in systems:
+                continue
+            if since is not None and month < since:
+                continue
+            if until is not None and month > until:
+                continue
+            values = {"month": month, "symbol": symbol, "system": system}
+            group_key = tuple(values[k] for k in group_by)
+            total = groups.setdefault(group_key, _empty_cell())
+            for field in _SUM_FIELDS:
+                total[field] += cell[field]
+
+        rows = []
+        for group_key, total in sorted(groups.items(), key=lambda kv: tuple(str(k) for k in kv[0])):
+            row = dict(zip(group_by, group_key))
+            row.update(self._metrics(total))
+            rows.append(row)
+        return rows
+
+    def last_months(self, months=12, now=None, **kwargs):
+        """최근 N개월(현재 월 포함)에 대한 query."""
+        now = now or datetime.now(timezone.utc)
+        year, month = now.year, now.month - (months - 1)
+        while month <= 0:
+            month += 12
+            year -= 1
+        return self.query(since=f"{year:04d}-{month:02d}", **kwargs)
+
+    @staticmethod
+    def _metrics(total):
+        trades = total["trades"]
+        return {
+            "trades": trades,
+            "win_rate": total["wins"] / trades * 100 if trades else 0.0,
+            "total_pnl": total["pnl"],
+            "avg_pnl": total["pnl"] / trades if trades else 0.0,
+            "avg_r": total["r_sum"] / total["r_count"] if total["r_count"] else None,
+            "avg_holding_hours": total["holding_seconds"] / trades / 3600 if trades else 0.0,
+            "profit_factor": total["gross_profit"] / total["gross_loss"] if total["gross_loss"] else None,
+            "stop_honored_ratio": total["stop_honored"] / total["stop_checked"] if total["stop_checked"] else None,
+        }
@@ -0,0 +1,215 @@
+import glob
+import json
+import os
+import threading
+import logging
+from datetime import datetime, timezone
+
+logger = logging.getLogger("BATS-Journal")
+
+
+class MonthlyJSONJournalStore:
+    """
+    기존 저장 방식: 월별 JSON 배열 파일(logs/journal/YYYY-MM.json).
+    기록 시 해당 월 파일 전체를 다시 쓰며, 조회는 모든 월 파일을 선형 탐색한다.
+    """
+
+    def __init__(self, journal_dir):
+        self.journal_dir = journal_dir
+        os.makedirs(journal_dir, exist_ok=True)
+
+    def _get_filepath(self, dt):
+        return os.path.join(self.journal_dir, f"{dt.strftime('%Y-%m')}.json")
+
+    def _month_files(self):
+        return sorted(glob.glob(os.path.join(self.journal_dir, "[0-9][0-9][0-9][0-9]-[0-9][0-9].json")))
+
+    def _load_month(self, filepath):
+        if not os.path.exists(filepath):
+            return []
+        with open(filepath, "r") as f:
+            return json.load(f)
+
+    def _save_month(self, filepath, entries):
+        with open(filepath, "w") as f:
+            json.dump(entries, f, indent=2, ensure_ascii=False)
+
+    def append(self, entry, dt):
+        filepath = self._get_filepath(dt)
+        entries = self._load_month(filepath)
+        entries.append(entry)
+        self._save_month(filepath, entries)
+
+    def get(self, trade_id):
+        for filepath in reversed(self._month_files()):
+            for entry in self._load_month(filepath):
+                if entry["trade_id"] == trade_id:
+                    return entry
+        return None
+
+    def update(self, trade_id, fields, dt=None):
+        for filepath in reversed(self._month_files()):
+            entries = self._load_month(filepath)
+            for entry in entries:
+                if entry["trade_id"] == trade_id:
+                    entry.update(fields)
+                    self._save_month(filepath, entries)
+                    return True
+        return False
+
+    def __contains__(self, trade_id):
+        return self.get(trade_id) is not None
+
+    def iter_entries(self):
+        for filepath in self._month_files():
+            yield from self._load_month(filepath)
+
+
+class AppendOnlyJournalStore:
+    """
+    Append-only JSONL 저장 방식: 월별 logs/journal/YYYY-MM.jsonl + trade_id 인덱스(index.jsonl).
+
+    - 각 줄은 {"op": "trade", "data": {...}} 또는 {"op": "update", "trade_id": ..., "fields": {...}}
+    - 기록/회고 추가는 파일 끝에 한 줄을 덧붙이는 O(1) 연산이다 (기존 줄은 다시 쓰지 않는다).
+    - 인덱스는 trade_id -> [(파일, offset, length), ...] 이며 메모리 dict로 유지되어
+      모든 월에 걸친 조회가 해당 줄만 seek 해서 읽는다.
+    - 시작 시 인덱스가 데이터 파일보다 뒤처져 있으면(기록 도중 중단) 남은 꼬리 부분만 다시 스캔한다.
+    """
+
+    INDEX_FILE = "index.jsonl"
+
+    def __init__(self, journal_dir):
+        self.journal_dir = journal_dir
+        os.makedirs(journal_dir, exist_ok=True)
+        self._index_path = os.path.join(journal_dir, self.INDEX_FILE)
+        self._lock = threading.Lock()
+        self._index = {}
+        self._indexed_end = {}
+        self._load_index()
+        self._recover_unindexed()
+
+    def _get_filename(self, dt):
+        return f"{dt.strftime('%Y-%m')}.jsonl"
+
+    def _month_files(self):
+        return sorted(os.path.basename(p) for p in
+                      glob.glob(os.path.join(self.journal_dir, "[0-9][0-9][0-9][0-9]-[0-9][0-9].jsonl")))
+
+    # ── Index ──
+    def _load_index(self):
+        if not os.path.exists(self._index_path):
+            return
+        valid_end = 0
+        with open(self._index_path, "rb") as f:
+            for raw in f:
+                try:
+                    if not raw.endswith(b"\n"):
+                        raise ValueError("partial line")
+                    rec = json.loads(raw)
+                except ValueError:
+                    break  # 마지막 줄이 잘린 경우: 해당 레코드는 복구 스캔에서 다시 인덱싱한다
+                self._add_to_index(rec["trade_id"], rec["file"], rec["offset"], rec["length"])
+                valid_end += len(raw)
+        if valid_end < os.path.getsize(self._index_path):
+            # 잘린 줄 뒤에 새 인덱스 레코드가 이어 붙지 않도록 마지막 완전한 줄까지 자른다.
+            with open(self._index_path, "r+b") as f:
+                f.truncate(valid_end)
+            logger.warning(f"Journal: Truncated partial index record at offset {valid_end}")
+
+    def _add_to_index(self, trade_id, filename, offset, length):
+        self._index.setdefault(trade_id, []).append((filename, offset, length))
+        self._indexed_end[filename] = max(self._indexed_end.get(filename, 0), offset + length)
+
+    def _recover_unindexed(self):
+        recovered = 0
+        for filename in self._month_files():
+            path = os.path.join(self.journal_dir, filename)
+            start = self._indexed_end.get(filename, 0)
+            if os.path.getsize(path) <= start:
+                continue
+            truncated = False
+            with open(path, "rb") as f:
+                f.seek(start)
+                offset = start
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        truncated = True  # 기록 중 잘린 줄
+                        break
+                    rec = json.loads(raw)
+                    trade_id = rec["data"]["trade_id"] if rec["op"] == "trade" else rec["trade_id"]
+                    self._write_index(trade_id, filename, offset, len(raw))
+                    offset += len(raw)
+                    recovered += 1
+            if truncated:
+                # 잘린 줄 뒤에 새 레코드가 이어 붙지 않도록 마지막 완전한 줄까지 자른다.
+                with open(path, "r+b") as f:
+                    f.truncate(offset)
+                logger.warning(f"Journal: Truncated partial record in {filename} at offset {offset}")
+        if recovered:
+            logger.info(f"Journal: Recovered {recovered} unindexed records")
+
+    def _write_index(self, trade_id, filename, offset, length):
+        rec = {"trade_id": trade_id, "file": filename, "offset": offset, "length": length}
+        with open(self._index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(rec) + "\n")
+        self._add_to_index(trade_id, filename, offset, length)
+
+    # ── Write ──
+    def _append_record(self, trade_id, record, dt):
+        filename = self._get_filename(dt)
+        data = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            with open(os.path.join(self.journal_dir, filename), "ab") as f:
+                offset = f.tell()
+                f.write(data)
+            self._write_index(trade_id, filename, offset, len(data))
+
+    def append(self, entry, dt):
+        self._append_record(entry["trade_id"], {"op": "trade", "data": entry}, dt)
+
+    def update(self, trade_id, fields, dt=None):
+        if trade_id not in self._index:
+            return False
+        self._append_record(trade_id, {"op": "update", "trade_id": trade_id, "fields": fields},
+                            dt or datetime.now(timezone.utc))
+        return True
+
+    # ── Read ──
+    def _read_at(self, filename, offset, length):
+        with open(os.path.join(self.journal_dir, filename), "rb") as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def get(self, trade_id):
+        locations = self._index.get(trade_id)
+        if not locations:
+            return None
+        entry = None
+        for filename, offset, length in locations:
+            rec = self._read_at(filename, offset, length)
+            if rec["op"] == "trade":
+                entry = rec["data"]
+            elif entry is not None:
+                entry.update(rec["fields"])
+        return entry
+
+    def __contains__(self, trade_id):
+        return trade_id in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def iter_entries(self):
+        """모든 거래를 기록 순서대로 반환한다 (회고 등 update 레코드 병합)."""
+        entries = {}
+        for filename in self._month_files():
+            with open(os.path.join(self.journal_dir, filename), "rb") as f:
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break
+                    rec = json.loads(raw)
+                    if rec["op"] == "trade":
+                        entries[rec["data"]["trade_id"]] = rec["data"]
+                    elif rec["trade_id"] in entries:
+                        entries[rec["trade_id"]].update(rec["fields"])
+        return iter(entries.values())
@@ -0,0 +1,191 @@
+"""
+Binance 공개 캔들 아카이브(data.binance.vision) 일괄 임포터.
+
+    python -m src.utils.kline_archive <archive_dir> [--store data/klines] [--symbols BTCUSDT ETHUSDT]
+
+<archive_dir> 아래(하위 폴더 포함)의 SYMBOL-INTERVAL-YYYY-MM(-DD).zip / .csv 파일을 읽어
+심볼/타임프레임별로 KlineStore에 합친다. API 호출은 하지 않는다.
+"""
+import argparse
+import hashlib
+import io
+import os
+import re
+import time
+import zipfile
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.utils.kline_store import KLINE_COLUMNS, KlineStore, interval_to_ms
+
+logger = logging.getLogger("BATS-Archive")
+
+ARCHIVE_NAME = re.compile(r'^(?P<symbol>[A-Z0-9]+)-(?P<interval>\d+[smhdwM])-(?P<date>\d{4}-\d{2}(?:-\d{2})?)\.(?:zip|csv)$')
+# 2025년부터 현물 아카이브의 시각은 마이크로초 단위다. ms 값은 이 경계보다 훨씬 작다.
+MICROSECOND_THRESHOLD = 10 ** 14
+MAX_REPORTED_GAPS = 20
+# CSV 파싱 단위 (행). 수년치 1m 아카이브도 청크 단위로 읽는다.
+CHUNK_ROWS = 500_000
+
+
+def find_archives(directory, symbols=None, intervals=None):
+    """{(symbol, interval): [경로, ...]} (날짜순). .zip과 같은 이름의 .csv가 모두 있으면 .zip만 사용한다."""
+    found = {}
+    for root, _, files in os.walk(directory):
+        for name in files:
+            match = ARCHIVE_NAME.match(name)
+            if not match:
+                continue
+            symbol, interval = match['symbol'], match['interval']
+            if (symbols and symbol not in symbols) or (intervals and interval not in intervals):
+                continue
+            found.setdefault((symbol, interval), {}).setdefault(match['date'], []).append(os.path.join(root, name))
+    return {
+        key: [sorted(paths, key=lambda p: not p.endswith('.zip'))[0] for _, paths in sorted(by_date.items())]
+        for key, by_date in found.items()
+    }
+
+
+def verify_checksum(path):
+    """path.CHECKSUM 파일이 있으면 SHA-256을 비교한다. 없으면 True."""
+    checksum_path = f"{path}.CHECKSUM"
+    if not os.path.exists(checksum_path):
+        return True
+    with open(checksum_path) as f:
+        expected = f.read().split()[0].lower()
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest() == expected
+
+
+def read_archive(path, chunk_rows=CHUNK_ROWS):
+    """
+    아카이브 하나를 컬럼 dict로 읽는다. zip은 압축을 풀지 않고 멤버를 스트림으로 열어
+    chunk_rows 행씩 파싱하므로 원본 CSV 전체를 메모리에 올리지 않는다. 헤더 유무 자동 판별.
+    """
+    if path.endswith('.zip'):
+        with zipfile.ZipFile(path) as zf:
+            member = next(n for n in zf.namelist() if n.endswith('.csv'))
+            with zf.open(member) as raw:
+                return _parse_csv(io.BufferedReader(raw), chunk_rows)
+    with open(path, 'rb') as f:
+        return _parse_csv(f, chunk_rows)
+
+
+def _parse_csv(stream, chunk_rows=CHUNK_ROWS):
+    has_header = not stream.peek(1)[:1].isdigit()
+    reader = pd.read_csv(stream, header=0 if has_header else None, usecols=range(6),
+                         names=None if has_header else list(KLINE_COLUMNS), engine='c', chunksize=chunk_rows)
+    parts = {col: [] for col in KLINE_COLUMNS}
+    microseconds = None
+    for chunk in reader:
+        chunk.columns = list(KLINE_COLUMNS)
+        timestamps = chunk['timestamp'].to_numpy(dtype='int64')
+        if microseconds is None and len(timestamps):
+            microseconds = timestamps[0] >= MICROSECOND_THRESHOLD
+        parts['timestamp'].append(timestamps // 1000 if microseconds else timestamps)
+        for col in KLINE_COLUMNS[1:]:
+            parts[col].append(chunk[col].to_numpy(dtype=float))
+    return {col: np.concatenate(values) if values else np.empty(0, dtype='int64' if col == 'timestamp' else float)
+            for col, values in parts.items()}
+
+
+def validate(columns, interval):
+    """
+    timestamp 정렬 후 중복 봉(뒤에 읽은 값 우선)을 제거하고 공백 구간을 찾는다.
+    반환: (정리된 컬럼 dict, {'rows', 'duplicates', 'missing_bars', 'gaps'})
+    """
+    ts = columns['timestamp']
+    order = np.argsort(ts, kind='stable')
+    ts = ts[order]
+    # 같은 시각이 여러 번 나오면 마지막(나중에 읽은) 값을 남긴다
+    keep = np.r_[ts[1:] != ts[:-1], True]
+    cleaned = {col: values[order][keep] for col, values in columns.items()}
+    duplicates = int(len(ts) - keep.sum())
+
+    gaps, missing = [], 0
+    if not interval.endswith('M') and len(cleaned['timestamp']) > 1:
+        step = interval_to_ms(interval)
+        diffs = np.diff(cleaned['timestamp'])
+        gap_idx = np.flatnonzero(diffs > step)
+        missing = int((diffs[gap_idx] // step - 1).sum())
+        gaps = [(int(cleaned['timestamp'][i] + step), int(cleaned['timestamp'][i + 1] - step))
+                for i in gap_idx[:MAX_REPORTED_GAPS]]
+    return cleaned, {'rows': len(cleaned['timestamp']), 'duplicates': duplicates,
+                     'missing_bars': missing, 'gaps': gaps}
+
+
+class KlineArchiveImporter:
+    """
+    아카이브 파일을 심볼/타임프레임 단위로 읽어 KlineStore에 합친다.
+    - 파일은 하나씩 스트림으로 읽어 numpy 배열로 변환하고, 시리즈 단위로 한 번에 정렬/중복 제거/공백 검사를 한다.
+    - 이미 저장된 이력과 합칠 때 같은 시각의 봉은 아카이브 값으로 교체한다.
+    - store는 잘라내지 않도록 max_bars=0 으로 만들어야 한다.
+    - 시리즈 단위로 workers 개 스레드에서 병렬 처리한다 (CSV 파싱은 GIL을 놓는다).
+    """
+
+    def __init__(self, store, workers=None):
+        self.store = store
+        self.workers = workers or min(8, os.cpu_count() or 1)
+
+    def import_series(self, symbol, interval, paths):
+        parts = []
+        for path in paths:
+            if not verify_checksum(path):
+                logger.error(f"Checksum mismatch, skipping {path}")
+                continue
+            parts.append(read_archive(path))
+
+        existing = self.store.load(symbol, interval)
+        if existing is not None:
+            parts.insert(0, existing)
+        if not parts:
+            return None
+        merged = {col: np.concatenate([part[col] for part in parts]) for col in KLINE_COLUMNS}
+        cleaned, report = validate(merged, interval)
+        self.store.update(symbol, interval, cleaned, replace=True)
+        report['files'] = len(paths)
+        if report['duplicates'] or report['missing_bars']:
+            logger.warning(f"[{symbol} {interval}] {report['duplicates']} duplicate bars dropped, "
+                           f"{report['missing_bars']} missing bars in {len(report['gaps'])}+ gaps")
+        return report
+
+    def import_directory(self, directory, symbols=None, intervals=None):
+        """directory의 아카이브를 모두 가져오고 {(symbol, interval): report}를 반환한다."""
+        started = time.monotonic()
+        archives = find_archives(directory, symbols, intervals)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ArchiveImport") as pool:
+            futures = {key: pool.submit(self.import_series, key[0], key[1], paths)
+                       for key, paths in archives.items()}
+            reports = {key: future.result() for key, future in futures.items()}
+        rows = sum(r['rows'] for r in reports.values() if r)
+        logger.info(f"Imported {len(reports)} series ({rows} bars) in {time.monotonic() - started:.1f}s")
+        return reports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import Binance kline archives into the local kline store")
+    parser.add_argument('archive_dir')
+    parser.add_argument('--store', default='data/klines')
+    parser.add_argument('--symbols', nargs='*')
+    parser.add_argument('--intervals', nargs='*')
+    parser.add_argument('--workers', type=int)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    importer = KlineArchiveImporter(KlineStore(args.store, max_bars=0), workers=args.workers)
+    reports = importer.import_directory(args.archive_dir, args.symbols, args.intervals)
+    for (symbol, interval), report in sorted(reports.items()):
+        if report:
+            print(f"{symbol:<12} {interval:<4} rows={report['rows']:<9} files={report['files']:<4} "
+                  f"duplicates={report['duplicates']:<5} missing={report['missing_bars']}")
+    return reports
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.kline_store import KLINE_COLUMNS, interval_to_ms
+
+
+class KlineQualityReport:
+    """
+    check_klines 결과. 인덱스는 모두 중복 제거 후(정렬된) 배열 기준이다.
+    - duplicates: 제거된 중복 봉 수
+    - gaps: [(누락 시작 ms, 누락 끝 ms, 누락 봉 수), ...]
+    - zero_volume / outliers / invalid: 해당 봉 인덱스 배열
+    """
+
+    def __init__(self, rows, duplicates, gaps, zero_volume, outliers, invalid):
+        self.rows = rows
+        self.duplicates = duplicates
+        self.gaps = gaps
+        self.zero_volume = zero_volume
+        self.outliers = outliers
+        self.invalid = invalid
+
+    @property
+    def missing_bars(self) -> int:
+        return int(sum(gap[2] for gap in self.gaps))
+
+    @property
+    def clean(self) -> bool:
+        return not (self.duplicates or self.gaps or len(self.outliers) or len(self.invalid))
+
+    def summary(self) -> str:
+        return (f"{self.rows} bars, {self.duplicates} duplicates, {self.missing_bars} missing in "
+                f"{len(self.gaps)} gaps, {len(self.zero_volume)} zero-volume, "
+                f"{len(self.outliers)} outliers, {len(self.invalid)} invalid")
+
+
+def _columns_of(data):
+    if isinstance(data, pd.DataFrame):
+        ts = data['timestamp']
+        ms = pd.DatetimeIndex(ts).as_unit('ms').asi8 if pd.api.types.is_datetime64_any_dtype(ts) \
+            else ts.to_numpy(dtype='int64')
+        columns = {col: data[col].to_numpy(dtype=float) for col in KLINE_COLUMNS[1:]}
+        columns['timestamp'] = ms
+        return columns
+    return {col: np.asarray(data[col]) for col in KLINE_COLUMNS}
+
+
+def deduplicate(columns):
+    """timestamp로 정렬하고 같은 시각의 봉은 마지막 값만 남긴다. (정리된 컬럼, 제거된 수)"""
+    ts = np.asarray(columns['timestamp'], dtype='int64')
+    if len(ts) > 1 and np.all(ts[1:] > ts[:-1]):
+        return columns, 0
+    order = np.argsort(ts, kind='stable')
+    sorted_ts = ts[order]
+    keep = np.r_[sorted_ts[1:] != sorted_ts[:-1], True] if len(ts) else np.empty(0, dtype=bool)
+    return {col: np.asarray(values)[order][keep] for col, values in columns.items()}, int(len(ts) - keep.sum())
+
+
+def check_klines(data, interval, outlier_threshold=25.0):
+    """
+    캔들 시리즈(DataFrame 또는 컬럼 dict) 하나를 벡터 연산 한 번으로 검사한다.
+    - 누락 봉: 연속 봉 사이 간격이 interval보다 큰 구간 (월봉은 검사하지 않음)
+    - 중복 봉: 같은 timestamp
+    - 거래량 0 봉
+    - 이상치: 로그 수익률이 중앙값에서 outlier_threshold * MAD(정규분포 환산) 이상 벗어난 봉
+    - 비정상 봉: 0 이하 가격, high < max(open, close), low > min(open, close)
+    반환: (중복 제거된 컬럼 dict, KlineQualityReport)
+    """
+    columns, duplicates = deduplicate(_columns_of(data))
+    ts = columns['timestamp']
+    o, h, l, c, v = (np.asarray(columns[col], dtype=float) for col in KLINE_COLUMNS[1:])
+
+    gaps = []
+    if len(ts) > 1 and not interval.endswith('M'):
+        step = interval_to_ms(interval)
+        diffs = np.diff(ts)
+        idx = np.flatnonzero(diffs > step)
+        gaps = [(int(ts[i] + step), int(ts[i + 1] - step), int(diffs[i] // step - 1)) for i in idx]
+
+    invalid = np.flatnonzero((np.minimum.reduce([o, h, l, c]) <= 0)
+                             | (h < np.maximum(o, c)) | (l > np.minimum(o, c)))
+
+    outliers = np.empty(0, dtype=int)
+    if len(c) > 2:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.diff(np.log(c))
+        finite = np.isfinite(returns)
+        if finite.any():
+            median = np.median(returns[finite])
+            mad = 1.4826 * np.median(np.abs(returns[finite] - median))
+            if mad > 0:
+                outliers = np.flatnonzero(finite & (np.abs(returns - median) > outlier_threshold * mad)) + 1
+
+    report = KlineQualityReport(len(ts), duplicates, gaps, np.flatnonzero(v == 0), outliers, invalid)
+    return columns, report
+
+
+def repair_klines(data, interval, refetch=None, outlier_threshold=25.0):
+    """
+    check_klines 후 누락 봉을 채운 연속 시리즈를 반환한다.
+    - refetch(start_ms, end_ms) -> 컬럼 dict 가 주어지면 누락 구간을 먼저 다시 받아 채운다.
+    - 그래도 남은 누락 봉은 직전 종가로 채운다 (open=high=low=close=직전 종가, volume=0).
+    - 이상치/비정상 봉은 고치지 않고 'flagged' 컬럼(bool)으로 표시한다. 채운 봉은 'filled' 컬럼.
+    입력이 DataFrame이면 같은 timestamp 형식의 DataFrame을, 컬럼 dict이면 dict를 반환한다.
+    반환: (시리즈, 수리 전 KlineQualityReport)
+    """
+    columns, report = check_klines(data, interval, outlier_threshold)
+    flagged_ts = columns['timestamp'][np.union1d(report.outliers, report.invalid).astype(int)]
+
+    if refetch is not None and report.gaps:
+        parts = [columns]
+        for start, end, _ in report.gaps:
+            try:
+                fetched = refetch(start, end)
+            except Exception:
+                fetched = None
+            if fetched is not None and len(fetched['timestamp']):
+                parts.append({col: np.asarray(fetched[col]) for col in KLINE_COLUMNS})
+        if len(parts) > 1:
+            merged = {col: np.concatenate([np.asarray(p[col], dtype=columns[col].dtype) for p in parts])
+                      for col in KLINE_COLUMNS}
+            columns, _ = deduplicate(merged)
+
+    ts = columns['timestamp']
+    flagged = np.zeros(len(ts), dtype=bool)
+    flagged[np.searchsorted(ts, flagged_ts)] = True  # ts는 정렬되어 있고 flagged_ts는 모두 ts에 있다
+    filled = np.zeros(len(ts), dtype=bool)
+
+    if len(ts) > 1 and not interval.endswith('M'):
+        step = interval_to_ms(interval)
+        grid = np.arange(ts[0], ts[-1] + step, step, dtype='int64')
+        if len(grid) != len(ts) or not np.array_equal(grid, ts):
+            if np.any((ts - ts[0]) % step):
+                # 간격이 어긋난 실제 봉은 그대로 두고 grid 에 없는 시각만 추가한다
+                full_ts = np.union1d(grid, ts)
+                pos = np.searchsorted(full_ts, ts)
+            else:
+                full_ts, pos = grid, (ts - ts[0]) // step
+            present = np.zeros(len(full_ts), dtype=bool)
+            present[pos] = True
+            # 각 행 시점의 가장 최근 실제 봉 (forward fill 원본)
+            prev_close = np.asarray(columns['close'], dtype=float)[np.cumsum(present) - 1]
+
+            filled_columns = {'timestamp': full_ts}
+            for col in KLINE_COLUMNS[1:]:
+                out = np.empty(len(full_ts), dtype=float)
+                out[pos] = columns[col]
+                out[~present] = 0.0 if col == 'volume' else prev_close[~present]
+                filled_columns[col] = out
+            full_flagged = np.zeros(len(full_ts), dtype=bool)
+            full_flagged[pos] = flagged
+            columns, flagged, filled = filled_columns, full_flagged, ~present
+
+    columns = dict(columns, filled=filled, flagged=flagged)
+    if not isinstance(data, pd.DataFrame):
+        return columns, report
+
+    df = pd.DataFrame(columns)
+    if pd.api.types.is_datetime64_any_dtype(data['timestamp']):
+        tz = data['timestamp'].dt.tz
+        converted = pd.to_datetime(df['timestamp'], unit='ms', utc=tz is not None)
+        df['timestamp'] = (converted.dt.tz_convert(tz) if tz is not None else converted).astype(data['timestamp'].dtype)
+    return df, report
@@ -0,0 +1,124 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+KLINE_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+_INTERVAL_UNITS_MS = {'m': 60_000, 'h': 3_600_000, 'd': 86_400_000, 'w': 7 * 86_400_000}
+
+
+def interval_to_ms(interval):
+    """'4h' -> 14400000. 월봉('1M')은 길이가 고정되지 않아 31일로 근사한다."""
+    if interval.endswith('M'):
+        return int(interval[:-1]) * 31 * 86_400_000
+    return int(interval[:-1]) * _INTERVAL_UNITS_MS[interval[-1]]
+
+
+def klines_to_columns(klines):
+    """Binance get_klines 응답(list of list)을 컬럼별 numpy 배열 dict로 변환한다."""
+    if not klines:
+        return {col: np.empty(0, dtype='int64' if col == 'timestamp' else float) for col in KLINE_COLUMNS}
+    rows = np.asarray([k[:6] for k in klines], dtype=object)
+    columns = {'timestamp': rows[:, 0].astype('int64')}
+    values = rows[:, 1:6].astype(float)
+    for i, col in enumerate(KLINE_COLUMNS[1:]):
+        columns[col] = values[:, i]
+    return columns
+
+
+class KlineStore:
+    """
+    심볼/타임프레임별 캔들을 컬럼 단위 numpy 배열(.npz)로 보관하는 로컬 캐시.
+
+    - 파일: {directory}/{interval}/{symbol}.npz (timestamp[int64 ms], open/high/low/close/volume[float64])
+    - update(): 새로 받은 봉을 timestamp 기준으로 합친다. 겹치는 봉(형성 중이던 마지막 봉 포함)은
+      새 값으로 교체하고, max_bars 개를 넘으면 오래된 봉부터 버린다.
+    - 읽은 배열은 메모리에도 보관하므로 같은 프로세스 안에서 반복 스캔 시 디스크를 다시 읽지 않는다.
+    - 파일 쓰기는 임시 파일 + os.replace 로 원자적으로 수행한다.
+    """
+
+    def __init__(self, directory="data/klines", max_bars=1000):
+        self.directory = directory
+        self.max_bars = max_bars
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    def path(self, symbol, interval):
+        return os.path.join(self.directory, interval, f"{symbol}.npz")
+
+    def load(self, symbol, interval):
+        """보관된 컬럼 dict를 반환한다. 없으면 None."""
+        key = (symbol, interval)
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+        path = self.path(symbol, interval)
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            columns = {col: data[col] for col in KLINE_COLUMNS}
+        with self._lock:
+            self._memory[key] = columns
+        return columns
+
+    def last_timestamp(self, symbol, interval):
+        columns = self.load(symbol, interval)
+        if columns is None or len(columns['timestamp']) == 0:
+            return None
+        return int(columns['timestamp'][-1])
+
+    def update(self, symbol, interval, new_columns, replace=False):
+        """
+        new_columns를 기존 이력에 합쳐 저장하고 합쳐진 컬럼 dict를 반환한다.
+        replace=True이면 기존 이력을 버린다 (이어 붙이면 중간에 공백이 생기는 경우).
+        """
+        existing = None if replace else self.load(symbol, interval)
+        if existing is not None and len(existing['timestamp']) and len(new_columns['timestamp']):
+            keep = existing['timestamp'] < new_columns['timestamp'][0]
+            merged = {col: np.concatenate([existing[col][keep], np.asarray(new_columns[col])])
+                      for col in KLINE_COLUMNS}
+        elif existing is None or len(new_columns['timestamp']):
+            merged = {col: np.asarray(new_columns[col]) for col in KLINE_COLUMNS}
+        else:
+            return existing
+
+        if self.max_bars and len(merged['timestamp']) > self.max_bars:
+            merged = {col: values[-self.max_bars:] for col, values in merged.items()}
+        merged['timestamp'] = merged['timestamp'].astype('int64')
+
+        path = self.path(symbol, interval)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **merged)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._memory[(symbol, interval)] = merged
+        return merged
+
+    def load_resampled(self, symbol, interval, base_interval):
+        """interval 캔들이 따로 없으면 보관된 base_interval 캔들을 interval로 집계해 반환한다."""
+        columns = self.load(symbol, interval)
+        if columns is not None or interval == base_interval:
+            return columns
+        base = self.load(symbol, base_interval)
+        if base is None:
+            return None
+        from src.utils.resample import resample_columns
+        return resample_columns(base, interval)
+
+    def symbols(self, interval):
+        directory = os.path.join(self.directory, interval)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-4] for name in os.listdir(directory) if name.endswith('.npz'))
+
+    @staticmethod
+    def to_frame(columns):
+        """컬럼 dict를 ExchangeProvider.get_market_data와 같은 형식의 DataFrame으로 변환한다."""
+        df = pd.DataFrame({col: columns[col] for col in KLINE_COLUMNS})
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        return df
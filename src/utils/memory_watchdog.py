@@ -0,0 +1,169 @@
+import os
+import time
+import logging
+import tracemalloc
+
+logger = logging.getLogger("BATS-Memory")
+
+# tracemalloc 자체와 import 시스템이 만든 할당은 누수 후보에서 제외한다
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def read_rss():
+    """현재 프로세스 RSS (bytes). /proc/self/statm 이 없으면 (Linux 외) 최대 RSS로 대신한다."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _line_totals(snapshot):
+    """스냅샷을 할당 위치(파일, 줄)별 (크기, 블록 수) dict로 줄인다. 스냅샷 자체는 보관하지 않는다."""
+    totals = {}
+    for stat in snapshot.statistics('lineno'):
+        frame = stat.traceback[0]
+        totals[(frame.filename, frame.lineno)] = (stat.size, stat.count)
+    return totals
+
+
+class MemoryWatchdog:
+    """
+    장기 실행 데몬의 메모리 증가 감시.
+
+    - check()는 트레이딩 루프 반복 사이에 호출되며, interval 초가 지났을 때만 측정한다.
+      첫 측정을 기준선으로 삼으므로 시작 직후의 캐시/데이터 적재는 증가량에 포함되지 않는다.
+    - 트레이딩 스레드에서는 RSS(/proc/self/statm)만 읽는다. RSS 증가량이 growth_threshold_mb의 배수를
+      새로 넘을 때마다 notify(title, message)로 알린다.
+    - trace=True면 tracemalloc 스냅샷과 기준선 대비 증가 상위 할당 위치(파일:줄) 계산은 전용
+      BackgroundWorker에서 수행한다 (한 번에 하나만 대기). 기준선은 위치별 합계만 보관한다.
+      이 경우 알림에는 증가 상위 위치가 함께 포함된다. tracemalloc은 모든 할당에 비용을 더하므로 기본은 꺼져 있다.
+    """
+
+    def __init__(self, interval=600.0, growth_threshold_mb=256.0, top=10, trace=False, frames=1,
+                 notify=None, clock=time.monotonic, rss_reader=read_rss):
+        self.interval = interval
+        self.growth_threshold = growth_threshold_mb * 1024 * 1024
+        self.top = top
+        self.trace = trace
+        self.frames = frames
+        self.notify = notify
+        self.clock = clock
+        self.rss_reader = rss_reader
+        self.baseline_rss = None
+        self.baseline_at = None
+        self.last_report = None
+        self._baseline_totals = None
+        self._last_check = None
+        self._alert_level = 0
+        self._started_tracing = False
+        self._worker = None
+
+    def start(self):
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        if self.trace and self._worker is None:
+            from src.utils.background_worker import BackgroundWorker
+            self._worker = BackgroundWorker(name="MemoryWatchdog")
+
+    def flush(self, timeout=None) -> bool:
+        """대기 중인 할당 분석이 끝날 때까지 기다린다."""
+        return self._worker.flush(timeout) if self._worker else True
+
+    def stop(self, timeout=5.0):
+        if self._worker:
+            self._worker.close(timeout)
+            self._worker = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._baseline_totals = None
+
+    def check(self, force=False):
+        """측정 주기가 되었으면 RSS를 측정하고 보고 dict를 반환한다. 아니면 None."""
+        now = self.clock()
+        if not force and self._last_check is not None and now - self._last_check < self.interval:
+            return None
+        self._last_check = now
+        rss = self.rss_reader()
+
+        if self.baseline_rss is None:
+            self.baseline_rss, self.baseline_at = rss, now
+            self.last_report = {'rss_mb': round(rss / 2**20, 1), 'growth_mb': 0.0, 'growth_mb_per_hour': 0.0, 'top': []}
+            logger.info(f"Memory baseline: RSS {self.last_report['rss_mb']} MB")
+            self._submit(self._take_baseline)
+            return self.last_report
+
+        growth = rss - self.baseline_rss
+        hours = max(now - self.baseline_at, 1e-9) / 3600
+        report = {
+            'rss_mb': round(rss / 2**20, 1),
+            'growth_mb': round(growth / 2**20, 1),
+            'growth_mb_per_hour': round(growth / 2**20 / hours, 2),
+            'top': self.last_report.get('top', []) if self.last_report else [],
+        }
+        self.last_report = report
+
+        level = int(growth // self.growth_threshold) if self.growth_threshold > 0 else 0
+        alert = level > self._alert_level
+        if alert:
+            self._alert_level = level
+        if not self._submit(self._analyze, report, alert):
+            self._log(report, alert)
+        return report
+
+    def _submit(self, fn, *args) -> bool:
+        """할당 분석을 워커에 넘긴다. 추적 중이 아니거나 이전 분석이 아직 대기 중이면 False."""
+        if self._worker is None or not tracemalloc.is_tracing():
+            return False
+        if self._worker.queue_depth > 0:
+            logger.debug("Previous allocation analysis still running, skipping")
+            return False
+        self._worker.submit(fn, *args)
+        return True
+
+    def _take_baseline(self):
+        self._baseline_totals = _line_totals(tracemalloc.take_snapshot().filter_traces(_IGNORED))
+
+    def _analyze(self, report, alert):
+        report['top'] = self.top_growth()
+        self._log(report, alert)
+
+    def _log(self, report, alert):
+        sites = "; ".join(f"{site['site']} +{site['size_kb']:.0f}KB ({site['count']:+d})" for site in report['top'])
+        logger.info(f"Memory: RSS {report['rss_mb']} MB ({report['growth_mb']:+.1f} MB since baseline, "
+                    f"{report['growth_mb_per_hour']:+.2f} MB/h){f' top growth: {sites}' if sites else ''}")
+        if not alert:
+            return
+        message = (f"RSS {report['rss_mb']} MB, +{report['growth_mb']} MB since baseline "
+                   f"({report['growth_mb_per_hour']:+.2f} MB/h).")
+        if report['top']:
+            message += "\nTop growing allocation sites:\n" + "\n".join(
+                f"- {site['site']}: +{site['size_kb']:.0f} KB ({site['count']:+d} blocks)" for site in report['top'])
+        logger.warning(f"Memory growth threshold exceeded: {message}")
+        if self.notify:
+            try:
+                self.notify("Memory Warning", message)
+            except Exception as e:
+                logger.error(f"Failed to send memory warning: {e}")
+
+    def top_growth(self):
+        """기준선 대비 크기가 가장 많이 늘어난 할당 위치 [{'site', 'size_kb', 'count'}, ...]."""
+        if self._baseline_totals is None or not tracemalloc.is_tracing():
+            return []
+        current = _line_totals(tracemalloc.take_snapshot().filter_traces(_IGNORED))
+        growth = []
+        for location, (size, count) in current.items():
+            base_size, base_count = self._baseline_totals.get(location, (0, 0))
+            if size > base_size:
+                growth.append((size - base_size, count - base_count, location))
+        growth.sort(reverse=True)
+        return [{'site': f"{filename}:{lineno}", 'size_kb': size / 1024, 'count': count}
+                for size, count, (filename, lineno) in growth[:self.top]]
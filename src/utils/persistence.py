@@ -2,14 +2,22 @@ import json
 import os
 import logging
 
+from src.utils.snapshot_writer import AtomicSnapshotWriter, write_json_atomic
+
 logger = logging.getLogger("BATS-Persistence")
 
 class JSONPersistence:
     """
     Handles saving and loading the trading state to/from a JSON file.
+
+    async_write=True이면 save()는 백그라운드 AtomicSnapshotWriter에 스냅샷을 넘기고 즉시 반환한다.
+    (연속 저장은 debounce로 합쳐지고, fsync는 fsync_interval 주기로 수행, close() 시 flush 보장)
     """
-    def __init__(self, filepath="state.json"):
+    def __init__(self, filepath="state.json", async_write=False, debounce=0.2, fsync_interval=5.0):
         self.filepath = filepath
+        self._writer = None
+        if async_write:
+            self._writer = AtomicSnapshotWriter(filepath, debounce=debounce, fsync_interval=fsync_interval)
         self.default_state = {
             "total_heat": 0.0,
             "symbols": {}
@@ -46,8 +54,26 @@ class JSONPersistence:
 
     def save(self, state):
         try:
-            with open(self.filepath, "w") as f:
-                json.dump(state, f, indent=4)
+            if self._writer:
+                self._writer.submit(state)
+                return
+            write_json_atomic(self.filepath, state)
             logger.debug(f"State saved to {self.filepath}")
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
+
+    def save_symbol(self, state, symbol):
+        """단일 심볼 변경 저장. JSON 백엔드는 파일 전체를 다시 기록한다."""
+        self.save(state)
+
+    def flush(self, timeout=None):
+        """백그라운드 writer에 대기 중인 스냅샷을 디스크에 기록(fsync)할 때까지 기다린다."""
+        if self._writer:
+            return self._writer.flush(timeout)
+        return True
+
+    def close(self):
+        """종료 시 호출. 대기 중인 스냅샷을 모두 기록하고 writer를 종료한다."""
+        if self._writer:
+            self._writer.close()
+            self._writer = None
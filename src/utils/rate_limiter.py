@@ -0,0 +1,66 @@
+import threading
+import time
+from collections import deque
+
+
+def klines_weight(limit):
+    """Binance /api/v3/klines 요청 weight (limit 구간별)."""
+    if limit <= 100:
+        return 1
+    if limit <= 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+class RateLimiter:
+    """
+    요청 weight 기반 슬라이딩 윈도우 레이트 리미터 (스레드 안전).
+
+    - 최근 window 초 동안 사용한 weight 합이 max_weight를 넘지 않도록 acquire()에서 대기한다.
+      고정 1분 창을 쓰는 거래소 한도보다 항상 보수적이다.
+    - pause(seconds): 429/418 응답의 Retry-After 만큼 모든 요청을 멈춘다.
+    """
+
+    def __init__(self, max_weight=1200, window=60.0, clock=time.monotonic, sleep=time.sleep):
+        self.max_weight = max_weight
+        self.window = window
+        self._clock = clock
+        self._sleep = sleep
+        self._events = deque()
+        self._used = 0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def used_weight(self) -> int:
+        with self._lock:
+            self._expire(self._clock())
+            return self._used
+
+    def _expire(self, now):
+        while self._events and self._events[0][0] <= now - self.window:
+            self._used -= self._events.popleft()[1]
+
+    def acquire(self, weight=1):
+        if weight > self.max_weight:
+            raise ValueError(f"weight {weight} exceeds limit {self.max_weight}")
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._expire(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._used + weight <= self.max_weight:
+                    self._events.append((now, weight))
+                    self._used += weight
+                    return
+                else:
+                    # 가장 오래된 요청이 창 밖으로 나갈 때까지
+                    wait = self._events[0][0] + self.window - now
+            self._sleep(max(wait, 0.001))
+
+    def pause(self, seconds):
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
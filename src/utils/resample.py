@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.kline_store import KLINE_COLUMNS, interval_to_ms
+
+DAY_MS = 86_400_000
+# 1970-01-01은 목요일이다. Binance 주봉은 월요일 00:00 UTC에 시작하므로 4일 밀어서 정렬한다.
+WEEK_OFFSET_MS = 4 * DAY_MS
+
+
+def bucket_start(timestamps, interval):
+    """
+    각 봉 시작 시각(epoch ms)이 속하는 상위 타임프레임 봉의 시작 시각을 반환한다 (Binance 기준 정렬).
+    - 분/시/일: UTC epoch 기준 interval 배수 (4h -> 00/04/08.. UTC, 1d -> 00:00 UTC)
+    - 주: 월요일 00:00 UTC
+    - 월: 매월 1일 00:00 UTC
+    """
+    ts = np.asarray(timestamps, dtype='int64')
+    if interval.endswith('M'):
+        months = ts.astype('datetime64[ms]').astype('datetime64[M]').astype('int64')
+        step = int(interval[:-1])
+        return (months - months % step).astype('datetime64[M]').astype('datetime64[ms]').astype('int64')
+    step = interval_to_ms(interval)
+    offset = WEEK_OFFSET_MS if interval.endswith('w') else 0
+    return ts - (ts - offset) % step
+
+
+def resample_columns(columns, interval, source_interval=None, drop_incomplete=False):
+    """
+    하위 타임프레임 캔들(컬럼 dict, timestamp 오름차순)을 interval 캔들로 집계한다.
+    open=첫 봉 시가, high=최고, low=최저, close=마지막 봉 종가, volume=합계.
+    drop_incomplete=True이면 source_interval 기준으로 봉 수가 모자란 구간(형성 중인 마지막 봉,
+    이력 시작 부분 등)을 버린다. 월봉은 길이가 일정하지 않아 drop_incomplete를 지원하지 않는다.
+    """
+    ts = np.asarray(columns['timestamp'], dtype='int64')
+    if len(ts) == 0:
+        return {col: np.asarray(columns[col])[:0] for col in KLINE_COLUMNS}
+
+    buckets = bucket_start(ts, interval)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(ts)] - 1
+
+    result = {
+        'timestamp': buckets[starts],
+        'open': np.asarray(columns['open'], dtype=float)[starts],
+        'high': np.maximum.reduceat(np.asarray(columns['high'], dtype=float), starts),
+        'low': np.minimum.reduceat(np.asarray(columns['low'], dtype=float), starts),
+        'close': np.asarray(columns['close'], dtype=float)[ends],
+        'volume': np.add.reduceat(np.asarray(columns['volume'], dtype=float), starts),
+    }
+
+    if drop_incomplete:
+        if source_interval is None or interval.endswith('M'):
+            raise ValueError("drop_incomplete requires source_interval and a fixed-length interval")
+        expected = interval_to_ms(interval) // interval_to_ms(source_interval)
+        complete = (ends - starts + 1) == expected
+        result = {col: values[complete] for col, values in result.items()}
+    return result
+
+
+def resample_frame(df, interval, source_interval=None, drop_incomplete=False):
+    """resample_columns의 DataFrame 버전. timestamp 컬럼 형식(datetime 또는 epoch ms)을 유지한다."""
+    timestamps = df['timestamp']
+    is_datetime = pd.api.types.is_datetime64_any_dtype(timestamps)
+    ms = pd.DatetimeIndex(timestamps).as_unit('ms').asi8 if is_datetime else timestamps.to_numpy(dtype='int64')
+    columns = {col: df[col].to_numpy() for col in KLINE_COLUMNS[1:]}
+    columns['timestamp'] = ms
+
+    resampled = pd.DataFrame(resample_columns(columns, interval, source_interval, drop_incomplete))
+    if is_datetime:
+        converted = pd.to_datetime(resampled['timestamp'], unit='ms', utc=timestamps.dt.tz is not None)
+        resampled['timestamp'] = converted.dt.tz_convert(timestamps.dt.tz) if timestamps.dt.tz is not None else converted
+        resampled['timestamp'] = resampled['timestamp'].astype(timestamps.dtype)
+    return resampled
@@ -0,0 +1,139 @@
+import os
+import sys
+import threading
+import time
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+
+logger = logging.getLogger("BATS-Profiler")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def frame_label(code):
+    """프로젝트 코드는 'src.core.modules_impl:TechnicalAnalysisEngine.calculate_indicators',
+    그 외(표준 라이브러리, pandas 등)는 '파일명:함수명' 으로 표기한다."""
+    filename = code.co_filename
+    name = getattr(code, 'co_qualname', code.co_name)
+    if filename.startswith(PROJECT_ROOT + os.sep):
+        module = os.path.relpath(filename, PROJECT_ROOT)[:-3].replace(os.sep, '.')
+        return f"{module}:{name}"
+    return f"{os.path.basename(filename)}:{name}"
+
+
+class SamplingProfiler:
+    """
+    트레이딩 스레드의 스택을 주기적으로 샘플링하는 저오버헤드 프로파일러.
+
+    - 별도 스레드가 interval 초마다 sys._current_frames()로 대상 스레드의 스택만 읽어 집계한다
+      (대상 코드에 계측 코드를 넣지 않는다).
+    - window 초마다 집계를 collapsed-stack 형식(flamegraph.pl / speedscope 입력)으로
+      output_dir/profile-<UTC 시각>.folded 에 쓰고, 프로젝트 함수별 누적 비율 상위 항목을 로그로 남긴다.
+    - 샘플 한 번에 걸린 시간 / interval 이 max_overhead를 넘으면 interval을 늘려 오버헤드를 제한한다.
+    """
+
+    def __init__(self, thread_id=None, interval=0.01, window=300.0, output_dir="logs/profiles",
+                 max_overhead=0.02, max_depth=64, top=10):
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.base_interval = interval
+        self.interval = interval
+        self.window = window
+        self.output_dir = output_dir
+        self.max_overhead = max_overhead
+        self.max_depth = max_depth
+        self.top = top
+        self._stacks = Counter()
+        self._samples = 0
+        self._sample_time = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+        logger.info(f"Sampling profiler started (interval {self.interval * 1000:.0f}ms, window {self.window}s)")
+
+    def stop(self):
+        """샘플링을 멈추고 남은 집계를 파일로 쓴다. 쓴 파일 경로(없으면 None)를 반환한다."""
+        if self._thread is None:
+            return None
+        self._stop.set()
+        self._thread.join(5)
+        self._thread = None
+        logger.info("Sampling profiler stopped")
+        return self.flush()
+
+    def toggle(self):
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+
+    def sample(self):
+        """대상 스레드 스택을 한 번 샘플링한다. 스레드가 없으면 False."""
+        started = time.perf_counter()
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return False
+        stack = []
+        while frame is not None and len(stack) < self.max_depth:
+            stack.append(frame_label(frame.f_code))
+            frame = frame.f_back
+        del frame
+        key = ';'.join(reversed(stack))
+        cost = time.perf_counter() - started
+        with self._lock:
+            self._stacks[key] += 1
+            self._samples += 1
+            self._sample_time += cost
+        # 샘플 비용이 예산을 넘으면 간격을 늘리고, 여유가 생기면 원래 간격으로 돌아간다
+        self.interval = max(self.base_interval, cost / self.max_overhead)
+        return True
+
+    def _run(self):
+        window_started = time.monotonic()
+        while not self._stop.wait(self.interval):
+            self.sample()
+            if time.monotonic() - window_started >= self.window:
+                self.flush()
+                window_started = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            stacks, self._stacks = self._stacks, Counter()
+            samples, sample_time = self._samples, self._sample_time
+            self._samples, self._sample_time = 0, 0.0
+        if not stacks:
+            return None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"profile-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}.folded")
+        with open(path, 'w') as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        hot = ", ".join(f"{name.split(':', 1)[1]} {share:.0%}"
+                        for name, share in self.inclusive_shares(stacks)[:self.top])
+        logger.info(f"Profile window written to {path} ({samples} samples, "
+                    f"sampling cost {sample_time / max(samples, 1) * 1e6:.0f}us/sample): {hot}")
+        return path
+
+    @staticmethod
+    def inclusive_shares(stacks, project_only=True):
+        """함수별 포함 시간 비율 [(label, share), ...] 내림차순. 재귀 호출은 스택당 한 번만 센다."""
+        total = sum(stacks.values())
+        inclusive = Counter()
+        for stack, count in stacks.items():
+            for label in set(stack.split(';')):
+                if not project_only or label.startswith('src.'):
+                    inclusive[label] += count
+        return [(label, count / total) for label, count in inclusive.most_common()]
@@ -0,0 +1,74 @@
+import threading
+import time
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 요청을 하나의 실제 호출로 합치는 single-flight 그룹.
+
+    - 키별로 진행 중인 호출이 있으면 새 호출자는 그 호출이 끝나기를 기다려 같은 결과(또는 예외)를 받는다.
+    - do(..., ttl=초)로 부르면 성공한 결과를 ttl 초 동안 보관해 그 사이의 요청도 호출 없이 응답한다.
+      cacheable(result)가 False인 결과(예: 실패를 뜻하는 None)는 보관하지 않는다.
+    - calls / shared 카운터로 실제 호출 수와 합쳐진 요청 수를 확인할 수 있다.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._cache = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, fn, ttl=0.0, cacheable=lambda result: result is not None):
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                if cached[0] > self._clock():
+                    self.shared += 1
+                    return cached[1]
+                del self._cache[key]
+
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                if call.error is None and ttl > 0 and cacheable(call.result):
+                    self._cache[key] = (self._clock() + ttl, call.result)
+            call.done.set()
+        return call.result
+
+    def forget(self, key=None):
+        """보관된 결과를 지운다. key가 없으면 전체."""
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
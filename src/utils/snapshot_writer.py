@@ -0,0 +1,161 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+import logging
+
+logger = logging.getLogger("BATS-Persistence")
+
+
+def write_json_atomic(filepath, data, fsync=True, indent=4):
+    """임시 파일에 기록한 뒤 os.replace로 교체한다. 중간에 중단되어도 기존 파일은 손상되지 않는다."""
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=indent)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if fsync:
+        _fsync_directory(directory)
+
+
+def fsync_file(filepath):
+    """이미 기록된 파일과 그 디렉터리 엔트리를 디스크에 반영한다."""
+    if not os.path.exists(filepath):
+        return
+    with open(filepath, "rb") as f:
+        os.fsync(f.fileno())
+    _fsync_directory(os.path.dirname(os.path.abspath(filepath)))
+
+
+def _fsync_directory(directory):
+    # rename 자체를 디스크에 반영하기 위해 디렉터리도 fsync (POSIX 전용)
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+class AtomicSnapshotWriter:
+    """
+    상태 스냅샷을 백그라운드 스레드에서 원자적으로 기록하는 writer.
+
+    - submit()은 스냅샷을 복사해 대기열(최신 1개)에 올리고 즉시 반환한다.
+    - debounce 초 동안 이어지는 submit은 하나의 쓰기로 합쳐진다 (최대 max_delay 초).
+    - fsync는 fsync_interval 초마다 한 번만 수행한다 (0이면 매 쓰기마다).
+    - flush()/close()는 대기 중인 스냅샷을 fsync 포함으로 기록할 때까지 기다린다.
+    """
+
+    def __init__(self, filepath, debounce=0.2, max_delay=1.0, fsync_interval=5.0, indent=4):
+        self.filepath = filepath
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.fsync_interval = fsync_interval
+        self.indent = indent
+
+        self._cond = threading.Condition()
+        self._pending = None
+        self._pending_since = None
+        self._last_submit = None
+        self._writing = False
+        self._force_fsync = False
+        self._last_fsync = 0.0
+        self._unsynced = False
+        self._closed = False
+        self.writes = 0
+        self._thread = threading.Thread(target=self._run, name="SnapshotWriter", daemon=True)
+        self._thread.start()
+
+    @property
+    def has_pending(self) -> bool:
+        with self._cond:
+            return self._pending is not None or self._writing
+
+    def submit(self, state):
+        snapshot = copy.deepcopy(state)
+        now = time.monotonic()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("AtomicSnapshotWriter is closed")
+            if self._pending is None:
+                self._pending_since = now
+            self._pending = snapshot
+            self._last_submit = now
+            self._cond.notify_all()
+
+    def flush(self, timeout=None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._force_fsync = True
+            self._cond.notify_all()
+            while self._pending is not None or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            unsynced = self._unsynced
+            self._unsynced = False
+        if unsynced:
+            # 마지막 쓰기가 fsync 주기 사이에 있었다면 여기서 디스크에 반영한다.
+            fsync_file(self.filepath)
+        return True
+
+    def close(self, timeout=None) -> bool:
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None and self._closed:
+                    return
+
+                # Debounce: 마지막 submit 이후 debounce 초가 지나거나 max_delay에 도달할 때까지 대기
+                while not self._force_fsync and not self._closed:
+                    now = time.monotonic()
+                    wait = min(self._last_submit + self.debounce, self._pending_since + self.max_delay) - now
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+
+                snapshot = self._pending
+                self._pending = None
+                self._writing = True
+                now = time.monotonic()
+                fsync = self._force_fsync or self.fsync_interval <= 0 or now - self._last_fsync >= self.fsync_interval
+
+            try:
+                write_json_atomic(self.filepath, snapshot, fsync=fsync, indent=self.indent)
+                self.writes += 1
+                if fsync:
+                    self._last_fsync = now
+                with self._cond:
+                    self._unsynced = not fsync
+                logger.debug(f"State snapshot written to {self.filepath} (fsync={fsync})")
+            except Exception as e:
+                logger.error(f"Failed to save state: {e}")
+            finally:
+                with self._cond:
+                    self._writing = False
+                    if self._pending is None:
+                        self._force_fsync = False
+                    self._cond.notify_all()
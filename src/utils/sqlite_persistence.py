@@ -0,0 +1,125 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+
+from src.utils.persistence import JSONPersistence
+
+logger = logging.getLogger("BATS-Persistence")
+
+
+class SQLitePersistence(JSONPersistence):
+    """
+    SQLite(WAL) 기반 상태 저장소. JSONPersistence와 동일한 인터페이스(load/save/get_symbol_state)를 제공한다.
+
+    - 심볼당 1행(symbols 테이블), 그 외 최상위 키(total_heat 등)는 meta 테이블에 저장
+    - save()는 마지막 저장 이후 변경된 행만 하나의 트랜잭션으로 갱신한다
+    - DB가 비어 있고 기존 state.json이 있으면 최초 로드 시 가져온다 (migration)
+    """
+
+    SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+    def __init__(self, filepath="state.db", json_path="state.json", synchronous="NORMAL"):
+        synchronous = str(synchronous).upper()
+        if synchronous not in self.SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid SQLite synchronous mode {synchronous!r}, "
+                             f"expected one of {', '.join(self.SYNCHRONOUS_MODES)}")
+        super().__init__(filepath)
+        self.json_path = json_path
+        self._lock = threading.Lock()
+        self._saved_rows = {}
+        self._saved_meta = {}
+
+        self._conn = sqlite3.connect(filepath, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS symbols ("
+            " symbol TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def load(self):
+        with self._lock:
+            symbol_rows = self._conn.execute("SELECT symbol, data FROM symbols").fetchall()
+            meta_rows = self._conn.execute("SELECT key, value FROM meta").fetchall()
+            self._saved_rows = dict(symbol_rows)
+            self._saved_meta = dict(meta_rows)
+
+        if not symbol_rows and not meta_rows:
+            return self._migrate_from_json()
+
+        state = {key: json.loads(value) for key, value in meta_rows}
+        state.setdefault("total_heat", 0.0)
+        state["symbols"] = {symbol: json.loads(data) for symbol, data in symbol_rows}
+        logger.info(f"State loaded from {self.filepath}: {len(symbol_rows)} symbols")
+        return state
+
+    def save(self, state):
+        """변경된 심볼 행과 meta 키만 트랜잭션으로 반영한다."""
+        rows = {symbol: json.dumps(sym_state, sort_keys=True)
+                for symbol, sym_state in state.get("symbols", {}).items()}
+        meta = {key: json.dumps(value, sort_keys=True)
+                for key, value in state.items() if key != "symbols"}
+        self._write(rows, meta, full=True)
+
+    def save_symbol(self, state, symbol):
+        """단일 심볼 행(및 meta)만 갱신한다. 다른 심볼은 직렬화조차 하지 않는다."""
+        rows = {symbol: json.dumps(state["symbols"][symbol], sort_keys=True)}
+        meta = {key: json.dumps(value, sort_keys=True)
+                for key, value in state.items() if key != "symbols"}
+        self._write(rows, meta, full=False)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, rows, meta, full):
+        # 비동기 writer와 종료 시 동기 save()가 겹칠 수 있으므로 기준(_saved_*) 비교, 트랜잭션,
+        # 기준 갱신을 하나의 락 안에서 수행한다.
+        try:
+            with self._lock:
+                changed_rows = [(s, d) for s, d in rows.items() if self._saved_rows.get(s) != d]
+                changed_meta = [(k, v) for k, v in meta.items() if self._saved_meta.get(k) != v]
+                removed_rows = [s for s in self._saved_rows if s not in rows] if full else []
+                if not (changed_rows or changed_meta or removed_rows):
+                    return
+
+                now = time.time()
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany(
+                        "INSERT INTO symbols (symbol, data, updated_at) VALUES (?, ?, ?) "
+                        "ON CONFLICT(symbol) DO UPDATE SET data=excluded.data, updated_at=excluded.updated_at",
+                        [(s, d, now) for s, d in changed_rows]
+                    )
+                    self._conn.executemany(
+                        "INSERT INTO meta (key, value) VALUES (?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+                        changed_meta
+                    )
+                    self._conn.executemany("DELETE FROM symbols WHERE symbol = ?", [(s,) for s in removed_rows])
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._saved_rows.update(changed_rows)
+                self._saved_meta.update(changed_meta)
+                for s in removed_rows:
+                    self._saved_rows.pop(s, None)
+            logger.debug(f"State saved to {self.filepath} ({len(changed_rows)} symbols changed)")
+        except Exception as e:
+            logger.error(f"Failed to save state: {e}")
+
+    def _migrate_from_json(self):
+        if not self.json_path or not os.path.exists(self.json_path):
+            logger.info(f"No state found in {self.filepath}, using defaults.")
+            return {"total_heat": 0.0, "symbols": {}}
+
+        state = JSONPersistence(self.json_path).load()
+        state.setdefault("symbols", {})
+        self.save(state)
+        logger.info(f"Migrated state from {self.json_path} to {self.filepath}")
+        return state
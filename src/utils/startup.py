@@ -0,0 +1,64 @@
+import importlib
+import threading
+import time
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger("BATS-Startup")
+
+
+class StartupTimer:
+    """
+    데몬 기동 단계별 소요 시간을 기록한다.
+
+    - measure(label): with 블록의 소요 시간을 기록 (import + 초기화)
+    - preload(*modules): 무거운 모듈을 백그라운드 스레드에서 미리 import 하여
+      네트워크 대기(거래소 클라이언트 초기화 등)와 겹치게 한다.
+    - summary(): 프로세스 시작부터의 총 시간과 단계별 내역을 한 줄로 반환
+    """
+
+    def __init__(self, started_at=None):
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.timings = []
+        self._lock = threading.Lock()
+        self._preload_threads = []
+
+    def _record(self, label, seconds):
+        with self._lock:
+            self.timings.append((label, seconds))
+
+    @contextmanager
+    def measure(self, label):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(label, time.perf_counter() - start)
+
+    def preload(self, *modules):
+        def _run():
+            for name in modules:
+                start = time.perf_counter()
+                try:
+                    importlib.import_module(name)
+                except ImportError as e:
+                    logger.warning(f"Preload of {name} failed: {e}")
+                    continue
+                self._record(f"{name} (background)", time.perf_counter() - start)
+
+        thread = threading.Thread(target=_run, name="ImportPreload", daemon=True)
+        thread.start()
+        self._preload_threads.append(thread)
+        return thread
+
+    def wait_preload(self, timeout=None):
+        for thread in self._preload_threads:
+            thread.join(timeout)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def summary(self) -> str:
+        with self._lock:
+            parts = ", ".join(f"{label} {seconds * 1000:.0f}ms" for label, seconds in self.timings)
+        return f"Startup ready in {self.elapsed() * 1000:.0f}ms ({parts})"
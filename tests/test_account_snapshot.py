@@ -0,0 +1,111 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.core.account import AccountSnapshot, split_symbol
+from src.core.modules_impl import BinanceExecutionEngine
+
+
+def account_response(**free):
+    return {'balances': [{'asset': a, 'free': str(v), 'locked': '0'} for a, v in free.items()]}
+
+
+def fill_response(symbol, side, qty, quote_qty, commission=0.0, commission_asset='BNB'):
+    return {
+        'symbol': symbol, 'side': side, 'executedQty': str(qty), 'cummulativeQuoteQty': str(quote_qty),
+        'fills': [{'price': str(quote_qty / qty), 'qty': str(qty),
+                   'commission': str(commission), 'commissionAsset': commission_asset}],
+    }
+
+
+class TestAccountSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get_account.return_value = account_response(USDT=1000.0, BTC=0.0, BNB=1.0)
+        self.snapshot = AccountSnapshot(self.client).refresh()
+
+    def test_split_symbol(self):
+        self.assertEqual(split_symbol('BTCUSDT'), ('BTC', 'USDT'))
+        self.assertEqual(split_symbol('ETHBTC'), ('ETH', 'BTC'))
+        self.assertEqual(split_symbol('XYZ'), ('XYZ', ''))
+
+    def test_fills_update_balances(self):
+        self.snapshot.apply_fill(fill_response('BTCUSDT', 'BUY', 0.01, 500.0, 0.00001, 'BTC'))
+        self.assertAlmostEqual(self.snapshot.free('USDT'), 500.0)
+        self.assertAlmostEqual(self.snapshot.free('BTC'), 0.00999)
+
+        self.snapshot.apply_fill(fill_response('BTCUSDT', 'SELL', 0.00999, 520.0, 0.001, 'BNB'))
+        self.assertAlmostEqual(self.snapshot.free('BTC'), 0.0)
+        self.assertAlmostEqual(self.snapshot.free('USDT'), 1020.0)
+        self.assertAlmostEqual(self.snapshot.free('BNB'), 0.999)
+        self.client.get_account.assert_called_once()
+
+
+class TestExecutionWithSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get_account.return_value = account_response(USDT=1000.0, BTC=0.5)
+        self.snapshot = AccountSnapshot(self.client).refresh()
+        self.client.get_account.reset_mock()
+        self.engine = BinanceExecutionEngine(self.client, account=self.snapshot)
+
+    def test_exit_is_a_single_order_request(self):
+        self.client.create_order.return_value = fill_response('BTCUSDT', 'SELL', 0.5, 25000.0)
+        self.assertTrue(self.engine.execute_order('BTCUSDT', 'SELL', 0))
+
+        self.client.create_order.assert_called_once_with(symbol='BTCUSDT', side='SELL', type='MARKET', quantity=0.5)
+        self.client.get_asset_balance.assert_not_called()
+        self.client.get_account.assert_not_called()
+        self.assertEqual(self.snapshot.free('BTC'), 0.0)
+        self.assertEqual(self.snapshot.free('USDT'), 26000.0)
+
+    def test_exit_retries_once_with_fresh_balance(self):
+        self.client.create_order.side_effect = [Exception("insufficient balance"),
+                                                fill_response('BTCUSDT', 'SELL', 0.4, 20000.0)]
+        self.client.get_account.return_value = account_response(USDT=1000.0, BTC=0.4)
+
+        self.assertTrue(self.engine.execute_order('BTCUSDT', 'SELL', 0))
+        self.client.get_account.assert_called_once()
+        self.assertEqual(self.client.create_order.call_args.kwargs['quantity'], 0.4)
+
+    def test_zero_cached_balance_is_refreshed_before_exit(self):
+        self.snapshot.apply_fill(fill_response('BTCUSDT', 'SELL', 0.5, 25000.0))  # 스냅샷상 BTC 0
+        self.client.get_account.return_value = account_response(USDT=1000.0, BTC=0.3)
+        self.client.create_order.return_value = fill_response('BTCUSDT', 'SELL', 0.3, 15000.0)
+
+        self.assertTrue(self.engine.execute_order('BTCUSDT', 'SELL', 0))
+        self.client.get_account.assert_called_once()
+        self.assertEqual(self.client.create_order.call_args.kwargs['quantity'], 0.3)
+
+    def test_exit_with_nothing_to_sell_reports_failure(self):
+        self.client.get_account.return_value = account_response(USDT=1000.0, BTC=0.0)
+        self.snapshot.refresh()
+        self.client.get_account.reset_mock()
+
+        self.assertFalse(self.engine.execute_order('BTCUSDT', 'SELL', 0))
+        self.client.get_account.assert_called_once()
+        self.client.create_order.assert_not_called()
+
+    def test_without_snapshot_keeps_balance_lookup(self):
+        self.client.get_asset_balance.return_value = {'free': '0.2'}
+        engine = BinanceExecutionEngine(self.client)
+        self.assertTrue(engine.execute_order('BTCUSDT', 'SELL', 0))
+        self.client.get_asset_balance.assert_called_once_with(asset='BTC')
+        self.assertEqual(self.client.create_order.call_args.kwargs['quantity'], 0.2)
+
+
+class TestExchangeProviderBalance(unittest.TestCase):
+    @patch('src.core.exchange_provider.Client')
+    def test_balance_reads_one_account_snapshot(self, client_cls):
+        from src.core.exchange_provider import ExchangeProvider
+        client = client_cls.return_value
+        client.get_account.return_value = account_response(USDT=1234.5, BTC=0.1)
+
+        exchange = ExchangeProvider(testnet=True)
+        self.assertEqual(exchange.get_asset_balance('USDT'), 1234.5)
+        self.assertEqual(exchange.account.free('BTC'), 0.1)
+        client.get_account.assert_called_once()
+        client.get_asset_balance.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import yaml
+
+from src.core.modules_impl import RiskManager
+from src.core.signal_manager import TurtleSignalManager
+from src.strategies import create_strategy
+from src.utils.config_watcher import ConfigWatcher, validate_config
+from src.main_loop import MainLoop
+
+
+def base_config(symbols=("BTCUSDT", "ETHUSDT"), adx=25.0):
+    return {
+        "system": {"polling_interval": 1},
+        "risk": {"max_portfolio_heat": 0.2, "unit_risk_percent": 0.01},
+        "strategy_params": {"adx_filter_threshold": adx},
+        "symbols": [{"name": name, "enabled": True, "timeframe": "4h"} for name in symbols],
+    }
+
+
+class TestConfigWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.base_path = os.path.join(self.tmpdir, "config.yaml")
+        self.local_path = os.path.join(self.tmpdir, "config.local.yaml")
+        self._write(self.base_path, base_config())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, path, data):
+        with open(path, "w") as f:
+            f.write(data if isinstance(data, str) else yaml.safe_dump(data))
+        # mtime 해상도가 낮은 파일시스템에서도 변경이 감지되도록 크기/시간을 바꾼다
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    def test_detects_local_override(self):
+        watcher = ConfigWatcher(self.base_path, self.local_path)
+        self.assertFalse(watcher.check())
+        self.assertIsNone(watcher.poll())
+
+        self._write(self.local_path, {"strategy_params": {"adx_filter_threshold": 30.0}})
+        self.assertTrue(watcher.check())
+        config = watcher.poll()
+        self.assertEqual(config["strategy_params"]["adx_filter_threshold"], 30.0)
+        self.assertEqual(len(config["symbols"]), 2)
+        self.assertIsNone(watcher.poll())
+
+    def test_invalid_config_is_rejected(self):
+        watcher = ConfigWatcher(self.base_path, self.local_path)
+        self._write(self.local_path, "symbols: [unclosed")
+        with self.assertLogs("BATS-Config", level="ERROR"):
+            self.assertFalse(watcher.check())
+
+        self._write(self.local_path, {"risk": {"unit_risk_percent": 5}})
+        with self.assertLogs("BATS-Config", level="ERROR"):
+            self.assertFalse(watcher.check())
+        self.assertIsNone(watcher.poll())
+
+    def test_validator_rejects_unbuildable_strategy(self):
+        watcher = ConfigWatcher(self.base_path, self.local_path,
+                                validator=lambda c: TurtleSignalManager(**c.get("strategy_params", {})))
+        self._write(self.local_path, {"strategy_params": {"unknown_param": 1}})
+        with self.assertLogs("BATS-Config", level="ERROR"):
+            self.assertFalse(watcher.check())
+
+    def test_validate_config_duplicates(self):
+        errors = validate_config(base_config(symbols=("BTCUSDT", "BTCUSDT")))
+        self.assertEqual(errors, ["duplicate symbol: BTCUSDT"])
+
+
+class TestMainLoopReload(unittest.TestCase):
+    def setUp(self):
+        self.patcher = patch('src.main_loop.JSONPersistence')
+        mock_persistence_cls = self.patcher.start()
+        self.persistence = mock_persistence_cls.return_value
+        self.persistence.load.return_value = {"total_heat": 0.0, "symbols": {}}
+        self.persistence.get_symbol_state.side_effect = \
+            lambda state, symbol: state["symbols"].setdefault(symbol, {"units_held": 0, "entry_prices": []})
+
+        self.exchange = MagicMock()
+        self.exchange.get_realtime_price.return_value = 100.0
+        self.exchange.get_asset_balance.return_value = 10000.0
+        self.ta = MagicMock()
+        self.ta.calculate_indicators.return_value = pd.DataFrame({'N': [1.0] * 30})
+        self.signal_manager = MagicMock()
+        self.execution = MagicMock()
+        self.execution.execute_order.return_value = True
+
+        self.loop = MainLoop(base_config(), self.exchange, self.ta, self.signal_manager, RiskManager(),
+                             self.execution, strategy_factory=create_strategy)
+        self.loop.notifier = MagicMock()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_strategy_rebuilt_and_removed_position_kept_exit_only(self):
+        self.loop.state["symbols"]["ETHUSDT"] = {"units_held": 2, "entry_prices": [90.0, 95.0]}
+
+        self.loop.apply_config(base_config(symbols=("BTCUSDT", "SOLUSDT"), adx=30.0))
+
+        self.assertIsInstance(self.loop.signal_manager, TurtleSignalManager)
+        self.assertEqual(self.loop.signal_manager.adx_filter_threshold, 30.0)
+        self.assertEqual(list(self.loop.exit_only_symbols), ["ETHUSDT"])
+        self.assertEqual(self.loop.state["symbols"]["ETHUSDT"]["units_held"], 2)
+
+    def test_exit_only_symbol_ignores_entries_and_clears_after_exit(self):
+        self.loop.state["symbols"]["ETHUSDT"] = {"units_held": 1, "entry_prices": [90.0]}
+        self.loop.apply_config(base_config(symbols=("BTCUSDT",)))
+        self.loop.signal_manager = MagicMock()
+
+        self.loop.signal_manager.generate_signal.return_value = "PYRAMID"
+        self.loop.run_once()
+        self.assertNotIn(("ETHUSDT", "BUY"), [c.args[:2] for c in self.execution.execute_order.call_args_list])
+
+        self.loop.signal_manager.generate_signal.return_value = "EXIT"
+        self.loop.run_once()
+        self.execution.execute_order.assert_any_call("ETHUSDT", "SELL", 0)
+        self.assertEqual(self.loop.exit_only_symbols, {})
+
+    def test_startup_only_sections_warn_on_change(self):
+        new_config = dict(base_config(), persistence={"backend": "sqlite"}, accounts=[{"name": "sub1"}],
+                          notification={"channel": {"type": "file"}}, health={"enabled": True})
+        with self.assertLogs("BATS-Main", level="WARNING") as logs:
+            self.loop.apply_config(new_config)
+
+        warned = [line for line in logs.output if "restart required" in line]
+        self.assertEqual(len(warned), 4)
+        for section in ("persistence", "accounts", "notification", "health"):
+            self.assertTrue(any(f"'{section}'" in line for line in warned), section)
+        self.assertIn("Restart required for: persistence, accounts, notification, health",
+                      self.loop.notifier.send_status.call_args[0][1])
+
+    def test_pending_config_applied_at_start_of_iteration(self):
+        self.loop.config_watcher = MagicMock()
+        self.loop.config_watcher.poll.return_value = base_config(symbols=("SOLUSDT",))
+        self.signal_manager.generate_signal.return_value = "HOLD"
+
+        self.loop.run_once()
+
+        fetched = [c.args[0] for c in self.exchange.get_market_data.call_args_list]
+        self.assertEqual(fetched, ["SOLUSDT"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pandas as pd
+
+from src.core.modules_impl import RiskManager
+from src.core.signal_manager import TurtleSignalManager
+from src.main_loop import MainLoop
+from src.utils.health_server import HealthServer
+
+
+def get(server, path):
+    host, port = server.address
+    try:
+        with urlopen(f"http://{host}:{port}{path}", timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+class TestHealthServer(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.status = None
+        self.server = HealthServer(lambda: self.status, port=0, stale_after=60, clock=lambda: self.now)
+        self.server.start()
+        self.addCleanup(self.server.close)
+
+    def test_health_states(self):
+        code, body = get(self.server, '/health')
+        self.assertEqual((code, body['status']), (503, 'starting'))
+
+        self.status = {'pid': 1, 'iteration': 3, 'last_success_at': 990.0, 'symbols': {'BTCUSDT': {}}}
+        code, body = get(self.server, '/health')
+        self.assertEqual((code, body['status'], body['age']), (200, 'ok', 10.0))
+
+        self.now = 1100.0
+        code, body = get(self.server, '/health')
+        self.assertEqual((code, body['status']), (503, 'stale'))
+
+    def test_status_and_unknown_path(self):
+        self.status = {'iteration': 1, 'symbols': {'BTCUSDT': {'price': 1.0}}}
+        self.assertEqual(get(self.server, '/status'), (200, self.status))
+        self.assertEqual(get(self.server, '/nope')[0], 404)
+
+
+class TestMainLoopHealth(unittest.TestCase):
+    def test_status_served_from_cached_iteration(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        config = {
+            'symbols': [{'name': 'BTCUSDT', 'timeframe': '4h'}],
+            'persistence': {'path': os.path.join(tmpdir, 'state.json')},
+            'health': {'enabled': True, 'port': 0},
+        }
+        exchange = MagicMock()
+        exchange.get_market_data.return_value = MagicMock()
+        exchange.get_realtime_price.return_value = 90.0
+        exchange.get_asset_balance.return_value = 10000.0
+        ta = MagicMock()
+        ta.calculate_indicators.return_value = pd.DataFrame({
+            'N': [2.0] * 30, 'ADX': [30.0] * 30, 'ema_200': [100.0] * 30, 'dc_90_high': [115.0] * 30})
+
+        loop = MainLoop(config, exchange, ta, TurtleSignalManager(), RiskManager(), MagicMock())
+        loop.notifier = MagicMock()
+        loop.health_server.start()
+        self.addCleanup(loop.health_server.close)
+
+        self.assertEqual(get(loop.health_server, '/health')[0], 503)
+        loop.run_once()
+        code, body = get(loop.health_server, '/health')
+        self.assertEqual((code, body['status'], body['iteration']), (200, 'ok', 1))
+
+        calls = exchange.method_calls[:]
+        code, status = get(loop.health_server, '/status')
+        self.assertEqual(status['symbols']['BTCUSDT']['price'], 90.0)
+        self.assertIn('queues', status)
+        # 요청 처리 중 거래소 호출이 없어야 한다
+        self.assertEqual(exchange.method_calls, calls)
+
+        exchange.get_asset_balance.side_effect = RuntimeError("boom")
+        loop.run_once()
+        code, body = get(loop.health_server, '/health')
+        self.assertEqual(code, 200)
+        self.assertEqual(body['last_error']['message'], "boom")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from src.core.modules_impl import TechnicalAnalysisEngine
+from src.core.indicator_cache import IndicatorCache
+
+
+def make_klines(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(n).cumsum()
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='4h'),
+        'open': close,
+        'high': close + rng.random(n) + 0.1,
+        'low': close - rng.random(n) - 0.1,
+        'close': close,
+        'volume': rng.random(n) * 100,
+    })
+
+
+class TestIndicatorCache(unittest.TestCase):
+    def setUp(self):
+        self.ta = MagicMock(wraps=TechnicalAnalysisEngine())
+        self.cache = IndicatorCache(self.ta)
+        self.df = make_klines(300)
+
+    def test_same_candle_is_served_from_cache(self):
+        first = self.cache.calculate_indicators(self.df, symbol="BTCUSDT", interval="4h")
+        second = self.cache.calculate_indicators(self.df.copy(), symbol="BTCUSDT", interval="4h")
+
+        self.assertEqual(self.ta.calculate_indicators.call_count, 1)
+        self.assertEqual(self.cache.hits, 1)
+        pd.testing.assert_frame_equal(first, second)
+
+        second.loc[second.index[-1], 'N'] = -1.0
+        third = self.cache.calculate_indicators(self.df, symbol="BTCUSDT", interval="4h")
+        self.assertNotEqual(third['N'].iloc[-1], -1.0)
+
+    def test_forming_bar_update_is_served_from_cache(self):
+        self.cache.calculate_indicators(self.df, symbol="BTCUSDT", interval="4h")
+
+        updated = self.df.copy()
+        last = updated.index[-1]
+        updated.loc[last, 'close'] += 3.0
+        result = self.cache.calculate_indicators(updated, symbol="BTCUSDT", interval="4h")
+
+        expected = TechnicalAnalysisEngine().calculate_indicators(updated)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(len(self.cache), 1)
+        # 두 번째 호출은 형성 중인 봉 한 행만 계산한다 (전체 재계산 없음)
+        self.assertEqual(self.ta.calculate_indicators.call_count, 1)
+        pd.testing.assert_frame_equal(result, expected, rtol=1e-10)
+
+    def test_forming_row_matches_full_recompute(self):
+        ta = TechnicalAnalysisEngine()
+        cases = [None, {'N'}, {'ADX', 'ema_200'}, {'dc_20_high', 'dc_10_low'}, {'rsi_14', 'vol_sma_20'}]
+        for indicators in cases:
+            cache = IndicatorCache(ta)
+            cache.calculate_indicators(self.df, indicators=indicators, symbol="BTCUSDT", interval="4h")
+            for delta in (1.5, -2.0, 4.0):
+                updated = self.df.copy()
+                last = updated.index[-1]
+                updated.loc[last, 'close'] += delta
+                updated.loc[last, 'high'] = max(updated.loc[last, 'high'], updated.loc[last, 'close'])
+                updated.loc[last, 'low'] = min(updated.loc[last, 'low'], updated.loc[last, 'close'])
+                updated.loc[last, 'volume'] += 10.0
+                result = cache.calculate_indicators(updated, indicators=indicators, symbol="BTCUSDT", interval="4h")
+                expected = ta.calculate_indicators(updated, indicators=indicators)
+                pd.testing.assert_frame_equal(result, expected, rtol=1e-10)
+            self.assertEqual((cache.hits, cache.misses), (3, 1), indicators)
+
+    def test_seeded_frame_forming_row(self):
+        ta = TechnicalAnalysisEngine()
+        seed = ta.extract_seed(ta.calculate_indicators(make_klines(500)), 199)
+        df = make_klines(500).iloc[200:].reset_index(drop=True)
+        cache = IndicatorCache(ta)
+        cache.calculate_indicators(df, seed=seed, symbol="BTCUSDT", interval="4h")
+
+        updated = df.copy()
+        updated.loc[updated.index[-1], 'close'] -= 1.0
+        result = cache.calculate_indicators(updated, seed=seed, symbol="BTCUSDT", interval="4h")
+        self.assertEqual(cache.hits, 1)
+        pd.testing.assert_frame_equal(result, ta.calculate_indicators(updated, seed=seed), rtol=1e-10)
+
+    def test_new_closed_bar_is_recalculated(self):
+        self.cache.calculate_indicators(self.df.iloc[:-1], symbol="BTCUSDT", interval="4h")
+        self.cache.calculate_indicators(self.df.iloc[1:].reset_index(drop=True), symbol="BTCUSDT", interval="4h")
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_key_includes_indicator_set_and_symbol(self):
+        self.cache.calculate_indicators(self.df, symbol="BTCUSDT", interval="4h")
+        self.cache.calculate_indicators(self.df, symbol="BTCUSDT", interval="4h", indicators={'N'})
+        self.cache.calculate_indicators(self.df, symbol="ETHUSDT", interval="4h")
+        self.cache.calculate_indicators(make_klines(301), symbol="BTCUSDT", interval="4h")
+
+        self.assertEqual(self.cache.misses, 4)
+        self.assertEqual(len(self.cache), 4)
+
+    def test_lru_eviction(self):
+        cache = IndicatorCache(TechnicalAnalysisEngine(), max_entries=2)
+        for symbol in ("A", "B", "A", "C"):
+            cache.calculate_indicators(self.df, symbol=symbol, interval="4h")
+
+        self.assertEqual(len(cache), 2)
+        cache.calculate_indicators(self.df, symbol="A", interval="4h")
+        self.assertEqual(cache.hits, 2)
+        cache.calculate_indicators(self.df, symbol="B", interval="4h")
+        self.assertEqual(cache.misses, 4)
+
+    def test_byte_budget_is_enforced(self):
+        cache = IndicatorCache(TechnicalAnalysisEngine(), max_bytes=1)
+        cache.calculate_indicators(self.df, symbol="A", interval="4h")
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size_bytes, 0)
+
+    def test_without_symbol_bypasses_cache(self):
+        self.cache.calculate_indicators(self.df)
+        self.cache.calculate_indicators(self.df)
+        self.assertEqual(self.ta.calculate_indicators.call_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_concurrent_use(self):
+        cache = IndicatorCache(TechnicalAnalysisEngine(), max_entries=4)
+        frames = {s: make_klines(200, seed=s) for s in range(6)}
+        expected = {s: TechnicalAnalysisEngine().calculate_indicators(df) for s, df in frames.items()}
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(10):
+                    s = (i + offset) % 6
+                    result = cache.calculate_indicators(frames[s], symbol=str(s), interval="4h")
+                    pd.testing.assert_frame_equal(result, expected[s][result.columns])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(cache), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
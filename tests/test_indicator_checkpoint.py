@@ -0,0 +1,153 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.core.modules_impl import TechnicalAnalysisEngine
+from src.core.indicator_checkpoint import IndicatorCheckpoint
+
+
+def make_klines(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(n).cumsum()
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='4h'),
+        'open': close + rng.standard_normal(n) * 0.1,
+        'high': close + rng.random(n) + 0.2,
+        'low': close - rng.random(n) - 0.2,
+        'close': close,
+        'volume': rng.random(n) * 100,
+    })
+
+
+class TestIndicatorSeed(unittest.TestCase):
+    def test_seeded_calculation_matches_full_history(self):
+        ta = TechnicalAnalysisEngine()
+        df = make_klines(600)
+        full = ta.calculate_indicators(df)
+
+        seed = ta.extract_seed(full, 399)
+        tail = ta.calculate_indicators(df.iloc[400:].reset_index(drop=True), seed=seed)
+
+        for col in ['N', 'ADX', 'ema_200']:
+            np.testing.assert_allclose(tail[col].values, full[col].iloc[400:].values, rtol=1e-12)
+
+
+class TestIndicatorCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "indicator_state.json")
+        self.ta = TechnicalAnalysisEngine()
+        self.history = make_klines(700)
+        self.full = self.ta.calculate_indicators(self.history)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _window(self, end, size=100):
+        # 거래소 응답처럼 end-1 번째 봉이 형성 중인 마지막 봉
+        return self.history.iloc[end - size:end].reset_index(drop=True)
+
+    def test_restart_restores_converged_indicators(self):
+        checkpoint = IndicatorCheckpoint(self.ta, filepath=self.path, history_bars=300)
+        checkpoint.calculate("BTCUSDT", "4h", self.history.iloc[:500].reset_index(drop=True))
+        checkpoint.close()
+        self.assertTrue(os.path.exists(self.path))
+
+        restarted = IndicatorCheckpoint(self.ta, filepath=self.path, history_bars=300)
+        self.assertTrue(restarted.has("BTCUSDT", "4h"))
+        result = restarted.calculate("BTCUSDT", "4h", self._window(510))
+        restarted.close()
+
+        last = result.iloc[-1]
+        expected = self.full.iloc[509]
+        for col in ['N', 'ADX', 'ema_200', 'dc_90_high', 'dc_45_low']:
+            self.assertAlmostEqual(last[col], expected[col], places=9, msg=col)
+        self.assertEqual(last['timestamp'], expected['timestamp'])
+
+        with open(self.path) as f:
+            saved = json.load(f)["symbols"]["BTCUSDT|4h"]
+        self.assertEqual(len(saved["timestamp"]), 300)
+
+    def test_subset_checkpoint_still_seeds_all_ewm_indicators(self):
+        # 체크포인트를 쓸 때 전략이 Donchian만 요구했더라도, 나중에 ADX/EMA를 요구하면 전체 이력 값과 같아야 한다
+        checkpoint = IndicatorCheckpoint(self.ta, filepath=self.path, history_bars=300)
+        checkpoint.calculate("BTCUSDT", "4h", self.history.iloc[:500].reset_index(drop=True),
+                             indicators={'dc_20_high'})
+        checkpoint.close()
+
+        restarted = IndicatorCheckpoint(self.ta, filepath=self.path, history_bars=300)
+        result = restarted.calculate("BTCUSDT", "4h", self._window(510), indicators={'ADX', 'ema_200'})
+        restarted.close()
+        for col in ['N', 'ADX', 'ema_200']:
+            self.assertAlmostEqual(result[col].iloc[-1], self.full[col].iloc[509], places=9, msg=col)
+
+    def test_partial_seed_falls_back_to_unseeded_recompute(self):
+        checkpoint = IndicatorCheckpoint(self.ta, filepath=self.path, history_bars=300)
+        checkpoint.calculate("BTCUSDT", "4h", self.history.iloc[:500].reset_index(drop=True))
+        checkpoint.close()
+        with open(self.path) as f:
+            data = json.load(f)
+        seed = data["symbols"]["BTCUSDT|4h"]["seed"]
+        for key in ('ADX', 'ema_200'):
+            del seed[key]  # 이전 버전에서 일부 지표만 계산하며 쓴 체크포인트
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+
+        restarted = IndicatorCheckpoint(self.ta, filepath=self.path, history_bars=300)
+        result = restarted.calculate("BTCUSDT", "4h", self._window(510), indicators={'ADX'})
+        restarted.close()
+        # 보관된 이력(199번째 봉부터) 전체를 seed 없이 다시 계산한 값 (seed 일부와 섞이지 않는다)
+        expected = self.ta.calculate_indicators(self.history.iloc[199:510].reset_index(drop=True))
+        for col in ['N', 'ADX', 'ema_200']:
+            self.assertAlmostEqual(result[col].iloc[-1], expected[col].iloc[-1], places=9, msg=col)
+
+    def test_sliding_polls_keep_seed_and_match_full_history(self):
+        # 처음 300봉을 받은 뒤 매 폴링마다 최근 100봉만 받아도 seed가 유지되어 전체 이력 계산과 같아야 한다
+        checkpoint = IndicatorCheckpoint(self.ta, filepath=self.path, history_bars=300)
+        checkpoint.calculate("BTCUSDT", "4h", self.history.iloc[:300].reset_index(drop=True))
+        with self.assertNoLogs("BATS-Indicators", level="INFO"):
+            for end in range(301, 701):
+                result = checkpoint.calculate("BTCUSDT", "4h", self._window(end))
+                for col in ['N', 'ADX', 'ema_200']:
+                    self.assertAlmostEqual(result[col].iloc[-1], self.full[col].iloc[end - 1], places=9,
+                                           msg=f"{col} at {end}")
+        checkpoint.close()
+
+    def test_mismatched_overlap_discards_checkpoint(self):
+        checkpoint = IndicatorCheckpoint(self.ta, filepath=self.path, history_bars=300)
+        checkpoint.calculate("BTCUSDT", "4h", self.history.iloc[:500].reset_index(drop=True))
+
+        fresh = self._window(510).copy()
+        fresh.loc[5, 'close'] += 1.0
+        with self.assertLogs("BATS-Indicators", level="WARNING"):
+            result = checkpoint.calculate("BTCUSDT", "4h", fresh)
+        checkpoint.close()
+
+        self.assertEqual(len(result), len(fresh))
+
+    def test_gap_discards_checkpoint(self):
+        checkpoint = IndicatorCheckpoint(self.ta, filepath=self.path, history_bars=300)
+        checkpoint.calculate("BTCUSDT", "4h", self.history.iloc[:300].reset_index(drop=True))
+
+        with self.assertLogs("BATS-Indicators", level="WARNING"):
+            result = checkpoint.calculate("BTCUSDT", "4h", self._window(600))
+        checkpoint.close()
+
+        self.assertEqual(len(result), 100)
+
+    def test_periodic_checkpoint_respects_interval(self):
+        checkpoint = IndicatorCheckpoint(self.ta, filepath=self.path, checkpoint_interval=3600)
+        checkpoint.calculate("BTCUSDT", "4h", self._window(300))
+
+        self.assertFalse(checkpoint.checkpoint())
+        self.assertTrue(checkpoint.checkpoint(force=True))
+        checkpoint.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
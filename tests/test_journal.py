@@ -6,7 +6,9 @@ import json
 import os
 import shutil
 import tempfile
+from datetime import datetime, timezone
 from src.utils.journal import TradeJournal
+from src.utils.journal_store import AppendOnlyJournalStore
 
 
 class TestJournalEntry(unittest.TestCase):
@@ -204,5 +206,143 @@ class TestJournalReview(unittest.TestCase):
         self.assertFalse(ok)
 
 
+class TestJournalMultiSymbol(unittest.TestCase):
+    """심볼별 진행 중 거래 동시 관리 + 재시작 복원"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.journal = TradeJournal(journal_dir=self.tmpdir)
+        for symbol, price in (("BTCUSDT", 87500), ("ETHUSDT", 3000)):
+            self.journal.record_entry(
+                symbol=symbol, direction="LONG", entry_price=price,
+                unit_size=0.1, n_value=100, system_mode="S3",
+                entry_trigger="돌파", ema_200=price * 0.9,
+                skip_rule_applied=False, volatility_cap_applied=False, balance=100000
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_concurrent_active_trades(self):
+        self.assertEqual(set(self.journal.active_trades), {"BTCUSDT", "ETHUSDT"})
+        self.journal.record_pyramid(3050, new_n=100, symbol="ETHUSDT")
+        self.assertEqual(self.journal.get_active_trade("ETHUSDT")["total_units"], 2)
+        self.assertEqual(self.journal.get_active_trade("BTCUSDT")["total_units"], 1)
+
+        result = self.journal.record_exit(exit_price=88000, exit_trigger="청산", symbol="BTCUSDT")
+        self.assertEqual(result["symbol"], "BTCUSDT")
+        self.assertIsNone(self.journal.get_active_trade("BTCUSDT"))
+        self.assertIsNotNone(self.journal.get_active_trade("ETHUSDT"))
+
+    def test_ambiguous_exit_without_symbol_is_rejected(self):
+        self.assertIsNone(self.journal.record_exit(exit_price=88000, exit_trigger="청산"))
+        self.assertEqual(len(self.journal.active_trades), 2)
+
+    def test_active_trades_restored_after_restart(self):
+        reopened = TradeJournal(journal_dir=self.tmpdir)
+        self.assertEqual(set(reopened.active_trades), {"BTCUSDT", "ETHUSDT"})
+        result = reopened.record_exit(exit_price=3100, exit_trigger="청산", symbol="ETHUSDT")
+        self.assertAlmostEqual(result["pnl"], 10.0)
+
+
+class TestAppendOnlyJournal(unittest.TestCase):
+    """Append-only JSONL 백엔드: O(1) 기록 + trade_id 인덱스 조회"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.journal = TradeJournal(journal_dir=self.tmpdir, backend="jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _trade(self, price=87500, exit_price=90000):
+        tid = self.journal.record_entry(
+            symbol="BTCUSDT", direction="LONG", entry_price=price,
+            unit_size=0.1, n_value=1250, system_mode="S3",
+            entry_trigger="돌파", ema_200=82300,
+            skip_rule_applied=False, volatility_cap_applied=False, balance=100000
+        )
+        self.journal.record_exit(exit_price=exit_price, exit_trigger="청산")
+        return tid
+
+    def test_exit_appends_single_line(self):
+        self._trade()
+        self._trade()
+        files = [f for f in os.listdir(self.tmpdir) if f.endswith('.jsonl') and f != "index.jsonl"]
+        self.assertEqual(len(files), 1)
+        with open(os.path.join(self.tmpdir, files[0])) as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0])["op"], "trade")
+
+    def test_get_trade_by_id(self):
+        tid = self._trade(exit_price=92100)
+        trade = self.journal.get_trade(tid)
+        self.assertEqual(trade["exit_price"], 92100)
+        self.assertIsNone(self.journal.get_trade("T-FAKE-999"))
+
+    def test_review_is_appended_and_merged(self):
+        tid = self._trade()
+        self.assertTrue(self.journal.add_review(tid, "good", "bad"))
+        trade = self.journal.get_trade(tid)
+        self.assertEqual(trade["what_went_well"], "good")
+        self.assertEqual(trade["what_to_improve"], "bad")
+        self.assertFalse(self.journal.add_review("T-FAKE-999", "good", "bad"))
+
+    def test_review_across_months(self):
+        store = self.journal.store
+        old_entry = {"trade_id": "T-20240105-001", "symbol": "ETHUSDT",
+                     "what_went_well": None, "what_to_improve": None}
+        store.append(old_entry, datetime(2024, 1, 5, tzinfo=timezone.utc))
+        self.assertTrue(self.journal.add_review("T-20240105-001", "old good", "old bad"))
+        self.assertEqual(self.journal.get_trade("T-20240105-001")["what_went_well"], "old good")
+
+    def test_index_survives_restart(self):
+        tid = self._trade()
+        self.journal.add_review(tid, "good", "bad")
+        reopened = TradeJournal(journal_dir=self.tmpdir, backend="jsonl")
+        self.assertEqual(reopened.get_trade(tid)["what_went_well"], "good")
+
+    def test_trade_id_not_reused_after_restart(self):
+        tid = self._trade()
+        reopened = TradeJournal(journal_dir=self.tmpdir, backend="jsonl")
+        new_tid = reopened.record_entry(
+            symbol="ETHUSDT", direction="LONG", entry_price=3000,
+            unit_size=1, n_value=50, system_mode="S3", entry_trigger="돌파",
+            ema_200=2800, skip_rule_applied=False, volatility_cap_applied=False, balance=100000
+        )
+        self.assertNotEqual(tid, new_tid)
+
+    def test_recovers_unindexed_and_partial_records(self):
+        tid = self._trade()
+        os.remove(os.path.join(self.tmpdir, AppendOnlyJournalStore.INDEX_FILE))
+        data_file = [f for f in os.listdir(self.tmpdir) if f.endswith('.jsonl')][0]
+        with open(os.path.join(self.tmpdir, data_file), "ab") as f:
+            f.write(b'{"op": "trade", "data": {"trade_')  # 기록 도중 중단된 줄
+
+        store = AppendOnlyJournalStore(self.tmpdir)
+        self.assertIn(tid, store)
+        self.assertEqual(len(store), 1)
+        store.append({"trade_id": "T-NEW"}, datetime.now(timezone.utc))
+        self.assertEqual(store.get("T-NEW"), {"trade_id": "T-NEW"})
+        self.assertEqual(len(list(store.iter_entries())), 2)
+
+    def test_truncates_partial_index_line(self):
+        first, second = self._trade(), self._trade()
+        with open(os.path.join(self.tmpdir, AppendOnlyJournalStore.INDEX_FILE), "ab") as f:
+            f.write(b'{"trade_id": "T-')  # 인덱스 기록 도중 중단된 줄
+
+        store = AppendOnlyJournalStore(self.tmpdir)
+        store.append({"trade_id": "T-NEW"}, datetime.now(timezone.utc))
+
+        reopened = AppendOnlyJournalStore(self.tmpdir)
+        for trade_id in (first, second, "T-NEW"):
+            self.assertEqual(len(reopened._index[trade_id]), 1)
+            self.assertEqual(reopened.get(trade_id)["trade_id"], trade_id)
+        self.assertEqual(len(reopened), 3)
+        with open(os.path.join(self.tmpdir, AppendOnlyJournalStore.INDEX_FILE)) as f:
+            self.assertEqual([json.loads(line)["trade_id"] for line in f], [first, second, "T-NEW"])
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
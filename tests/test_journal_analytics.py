@@ -0,0 +1,124 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+
+from src.utils.journal import TradeJournal
+from src.utils.journal_analytics import JournalAnalytics, r_multiple
+from src.utils.journal_store import AppendOnlyJournalStore
+
+
+def _entry(trade_id, month, symbol, system, pnl, stop_honored=True, hours=24):
+    entry_time = datetime.fromisoformat(f"{month}-01T00:00:00+00:00")
+    exit_time = entry_time.replace(day=1 + hours // 24, hour=hours % 24)
+    return {
+        "trade_id": trade_id, "symbol": symbol, "system": system,
+        "entry_time": entry_time.isoformat(), "exit_time": exit_time.isoformat(),
+        "pnl": pnl, "n_at_entry": 100, "unit_size": 1.0,
+        "stop_loss_honored": stop_honored,
+    }
+
+
+class TestJournalAnalytics(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.store = AppendOnlyJournalStore(self.tmpdir)
+        entries = [
+            _entry("T-1", "2025-01", "BTCUSDT", "S3", 400),
+            _entry("T-2", "2025-01", "BTCUSDT", "S3", -200, stop_honored=False),
+            _entry("T-3", "2025-02", "ETHUSDT", "S3", 100),
+            _entry("T-4", "2025-03", "ETHUSDT", "S2", -100),
+        ]
+        for e in entries:
+            self.store.append(e, datetime.fromisoformat(e["exit_time"]))
+        self.analytics = JournalAnalytics(self.store, self.tmpdir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_r_multiple(self):
+        # 초기 리스크 = 2 * N(100) * 1 = 200
+        self.assertEqual(r_multiple({"pnl": 400, "n_at_entry": 100, "unit_size": 1.0}), 2.0)
+        self.assertIsNone(r_multiple({"pnl": 400, "n_at_entry": 0, "unit_size": 1.0}))
+
+    def test_group_by_symbol(self):
+        rows = {r["symbol"]: r for r in self.analytics.query(group_by=("symbol",))}
+        btc = rows["BTCUSDT"]
+        self.assertEqual(btc["trades"], 2)
+        self.assertEqual(btc["win_rate"], 50.0)
+        self.assertEqual(btc["total_pnl"], 200)
+        self.assertAlmostEqual(btc["avg_r"], 0.5)
+        self.assertEqual(btc["stop_honored_ratio"], 0.5)
+        self.assertEqual(btc["profit_factor"], 2.0)
+        self.assertEqual(btc["avg_holding_hours"], 24.0)
+
+    def test_filters(self):
+        rows = self.analytics.query(systems=["S3"], since="2025-02", group_by=())
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["trades"], 1)
+        self.assertEqual(rows[0]["total_pnl"], 100)
+
+        rows = self.analytics.query(symbols=["ETHUSDT"], group_by=("system",))
+        self.assertEqual([r["system"] for r in rows], ["S2", "S3"])
+
+    def test_last_months(self):
+        rows = self.analytics.last_months(2, now=datetime(2025, 3, 15, tzinfo=timezone.utc), group_by=("month",))
+        self.assertEqual([r["month"] for r in rows], ["2025-02", "2025-03"])
+
+    def test_invalid_group_key(self):
+        with self.assertRaises(ValueError):
+            self.analytics.query(group_by=("exchange",))
+
+    def test_aggregates_persist_and_detect_staleness(self):
+        reopened = JournalAnalytics(self.store, self.tmpdir)
+        self.assertEqual(reopened.trade_count, 4)
+
+        # 집계 없이 추가된 거래가 있으면 재구성한다.
+        e = _entry("T-5", "2025-03", "BTCUSDT", "S3", 50)
+        self.store.append(e, datetime.fromisoformat(e["exit_time"]))
+        self.assertEqual(JournalAnalytics(self.store, self.tmpdir).trade_count, 5)
+
+    def test_skipped_entries_do_not_force_rebuild(self):
+        # 청산 정보가 없는 거래는 집계에서 제외되지만 store 크기 비교에는 포함되어야 한다
+        self.store.append({"trade_id": "T-OPEN", "symbol": "BTCUSDT"}, datetime(2025, 3, 1, tzinfo=timezone.utc))
+        self.assertEqual(JournalAnalytics(self.store, self.tmpdir).trade_count, 4)
+
+        self.store.iter_entries = None  # 재구성하면 실패한다
+        reopened = JournalAnalytics(self.store, self.tmpdir)
+        self.assertEqual(reopened.trade_count, 4)
+        self.assertTrue(self.store.update("T-1", {"what_went_well": "good"}))
+        self.assertEqual(JournalAnalytics(self.store, self.tmpdir).trade_count, 4)
+
+    def test_query_does_not_read_store(self):
+        self.store.iter_entries = None  # 질의가 원본을 읽으면 실패한다
+        started = time.perf_counter()
+        self.analytics.query(group_by=("symbol", "system"))
+        self.assertLess(time.perf_counter() - started, 0.05)
+
+
+class TestTradeJournalAnalytics(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_exit_updates_aggregates(self):
+        journal = TradeJournal(journal_dir=self.tmpdir, backend="jsonl", analytics=True)
+        journal.record_entry(
+            symbol="BTCUSDT", direction="LONG", entry_price=87500,
+            unit_size=0.1, n_value=1250, system_mode="S3", entry_trigger="돌파",
+            ema_200=82300, skip_rule_applied=False, volatility_cap_applied=False, balance=100000
+        )
+        journal.record_exit(exit_price=90000, exit_trigger="청산")
+        rows = journal.analytics.query(group_by=("symbol",))
+        self.assertEqual(rows[0]["symbol"], "BTCUSDT")
+        self.assertEqual(rows[0]["trades"], 1)
+        self.assertEqual(rows[0]["win_rate"], 100.0)
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir, JournalAnalytics.AGGREGATES_FILE)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from src.core.modules_impl import RiskManager
+from src.core.signal_manager import TurtleSignalManager
+from src.main_loop import MainLoop
+from src.utils.background_worker import BackgroundWorker
+
+
+class TestBackgroundWorker(unittest.TestCase):
+    def test_tasks_run_in_order_off_caller_thread(self):
+        worker = BackgroundWorker(name="TestWorker")
+        results = []
+        caller = threading.get_ident()
+        for i in range(5):
+            worker.submit(lambda i=i: results.append((i, threading.get_ident() != caller)))
+        worker.close()
+        self.assertEqual([r[0] for r in results], list(range(5)))
+        self.assertTrue(all(r[1] for r in results))
+
+    def test_failing_task_does_not_stop_worker(self):
+        worker = BackgroundWorker(name="TestWorker")
+        results = []
+        worker.submit(lambda: 1 / 0)
+        worker.submit(lambda: results.append("ok"))
+        self.assertTrue(worker.flush(timeout=5))
+        self.assertEqual(results, ["ok"])
+        worker.close()
+        with self.assertRaises(RuntimeError):
+            worker.submit(lambda: None)
+
+
+class TestMainLoopJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.config = {
+            'symbols': [
+                {'name': 'BTCUSDT', 'enabled': True, 'timeframe': '4h'},
+                {'name': 'ETHUSDT', 'enabled': True, 'timeframe': '4h'},
+            ],
+            'risk': {'unit_risk_percent': 0.01, 'max_portfolio_heat': 0.2},
+            'journal': {'enabled': True, 'dir': self.tmpdir, 'backend': 'jsonl'},
+        }
+        self.exchange = MagicMock()
+        self.exchange.get_realtime_price.return_value = 100.0
+        self.exchange.get_asset_balance.return_value = 10000.0
+        self.ta = MagicMock()
+        self.ta.calculate_indicators.return_value = pd.DataFrame({'N': [2.0] * 30, 'ema_200': [90.0] * 30})
+        self.signal = MagicMock(spec=['generate_signal'])
+        self.risk = MagicMock()
+        self.risk.calculate_total_heat.return_value = 0.0
+        self.risk.calculate_unit_size.return_value = 1.5
+        self.risk.can_entry.return_value = True
+        self.execution = MagicMock()
+        self.execution.execute_order.return_value = True
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    @patch('src.main_loop.JSONPersistence')
+    def test_entries_pyramids_and_exits_are_journaled_per_symbol(self, MockP):
+        MockP.return_value.load.return_value = {"symbols": {}}
+        MockP.return_value.get_symbol_state.side_effect = \
+            lambda state, symbol: state['symbols'].setdefault(symbol, {'units_held': 0, 'entry_prices': [], 'system_mode': 'S3'})
+        loop = MainLoop(self.config, self.exchange, self.ta, self.signal, self.risk, self.execution)
+
+        self.signal.generate_signal.return_value = "BUY"
+        loop.run_once()
+        self.signal.generate_signal.side_effect = lambda df, price, state: "PYRAMID"
+        loop.run_once()
+        loop.journal_worker.flush(timeout=5)
+
+        self.assertEqual(set(loop.journal.active_trades), {"BTCUSDT", "ETHUSDT"})
+        self.assertEqual(loop.journal.get_active_trade("BTCUSDT")["total_units"], 2)
+        self.assertEqual(loop.journal.get_active_trade("BTCUSDT")["ema_200_at_entry"], 90.0)
+
+        self.signal.generate_signal.side_effect = lambda df, price, state: "EXIT"
+        loop.run_once()
+        loop.shutdown()
+
+        self.assertEqual(loop.journal.active_trades, {})
+        trades = list(loop.journal.store.iter_entries())
+        self.assertEqual(sorted(t["symbol"] for t in trades), ["BTCUSDT", "ETHUSDT"])
+        self.assertTrue(all(t["total_units"] == 2 for t in trades))
+
+    def test_strategy_rules_are_journaled_for_every_account(self):
+        config = dict(self.config, symbols=[{'name': 'BTCUSDT', 'timeframe': '4h'}],
+                      persistence={'path': os.path.join(self.tmpdir, 'state.json')},
+                      accounts=[{'name': 'sub1', 'state_path': os.path.join(self.tmpdir, 'state_sub1.json')}])
+        self.ta.calculate_indicators.return_value = pd.DataFrame({
+            'N': [2.0] * 30, 'ADX': [30.0] * 30, 'ema_200': [90.0] * 30,
+            'dc_90_high': [95.0] * 30, 'dc_20_high': [95.0] * 30, 'dc_10_low': [80.0] * 30})
+
+        def account_factory(account_cfg):
+            exchange = MagicMock()
+            exchange.get_asset_balance.return_value = 5000.0
+            execution = MagicMock()
+            execution.execute_order.return_value = True
+            return exchange, execution
+
+        loop = MainLoop(config, self.exchange, self.ta, TurtleSignalManager(use_s1=True), RiskManager(),
+                        self.execution, account_factory=account_factory)
+        loop.notifier = MagicMock()
+        for account in loop._accounts():
+            account.persistence.get_symbol_state(account.state, 'BTCUSDT')['last_trade_result'] = 'win'
+
+        loop.run_once()  # S1은 Skip Rule로 건너뛰고 S3로 진입
+        self.exchange.get_realtime_price.return_value = 85.0  # 100 - 5N(=10) 아래로 하락 -> 하드 스톱
+        loop.run_once()
+        loop.shutdown()
+
+        for journal in (loop.journal, loop.account_journals['sub1']):
+            trade, = journal.store.iter_entries()
+            self.assertEqual(trade['system'], 'S3')
+            self.assertTrue(trade['skip_rule'])
+            self.assertEqual(trade['stop_loss_level'], 90.0)
+            self.assertEqual(trade['exit_trigger'], 'hard_stop_5n')
+            self.assertTrue(trade['stop_loss_honored'])
+        self.assertEqual(loop.account_journals['sub1'].journal_dir, os.path.join(self.tmpdir, 'sub1'))
+
+
+if __name__ == "__main__":
+    unittest.main()
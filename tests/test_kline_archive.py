@@ -0,0 +1,107 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+import numpy as np
+
+from src.utils.kline_archive import KlineArchiveImporter, find_archives, read_archive, validate
+from src.utils.kline_store import KlineStore
+
+MINUTE = 60_000
+HEADER = "open_time,open,high,low,close,volume,close_time,quote_volume,count,taker_buy_volume,taker_buy_quote_volume,ignore\n"
+
+
+def csv_rows(start_ms, n, scale=1):
+    lines = []
+    for i in range(n):
+        t = start_ms + i * MINUTE
+        price = 100 + i
+        lines.append(f"{t * scale},{price},{price + 1},{price - 1},{price + 0.5},10,{(t + MINUTE - 1) * scale},"
+                     f"1000,5,4,400,0\n")
+    return "".join(lines)
+
+
+class TestKlineArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.archive_dir = os.path.join(self.tmpdir, 'archive')
+        os.makedirs(os.path.join(self.archive_dir, 'BTCUSDT'))
+        self.store = KlineStore(os.path.join(self.tmpdir, 'klines'), max_bars=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write_zip(self, name, content, checksum=True):
+        path = os.path.join(self.archive_dir, 'BTCUSDT', f"{name}.zip")
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(f"{name}.csv", content)
+        if checksum:
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            with open(f"{path}.CHECKSUM", 'w') as f:
+                f.write(f"{digest}  {name}.zip\n")
+        return path
+
+    def test_reads_headers_and_microseconds(self):
+        plain = read_archive(self.write_zip("BTCUSDT-1m-2024-12", csv_rows(1_733_011_200_000, 3)))
+        header_us = read_archive(self.write_zip("BTCUSDT-1m-2025-01", HEADER + csv_rows(1_735_689_600_000, 3, 1000)))
+        self.assertEqual(plain['timestamp'][0], 1_733_011_200_000)
+        self.assertEqual(header_us['timestamp'][0], 1_735_689_600_000)
+        self.assertEqual(header_us['close'][1], 101.5)
+
+    def test_reads_in_chunks(self):
+        path = self.write_zip("BTCUSDT-1m-2025-02", HEADER + csv_rows(1_738_368_000_000, 25, 1000))
+        whole = read_archive(path)
+        chunked = read_archive(path, chunk_rows=4)
+        for col in whole:
+            np.testing.assert_array_equal(chunked[col], whole[col])
+        self.assertEqual(chunked['timestamp'][-1], 1_738_368_000_000 + 24 * MINUTE)
+
+    def test_import_merges_validates_and_skips_bad_checksum(self):
+        start = 1_700_000_000_000 - 1_700_000_000_000 % MINUTE
+        self.write_zip("BTCUSDT-1m-2023-11-14", csv_rows(start, 10))
+        # 다음 날 파일: 앞 2봉 중복, 5봉 공백
+        self.write_zip("BTCUSDT-1m-2023-11-15", csv_rows(start + 8 * MINUTE, 2) + csv_rows(start + 15 * MINUTE, 5))
+        bad = self.write_zip("BTCUSDT-1m-2023-11-16", csv_rows(start + 20 * MINUTE, 5))
+        with open(f"{bad}.CHECKSUM", 'w') as f:
+            f.write("0" * 64)
+
+        reports = KlineArchiveImporter(self.store, workers=2).import_directory(self.archive_dir)
+        report = reports[('BTCUSDT', '1m')]
+        self.assertEqual((report['rows'], report['duplicates'], report['missing_bars']), (15, 2, 5))
+        self.assertEqual(report['gaps'], [(start + 10 * MINUTE, start + 14 * MINUTE)])
+
+        stored = KlineStore(self.store.directory).load('BTCUSDT', '1m')
+        self.assertTrue(np.all(np.diff(stored['timestamp']) > 0))
+
+        # 이미 저장된 이력과 합칠 때 기존 봉은 유지된다
+        shutil.rmtree(os.path.join(self.archive_dir, 'BTCUSDT'))
+        os.makedirs(os.path.join(self.archive_dir, 'BTCUSDT'))
+        self.write_zip("BTCUSDT-1m-2023-11-16", csv_rows(start + 20 * MINUTE, 5))
+        report = KlineArchiveImporter(self.store).import_directory(self.archive_dir)[('BTCUSDT', '1m')]
+        self.assertEqual(report['rows'], 20)
+
+    def test_find_archives_filters_and_orders(self):
+        self.write_zip("BTCUSDT-1h-2024-02", "", checksum=False)
+        self.write_zip("BTCUSDT-1h-2024-01", "", checksum=False)
+        with open(os.path.join(self.archive_dir, 'BTCUSDT', "BTCUSDT-1h-2024-01.csv"), 'w') as f:
+            f.write("")
+        found = find_archives(self.archive_dir, intervals=['1h'])
+        self.assertEqual([os.path.basename(p) for p in found[('BTCUSDT', '1h')]],
+                         ["BTCUSDT-1h-2024-01.zip", "BTCUSDT-1h-2024-02.zip"])
+        self.assertEqual(find_archives(self.archive_dir, symbols=['ETHUSDT']), {})
+
+    def test_validate_keeps_latest_duplicate(self):
+        columns = {'timestamp': np.array([2, 1, 2], dtype='int64') * MINUTE,
+                   'open': np.array([1., 2., 3.]), 'high': np.ones(3), 'low': np.ones(3),
+                   'close': np.ones(3), 'volume': np.ones(3)}
+        cleaned, report = validate(columns, '1m')
+        self.assertEqual(cleaned['open'].tolist(), [2.0, 3.0])
+        self.assertEqual(report['duplicates'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from src.utils.kline_quality import check_klines, repair_klines
+
+HOUR = 3_600_000
+
+
+def series(n, start=1_700_000_000_000 - 1_700_000_000_000 % HOUR, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return {
+        'timestamp': start + HOUR * np.arange(n, dtype='int64'),
+        'open': open_,
+        'high': np.maximum(open_, close) * 1.001,
+        'low': np.minimum(open_, close) * 0.999,
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    }
+
+
+def drop(columns, idx):
+    keep = np.ones(len(columns['timestamp']), dtype=bool)
+    keep[idx] = False
+    return {col: values[keep] for col, values in columns.items()}
+
+
+class TestKlineQuality(unittest.TestCase):
+    def test_detects_each_anomaly(self):
+        columns = series(200)
+        columns['volume'][10] = 0
+        columns['close'][50] *= 3  # 스파이크
+        columns['high'][50] = columns['close'][50]
+        columns['high'][70] = columns['low'][70] * 0.5  # high < low
+        columns = drop(columns, [100, 101, 102])
+        dup = {col: np.r_[values, values[5:6]] for col, values in columns.items()}
+
+        _, report = check_klines(dup, '1h')
+        self.assertEqual(report.duplicates, 1)
+        self.assertEqual(report.gaps, [(int(columns['timestamp'][99] + HOUR), int(columns['timestamp'][99] + 3 * HOUR), 3)])
+        self.assertEqual(report.zero_volume.tolist(), [10])
+        self.assertIn(50, report.outliers.tolist())
+        self.assertEqual(report.invalid.tolist(), [70])
+        self.assertFalse(report.clean)
+
+        _, clean = check_klines(series(200), '1h')
+        self.assertTrue(clean.clean)
+
+    def test_repair_refetches_then_forward_fills(self):
+        full = series(50)
+        gappy = drop(full, [10, 11, 30])
+        calls = []
+
+        def refetch(start, end):
+            calls.append((start, end))
+            if start == full['timestamp'][10]:
+                return {col: values[10:12] for col, values in full.items()}
+            raise IOError("unavailable")
+
+        repaired, report = repair_klines(gappy, '1h', refetch=refetch)
+        self.assertEqual(report.missing_bars, 3)
+        self.assertEqual(len(calls), 2)
+        np.testing.assert_array_equal(repaired['timestamp'], full['timestamp'])
+        self.assertEqual(repaired['close'][10], full['close'][10])
+        self.assertFalse(repaired['filled'][10])
+        self.assertTrue(repaired['filled'][30])
+        self.assertEqual(repaired['open'][30], full['close'][29])
+        self.assertEqual(repaired['volume'][30], 0.0)
+
+    def test_repair_dataframe_keeps_timestamp_dtype(self):
+        df = pd.DataFrame(drop(series(20), [5]))
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        repaired, _ = repair_klines(df, '1h')
+        self.assertEqual(len(repaired), 20)
+        self.assertEqual(repaired['timestamp'].dtype, df['timestamp'].dtype)
+        self.assertEqual(int(repaired['filled'].sum()), 1)
+
+    def test_millions_of_bars_under_a_second(self):
+        columns = drop(series(2_000_000), np.arange(1000, 2_000_000, 50_000))
+        started = time.perf_counter()
+        repaired, report = repair_klines(columns, '1h')
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertEqual(report.missing_bars, 40)
+        self.assertEqual(len(repaired['timestamp']), 2_000_000)
+
+
+class TestMultiBacktestAlignment(unittest.TestCase):
+    def test_symbols_are_aligned_by_timestamp(self):
+        from src.multi_backtest import MultiSymbolBacktestEngine
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        config_path = os.path.join(tmpdir, 'config.json')
+        with open(config_path, 'w') as f:
+            json.dump({'symbols': ['AAAUSDT', 'BBBUSDT'], 'interval': '1h', 'limit': 300}, f)
+
+        a = series(300, seed=1)
+        b = drop(series(300, seed=2), [150, 151])  # BBB에 2봉 누락
+        klines = {sym: [[int(t), o, h, l, c, v] for t, o, h, l, c, v in
+                        zip(*(cols[k] for k in ('timestamp', 'open', 'high', 'low', 'close', 'volume')))]
+                  for sym, cols in (('AAAUSDT', a), ('BBBUSDT', b))}
+
+        def fake_urlopen(url):
+            symbol = url.split('symbol=')[1].split('&')[0]
+            return io.BytesIO(json.dumps(klines[symbol]).encode())
+
+        engine = MultiSymbolBacktestEngine(config_path)
+        with patch('urllib.request.urlopen', side_effect=fake_urlopen):
+            engine.run()
+
+        # 누락 봉이 채워져 두 심볼이 같은 시각축을 공유한다
+        self.assertEqual(len(engine.equity_curve), 300 - 90)
+        self.assertEqual(engine.equity_curve[-1]['timestamp'], str(a['timestamp'][-1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
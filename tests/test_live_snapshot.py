@@ -0,0 +1,119 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from src.core.modules_impl import RiskManager
+from src.core.signal_manager import TurtleSignalManager
+from src.main_loop import MainLoop
+from src.utils.live_snapshot import HEADER, MAGIC, SnapshotPublisher, SnapshotReader, process_alive
+
+
+class TestSnapshotSharedMemory(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'snapshot.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_roundtrip_and_unpublished(self):
+        publisher = SnapshotPublisher(self.path, capacity=4096)
+        reader = SnapshotReader(self.path)
+        self.assertIsNone(reader.read())
+        self.assertTrue(publisher.publish({'iteration': 1, 'symbols': {'BTCUSDT': {'price': 1.5}}}))
+        self.assertEqual(reader.read()['symbols']['BTCUSDT']['price'], 1.5)
+        self.assertFalse(publisher.publish({'blob': 'x' * 5000}))
+        self.assertEqual(reader.read()['iteration'], 1)
+        publisher.close()
+        self.assertIsNone(SnapshotReader(os.path.join(self.tmpdir, 'missing')).read())
+
+    def test_reader_never_sees_partial_write(self):
+        publisher = SnapshotPublisher(self.path, capacity=1 << 16)
+        reader = SnapshotReader(self.path)
+        publisher.publish({'n': 0, 'pad': ''})
+        stop = threading.Event()
+
+        def write():
+            n = 0
+            while not stop.is_set():
+                n += 1
+                publisher.publish({'n': n, 'pad': str(n) * (n % 500)})
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(2000):
+                snapshot = reader.read(retries=10000)
+                if snapshot is not None:
+                    self.assertEqual(snapshot['pad'], str(snapshot['n']) * (snapshot['n'] % 500))
+        finally:
+            stop.set()
+            writer.join()
+            publisher.close()
+
+    def test_writer_in_progress_is_not_read(self):
+        publisher = SnapshotPublisher(self.path, capacity=4096)
+        publisher.publish({'n': 1})
+        publisher._map[:HEADER.size] = HEADER.pack(MAGIC, 1, 3, 0)  # 쓰는 중(홀수)
+        self.assertIsNone(SnapshotReader(self.path).read(retries=3))
+        publisher.close()
+
+    def test_process_alive(self):
+        self.assertTrue(process_alive(os.getpid()))
+
+
+class TestTriggerLevels(unittest.TestCase):
+    def test_levels(self):
+        manager = TurtleSignalManager(use_s2=True, stop_n_multiplier=5.0)
+        row = {'dc_90_high': 110.0, 'dc_55_high': 105.0, 'dc_45_low': 90.0}
+        self.assertEqual(manager.trigger_levels(row, {'units_held': 0}), {'s2_entry': 105.0, 's3_entry': 110.0})
+        levels = manager.trigger_levels(row, {'units_held': 2, 'entry_prices': [100.0, 102.0],
+                                              'current_n': 2.0, 'system_mode': 'S3'})
+        self.assertEqual(levels, {'trailing_stop': 90.0, 'hard_stop': 92.0, 'pyramid': 103.0})
+
+
+class TestMainLoopPublishesSnapshot(unittest.TestCase):
+    def test_run_once_publishes_symbol_state(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, 'snapshot.bin')
+        config = {
+            'symbols': [{'name': 'BTCUSDT', 'timeframe': '4h'}],
+            'persistence': {'path': os.path.join(tmpdir, 'state.json')},
+            'live_snapshot': {'enabled': True, 'path': path, 'capacity': 65536},
+        }
+        exchange = MagicMock()
+        exchange.get_market_data.return_value = MagicMock()
+        exchange.get_realtime_price.return_value = 120.0
+        exchange.get_asset_balance.return_value = 10000.0
+        ta = MagicMock()
+        ta.calculate_indicators.return_value = pd.DataFrame({
+            'close': [119.0] * 30, 'N': [2.0] * 30, 'ADX': [30.0] * 30, 'ema_200': [100.0] * 30,
+            'dc_90_high': [115.0] * 30, 'dc_45_low': [float('nan')] * 30})
+        execution = MagicMock()
+        execution.execute_order.return_value = True
+
+        loop = MainLoop(config, exchange, ta, TurtleSignalManager(), RiskManager(), execution)
+        loop.notifier = MagicMock()
+        loop.run_once()
+
+        snapshot = SnapshotReader(path).read()
+        self.assertEqual(snapshot['pid'], os.getpid())
+        self.assertEqual(snapshot['iteration'], 1)
+        btc = snapshot['symbols']['BTCUSDT']
+        self.assertEqual(btc['price'], 120.0)
+        self.assertEqual(btc['indicators'], {'N': 2.0, 'ADX': 30.0, 'ema_200': 100.0, 'dc_90_high': 115.0})
+        position = btc['positions']['primary']
+        self.assertEqual(position['units_held'], 1)
+        self.assertEqual(position['levels']['hard_stop'], 120.0 - 5.0 * 2.0)
+        self.assertAlmostEqual(snapshot['accounts']['primary']['total_heat'], 0.01)
+        loop.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
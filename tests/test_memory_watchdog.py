@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+import threading
+import tracemalloc
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from src.core.modules_impl import RiskManager
+from src.core.signal_manager import TurtleSignalManager
+from src.main_loop import MainLoop
+from src.utils.memory_watchdog import MemoryWatchdog, read_rss
+
+MB = 2**20
+
+
+class TestMemoryWatchdog(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.rss = 100 * MB
+        self.notify = MagicMock()
+
+    def watchdog(self, **kwargs):
+        return MemoryWatchdog(interval=60, growth_threshold_mb=50, notify=self.notify,
+                              clock=lambda: self.now, rss_reader=lambda: self.rss, **kwargs)
+
+    def test_read_rss(self):
+        self.assertGreater(read_rss(), 0)
+
+    def test_interval_and_threshold_alerts(self):
+        watchdog = self.watchdog(trace=False)
+        self.assertEqual(watchdog.check()['growth_mb'], 0.0)
+        self.assertIsNone(watchdog.check())
+
+        self.now, self.rss = 1800.0, 130 * MB
+        report = watchdog.check()
+        self.assertEqual((report['growth_mb'], report['growth_mb_per_hour']), (30.0, 60.0))
+        self.notify.assert_not_called()
+
+        self.now, self.rss = 3600.0, 160 * MB
+        watchdog.check()
+        self.assertEqual(self.notify.call_count, 1)
+        self.assertEqual(self.notify.call_args[0][0], "Memory Warning")
+
+        # 같은 단계 안에서는 다시 알리지 않고, 다음 배수를 넘으면 다시 알린다
+        self.now, self.rss = 3700.0, 170 * MB
+        watchdog.check()
+        self.assertEqual(self.notify.call_count, 1)
+        self.now, self.rss = 3800.0, 210 * MB
+        watchdog.check()
+        self.assertEqual(self.notify.call_count, 2)
+
+    def test_reports_growing_allocation_sites(self):
+        was_tracing = tracemalloc.is_tracing()
+        watchdog = self.watchdog(top=3, trace=True)
+        watchdog.start()
+        self.addCleanup(watchdog.stop)
+        snapshot_threads = []
+        take_snapshot = tracemalloc.take_snapshot
+
+        def recording_snapshot():
+            snapshot_threads.append(threading.get_ident())
+            return take_snapshot()
+
+        with patch('src.utils.memory_watchdog.tracemalloc.take_snapshot', recording_snapshot):
+            watchdog.check()
+            self.assertTrue(watchdog.flush(5))
+
+            leak = [bytearray(1024) for _ in range(2000)]  # 이 줄이 증가 1위여야 한다
+            self.now, self.rss = 60.0, 200 * MB
+            report = watchdog.check()
+            self.assertTrue(watchdog.flush(5))
+
+        # 스냅샷/비교는 트레이딩(호출) 스레드가 아닌 워커에서 수행된다
+        self.assertEqual(len(snapshot_threads), 2)
+        self.assertNotIn(threading.get_ident(), snapshot_threads)
+        site = report['top'][0]
+        self.assertTrue(site['site'].endswith(f"test_memory_watchdog.py:{leak_line()}"), site)
+        self.assertGreater(site['size_kb'], 2000)
+        self.assertIn(site['site'], self.notify.call_args[0][1])
+        del leak
+
+        watchdog.stop()
+        self.assertEqual(tracemalloc.is_tracing(), was_tracing)
+
+    def test_rss_only_by_default(self):
+        watchdog = self.watchdog()
+        watchdog.start()
+        self.addCleanup(watchdog.stop)
+        self.assertFalse(tracemalloc.is_tracing())
+        watchdog.check()
+        self.now, self.rss = 60.0, 200 * MB
+        self.assertEqual(watchdog.check()['top'], [])
+        self.assertEqual(self.notify.call_count, 1)
+
+
+def leak_line():
+    with open(__file__) as f:
+        return next(i for i, line in enumerate(f, 1) if line.lstrip().startswith('leak = '))
+
+
+class TestMainLoopMemory(unittest.TestCase):
+    def test_check_after_iteration_and_in_snapshot(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        config = {
+            'symbols': [{'name': 'BTCUSDT', 'timeframe': '4h'}],
+            'persistence': {'path': os.path.join(tmpdir, 'state.json')},
+            'health': {'enabled': True, 'port': 0},
+            'memory': {'enabled': True},
+        }
+        exchange = MagicMock()
+        exchange.get_market_data.return_value = MagicMock()
+        exchange.get_realtime_price.return_value = 90.0
+        exchange.get_asset_balance.return_value = 10000.0
+        ta = MagicMock()
+        ta.calculate_indicators.return_value = pd.DataFrame({
+            'N': [2.0] * 30, 'ADX': [30.0] * 30, 'ema_200': [100.0] * 30, 'dc_90_high': [115.0] * 30})
+
+        loop = MainLoop(config, exchange, ta, TurtleSignalManager(), RiskManager(), MagicMock())
+        self.addCleanup(loop.health_server.close)
+        loop.notifier = MagicMock()
+        loop.run_once()
+
+        self.assertFalse(loop.memory_watchdog.trace)  # 기본은 RSS만 감시
+        self.assertIsNotNone(loop.memory_watchdog.baseline_rss)
+        self.assertEqual(loop.status_snapshot['memory']['growth_mb'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
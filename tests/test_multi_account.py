@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from src.core.modules_impl import RiskManager
+from src.main_loop import MainLoop
+
+
+class TestMultiAccount(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.config = {
+            "risk": {"max_portfolio_heat": 0.2, "unit_risk_percent": 0.01},
+            "persistence": {"path": os.path.join(self.tmpdir, "state.json")},
+            "symbols": [
+                {"name": "BTCUSDT", "timeframe": "4h"},
+                {"name": "ETHUSDT", "timeframe": "4h"},
+            ],
+            "accounts": [
+                {"name": "sub1", "state_path": os.path.join(self.tmpdir, "state_sub1.json")},
+                {"name": "sub2", "state_path": os.path.join(self.tmpdir, "state_sub2.json")},
+                {"name": "off", "enabled": False},
+            ],
+        }
+        self.exchange = MagicMock()
+        self.exchange.get_market_data.return_value = MagicMock()
+        self.exchange.get_realtime_price.return_value = 100.0
+        self.exchange.get_asset_balance.return_value = 10000.0
+        self.ta = MagicMock()
+        self.ta.calculate_indicators.return_value = pd.DataFrame({'N': [2.0] * 30})
+        self.signal_manager = MagicMock()
+        self.signal_manager.generate_signal.return_value = "BUY"
+        self.execution = MagicMock()
+        self.execution.execute_order.return_value = True
+
+        self.account_exchanges = {}
+        self.account_executions = {}
+
+        def account_factory(account_cfg):
+            exchange = MagicMock()
+            exchange.get_asset_balance.return_value = 5000.0
+            execution = MagicMock()
+            execution.execute_order.return_value = True
+            self.account_exchanges[account_cfg["name"]] = exchange
+            self.account_executions[account_cfg["name"]] = execution
+            return exchange, execution
+
+        self.loop = MainLoop(self.config, self.exchange, self.ta, self.signal_manager, RiskManager(),
+                             self.execution, account_factory=account_factory)
+        self.loop.notifier = MagicMock()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_market_data_fetched_once_per_symbol(self):
+        self.loop.run_once()
+
+        self.assertEqual(sorted(self.account_exchanges), ["sub1", "sub2"])
+        self.assertEqual(self.exchange.get_market_data.call_count, 2)
+        self.assertEqual(self.exchange.get_realtime_price.call_count, 2)
+        self.assertEqual(self.ta.calculate_indicators.call_count, 2)
+        for exchange in self.account_exchanges.values():
+            exchange.get_market_data.assert_not_called()
+            exchange.get_asset_balance.assert_called_once_with("USDT")
+        self.exchange.get_asset_balance.assert_called_once_with("USDT")
+
+    def test_orders_and_state_are_per_account(self):
+        self.loop.run_once()
+
+        self.assertEqual(self.execution.execute_order.call_count, 2)
+        for execution in self.account_executions.values():
+            self.assertEqual(execution.execute_order.call_count, 2)
+        # 기본 계정은 잔고 10000, 추가 계정은 5000 -> 유닛 크기도 계정별
+        primary_size = self.execution.execute_order.call_args_list[0].args[2]
+        sub_size = self.account_executions["sub1"].execute_order.call_args_list[0].args[2]
+        self.assertAlmostEqual(primary_size, sub_size * 2)
+
+        self.assertEqual(self.loop.state["symbols"]["BTCUSDT"]["units_held"], 1)
+        self.assertAlmostEqual(self.loop.state["total_heat"], 0.02)
+        sub1 = self.loop.extra_accounts[0]
+        self.assertEqual(sub1.state["symbols"]["ETHUSDT"]["units_held"], 1)
+        self.assertAlmostEqual(sub1.state["total_heat"], 0.02)
+
+        self.loop.shutdown()
+        with open(os.path.join(self.tmpdir, "state_sub2.json")) as f:
+            self.assertEqual(json.load(f)["symbols"]["BTCUSDT"]["units_held"], 1)
+        self.assertIn("BTCUSDT@sub1", [c.args[1] for c in self.loop.notifier.send_trade.call_args_list])
+
+    def test_heat_limit_applies_per_account(self):
+        self.loop.extra_accounts[0].persistence.get_symbol_state(self.loop.extra_accounts[0].state, "BTCUSDT")
+        self.loop.extra_accounts[0].state["symbols"]["BTCUSDT"].update(units_held=20, entry_prices=[90.0])
+        self.signal_manager.generate_signal.side_effect = \
+            lambda df, price, state: "HOLD" if state.get("units_held", 0) >= 20 else "BUY"
+
+        self.loop.run_once()
+
+        self.account_executions["sub1"].execute_order.assert_not_called()
+        self.assertEqual(self.execution.execute_order.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
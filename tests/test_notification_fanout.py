@@ -0,0 +1,138 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.core.notification_channel import NotificationChannel, NotificationRateLimited
+from src.core.fanout_notification_channel import FanOutNotificationChannel
+from src.core.file_notification_channel import FileNotificationChannel
+from src.core.queued_notification_channel import QueuedNotificationChannel
+from src.main_loop import MainLoop
+
+
+class SlowChannel(NotificationChannel):
+    def __init__(self, delay=0.0, result=True, rate_limit_times=0):
+        self.delay = delay
+        self.result = result
+        self.rate_limit_times = rate_limit_times
+        self.sent_payloads = []
+
+    def send(self, payload: dict) -> bool:
+        if self.rate_limit_times > 0:
+            self.rate_limit_times -= 1
+            raise NotificationRateLimited(0.01)
+        time.sleep(self.delay)
+        self.sent_payloads.append(payload)
+        return self.result
+
+
+class TestFanOutNotificationChannel(unittest.TestCase):
+    def test_delivers_to_all_channels(self):
+        a, b = SlowChannel(), SlowChannel()
+        fanout = FanOutNotificationChannel([a, b])
+        self.assertTrue(fanout.send({"embeds": [{"title": "x"}]}))
+        self.assertEqual(len(a.sent_payloads), 1)
+        self.assertEqual(len(b.sent_payloads), 1)
+        fanout.close()
+
+    def test_channels_are_sent_concurrently(self):
+        channels = [SlowChannel(delay=0.3) for _ in range(3)]
+        fanout = FanOutNotificationChannel(channels)
+        started = time.monotonic()
+        fanout.send({"embeds": []})
+        # 합계(0.9s)가 아닌 최대값(0.3s) 근처에서 끝나야 한다.
+        self.assertLess(time.monotonic() - started, 0.6)
+        fanout.close()
+
+    def test_slow_channel_times_out_without_blocking_others(self):
+        fast, slow = SlowChannel(), SlowChannel(delay=1.0)
+        fanout = FanOutNotificationChannel([slow, fast], timeouts=[0.1, None])
+        started = time.monotonic()
+        self.assertTrue(fanout.send({"embeds": []}))
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(len(fast.sent_payloads), 1)
+        fanout.close()
+
+    def test_hung_channel_does_not_delay_other_sinks(self):
+        release = threading.Event()
+
+        class HungChannel(NotificationChannel):
+            def send(self, payload):
+                release.wait()
+                return True
+
+        fast = SlowChannel()
+        fanout = FanOutNotificationChannel([HungChannel(), fast], timeouts=[0.2, None], max_backlog=5)
+        self.addCleanup(fanout.close, 1.0)
+        self.addCleanup(release.set)
+
+        fanout.send({"n": 0})  # 첫 전송만 hung 채널의 timeout까지 기다린다
+        started = time.monotonic()
+        for i in range(1, 20):
+            self.assertTrue(fanout.send({"n": i}))
+        self.assertLess(time.monotonic() - started, 0.2)
+        self.assertEqual([p["n"] for p in fast.sent_payloads], list(range(20)))
+        # hung 채널 backlog는 max_backlog로 제한되고 넘친 페이로드는 센다
+        self.assertEqual(fanout.dropped_counts["HungChannel"], 20 - 1 - 5)
+
+    def test_returns_false_when_all_fail(self):
+        fanout = FanOutNotificationChannel([SlowChannel(result=False), SlowChannel(result=False)])
+        self.assertFalse(fanout.send({"embeds": []}))
+        fanout.close()
+
+    def test_rate_limited_channel_is_retried(self):
+        limited = SlowChannel(rate_limit_times=1)
+        fanout = FanOutNotificationChannel([limited])
+        self.assertTrue(fanout.send({"embeds": []}))
+        self.assertEqual(len(limited.sent_payloads), 1)
+        fanout.close()
+
+
+class TestFileNotificationChannel(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_appends_jsonl_records(self):
+        path = os.path.join(self.tmpdir, "sub", "notifications.jsonl")
+        channel = FileNotificationChannel(path=path)
+        self.assertTrue(channel.send({"embeds": [{"title": "A"}]}))
+        self.assertTrue(channel.send({"embeds": [{"title": "B"}]}))
+
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r["payload"]["embeds"][0]["title"] for r in records], ["A", "B"])
+        self.assertIn("time", records[0])
+
+
+class TestMainLoopNotifierConfig(unittest.TestCase):
+    @patch('src.main_loop.JSONPersistence')
+    def test_channels_config_builds_fanout(self, MockP):
+        MockP.return_value.load.return_value = {"symbols": {}}
+        tmpdir = tempfile.mkdtemp()
+        try:
+            config = {'notification': {'channels': [
+                {'type': 'webhook', 'url': 'https://example.com/hook', 'timeout': 10, 'fanout_timeout': 3},
+                {'type': 'file', 'path': os.path.join(tmpdir, 'n.jsonl')},
+                {'type': 'unknown'},
+            ]}}
+            loop = MainLoop(config, MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock())
+            channel = loop.notifier.channel
+            self.assertIsInstance(channel, QueuedNotificationChannel)
+            self.assertIsInstance(channel.channel, FanOutNotificationChannel)
+            self.assertEqual(len(channel.channel.channels), 2)
+            self.assertEqual(channel.channel.timeouts, [3, 5.0])
+            self.assertEqual(channel.channel.channels[0].timeout, 10)  # HTTP timeout은 별도
+            loop.notifier.close()
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import time
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+from urllib.error import HTTPError
+
+from src.core.notification_channel import NotificationChannel, NotificationRateLimited
+from src.core.queued_notification_channel import QueuedNotificationChannel, MAX_EMBEDS_PER_MESSAGE
+from src.core.discord_notification_channel import DiscordNotificationChannel
+from src.core.notification_manager import NotificationManager
+
+
+class RecordingChannel(NotificationChannel):
+    """전송된 페이로드를 기록하는 테스트용 채널"""
+
+    def __init__(self, delay=0.0, rate_limit_times=0):
+        self.delay = delay
+        self.rate_limit_times = rate_limit_times
+        self.sent_payloads = []
+        self.closed = False
+
+    def send(self, payload: dict) -> bool:
+        if self.rate_limit_times > 0:
+            self.rate_limit_times -= 1
+            raise NotificationRateLimited(0.01)
+        time.sleep(self.delay)
+        self.sent_payloads.append(payload)
+        return True
+
+    def close(self, timeout=None):
+        self.closed = True
+
+
+def _embed(i):
+    return {"embeds": [{"title": f"msg-{i}"}]}
+
+
+class TestQueuedNotificationChannel(unittest.TestCase):
+    def test_send_does_not_block_on_slow_channel(self):
+        inner = RecordingChannel(delay=0.5)
+        channel = QueuedNotificationChannel(inner, coalesce_window=0.0)
+
+        started = time.monotonic()
+        self.assertTrue(channel.send(_embed(0)))
+        self.assertLess(time.monotonic() - started, 0.1)
+
+        channel.close(timeout=5)
+        self.assertEqual(len(inner.sent_payloads), 1)
+        self.assertTrue(inner.closed)
+
+    def test_burst_is_coalesced_up_to_embed_limit(self):
+        inner = RecordingChannel()
+        channel = QueuedNotificationChannel(inner, coalesce_window=0.2)
+        for i in range(15):
+            channel.send(_embed(i))
+        channel.close(timeout=5)
+
+        self.assertEqual(len(inner.sent_payloads), 2)
+        self.assertEqual(len(inner.sent_payloads[0]["embeds"]), MAX_EMBEDS_PER_MESSAGE)
+        self.assertEqual(len(inner.sent_payloads[1]["embeds"]), 5)
+        titles = [e["title"] for p in inner.sent_payloads for e in p["embeds"]]
+        self.assertEqual(titles, [f"msg-{i}" for i in range(15)])
+
+    def test_non_embed_payload_sent_alone(self):
+        inner = RecordingChannel()
+        channel = QueuedNotificationChannel(inner, coalesce_window=0.2)
+        channel.send(_embed(0))
+        channel.send({"content": "plain"})
+        channel.send(_embed(1))
+        channel.close(timeout=5)
+
+        self.assertEqual(inner.sent_payloads[0], _embed(0))
+        self.assertEqual(inner.sent_payloads[1], {"content": "plain"})
+
+    def test_rate_limit_is_retried(self):
+        inner = RecordingChannel(rate_limit_times=2)
+        channel = QueuedNotificationChannel(inner, coalesce_window=0.0)
+        channel.send(_embed(0))
+        self.assertTrue(channel.flush(timeout=5))
+        self.assertEqual(len(inner.sent_payloads), 1)
+        channel.close(timeout=5)
+
+    def test_full_queue_drops_payload(self):
+        gate = threading.Event()
+
+        class BlockingChannel(RecordingChannel):
+            def send(self, payload):
+                gate.wait(5)
+                return super().send(payload)
+
+        inner = BlockingChannel()
+        channel = QueuedNotificationChannel(inner, max_queue_size=1, coalesce_window=0.0)
+        channel.send({"content": "in-flight"})
+        time.sleep(0.05)  # worker가 첫 메시지를 꺼내 전송 중
+        self.assertTrue(channel.send({"content": "queued"}))
+        self.assertFalse(channel.send({"content": "dropped"}))
+        self.assertEqual(channel.dropped_count, 1)
+
+        gate.set()
+        channel.close(timeout=5)
+        self.assertEqual(len(inner.sent_payloads), 2)
+
+    def test_manager_close_flushes_queue(self):
+        inner = RecordingChannel(delay=0.05)
+        manager = NotificationManager(channel=QueuedNotificationChannel(inner, coalesce_window=0.0))
+        manager.send_status("A", "a")
+        manager.send_status("B", "b")
+        manager.close()
+        sent = [e["title"] for p in inner.sent_payloads for e in p["embeds"]]
+        self.assertEqual(sent, ["A", "B"])
+
+
+class TestDiscordRateLimit(unittest.TestCase):
+    @patch('urllib.request.urlopen')
+    def test_429_raises_rate_limited(self, mock_urlopen):
+        mock_urlopen.side_effect = HTTPError(
+            url="https://discord.com/api/webhooks/test", code=429, msg="Too Many Requests",
+            hdrs=None, fp=MagicMock(read=MagicMock(return_value=b'{"retry_after": 1.5}'))
+        )
+        channel = DiscordNotificationChannel(webhook_url="https://discord.com/api/webhooks/test")
+        with self.assertRaises(NotificationRateLimited) as ctx:
+            channel.send({"embeds": [{"title": "Test"}]})
+        self.assertEqual(ctx.exception.retry_after, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
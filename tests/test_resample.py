@@ -0,0 +1,112 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from src.utils.kline_store import KlineStore
+from src.utils.resample import bucket_start, resample_columns, resample_frame
+
+HOUR = 3_600_000
+
+
+def hourly(n, start='2024-01-03 05:00'):
+    rng = np.random.default_rng(7)
+    ts = pd.Timestamp(start).value // 1_000_000 + HOUR * np.arange(n)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return {
+        'timestamp': ts.astype('int64'),
+        'open': close + rng.normal(0, 0.5, n),
+        'high': close + 2,
+        'low': close - 2,
+        'close': close,
+        'volume': rng.uniform(1, 10, n),
+    }
+
+
+class TestResample(unittest.TestCase):
+    def reference(self, columns, rule):
+        df = pd.DataFrame(columns)
+        df.index = pd.to_datetime(df.pop('timestamp'), unit='ms')
+        agg = df.resample(rule, label='left', closed='left').agg(
+            {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'})
+        return agg.dropna()
+
+    def assert_matches(self, result, expected):
+        np.testing.assert_array_equal(result['timestamp'], expected.index.as_unit('ms').asi8)
+        for col in ('open', 'high', 'low', 'close', 'volume'):
+            np.testing.assert_allclose(result[col], expected[col].to_numpy(), err_msg=col)
+
+    def test_matches_pandas_resample(self):
+        columns = hourly(24 * 40)
+        self.assert_matches(resample_columns(columns, '4h'), self.reference(columns, '4h'))
+        self.assert_matches(resample_columns(columns, '1d'), self.reference(columns, '1D'))
+        self.assert_matches(resample_columns(columns, '1w'), self.reference(columns, 'W-MON'))
+        self.assert_matches(resample_columns(columns, '1M'), self.reference(columns, 'MS'))
+
+    def test_exchange_aligned_boundaries(self):
+        ts = pd.to_datetime(bucket_start([pd.Timestamp('2024-01-03 05:00').value // 1_000_000], '1w'), unit='ms')
+        self.assertEqual(ts[0], pd.Timestamp('2024-01-01'))  # 월요일
+        self.assertEqual(ts[0].dayofweek, 0)
+        ts = pd.to_datetime(bucket_start([pd.Timestamp('2024-01-03 05:00').value // 1_000_000], '4h'), unit='ms')
+        self.assertEqual(ts[0], pd.Timestamp('2024-01-03 04:00'))
+
+    def test_drop_incomplete(self):
+        columns = hourly(10)  # 05:00 ~ 14:00 -> 04:00(3봉), 08:00(4), 12:00(3)
+        result = resample_columns(columns, '4h', source_interval='1h', drop_incomplete=True)
+        self.assertEqual(pd.to_datetime(result['timestamp'], unit='ms').tolist(), [pd.Timestamp('2024-01-03 08:00')])
+        with self.assertRaises(ValueError):
+            resample_columns(columns, '1M', source_interval='1h', drop_incomplete=True)
+
+    def test_frame_keeps_timestamp_type(self):
+        columns = hourly(48)
+        df = pd.DataFrame(columns)
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
+        result = resample_frame(df, '1d')
+        self.assertEqual(result['timestamp'].dtype, df['timestamp'].dtype)
+        self.assertEqual(len(result), 3)
+
+        ms_result = resample_frame(pd.DataFrame(columns), '1d')
+        self.assertEqual(ms_result['timestamp'].dtype, np.int64)
+
+    def test_store_resamples_base_interval(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        store = KlineStore(tmpdir, max_bars=0)
+        store.update('BTCUSDT', '1h', hourly(100))
+        self.assertEqual(len(store.load_resampled('BTCUSDT', '4h', '1h')['timestamp']), 26)
+        self.assertIsNone(store.load_resampled('ETHUSDT', '4h', '1h'))
+
+
+class TestBacktestBaseInterval(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def make_engine(self, interval):
+        from src.backtest import BacktestEngine
+        path = os.path.join(self.tmpdir, f"config_{interval}.json")
+        with open(path, 'w') as f:
+            json.dump({'symbol': 'BTCUSDT', 'interval': interval, 'base_interval': '1h', 'limit': 10,
+                       'data_dir': os.path.join(self.tmpdir, 'klines')}, f)
+        return BacktestEngine(path)
+
+    def test_variants_share_one_base_download(self):
+        base = pd.DataFrame(hourly(24 * 10, start='2024-01-01 00:00'))
+        with patch('src.backtest.engine.BacktestEngine._fetch_klines', return_value=base) as fetch:
+            df_1d = self.make_engine('1d').fetch_data()
+            df_4h = self.make_engine('4h').fetch_data()
+
+        fetch.assert_called_once_with('1h', 10 * 24)
+        self.assertEqual(len(df_1d), 10)
+        self.assertEqual(df_1d['high'].iloc[0], base['high'].iloc[:24].max())
+        self.assertEqual(len(df_4h), 10)
+        self.assertEqual(df_4h['close'].iloc[-1], base['close'].iloc[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
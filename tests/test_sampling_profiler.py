@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from unittest.mock import MagicMock
+
+from src.core.modules_impl import RiskManager
+from src.core.signal_manager import TurtleSignalManager
+from src.main_loop import MainLoop
+from src.utils.sampling_profiler import SamplingProfiler, frame_label
+
+
+def busy_until(event):
+    while not event.is_set():
+        sum(range(1000))
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.done = threading.Event()
+        self.worker = threading.Thread(target=busy_until, args=(self.done,), daemon=True)
+        self.worker.start()
+        self.addCleanup(self.worker.join)
+        self.addCleanup(self.done.set)
+
+    def test_folded_output_attributes_project_functions(self):
+        profiler = SamplingProfiler(thread_id=self.worker.ident, output_dir=self.tmpdir)
+        for _ in range(20):
+            self.assertTrue(profiler.sample())
+
+        path = profiler.flush()
+        with open(path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(sum(int(line.rsplit(' ', 1)[1]) for line in lines), 20)
+        self.assertTrue(all('tests.test_sampling_profiler:busy_until' in line for line in lines))
+        # 스택은 바깥 호출부터 안쪽 순서
+        self.assertTrue(lines[0].startswith('threading.py:'))
+        # 집계는 flush 후 비워진다
+        self.assertIsNone(profiler.flush())
+
+    def test_frame_label(self):
+        self.assertEqual(frame_label(busy_until.__code__), 'tests.test_sampling_profiler:busy_until')
+        self.assertEqual(frame_label(threading.Thread.run.__code__), 'threading.py:Thread.run')
+
+    def test_inclusive_shares(self):
+        stacks = Counter({'main.py:main;src.a:f;src.b:g': 3, 'main.py:main;src.a:f;src.a:f': 1})
+        shares = dict(SamplingProfiler.inclusive_shares(stacks))
+        self.assertEqual(shares, {'src.a:f': 1.0, 'src.b:g': 0.75})
+
+    def test_interval_backs_off_when_sampling_is_expensive(self):
+        profiler = SamplingProfiler(thread_id=self.worker.ident, interval=0.01, max_overhead=1e-9)
+        profiler.sample()
+        self.assertGreater(profiler.interval, 0.01)
+
+        profiler.max_overhead = 1e9
+        profiler.sample()
+        self.assertEqual(profiler.interval, 0.01)
+
+    def test_missing_thread(self):
+        self.assertFalse(SamplingProfiler(thread_id=-1).sample())
+
+    def test_toggle_runs_in_background(self):
+        profiler = SamplingProfiler(thread_id=self.worker.ident, interval=0.001, output_dir=self.tmpdir)
+        profiler.toggle()
+        self.assertTrue(profiler.running)
+        time.sleep(0.05)
+        profiler.toggle()
+        self.assertFalse(profiler.running)
+        self.assertEqual(len(os.listdir(self.tmpdir)), 1)
+
+
+class TestMainLoopProfiling(unittest.TestCase):
+    def test_set_profiling_and_config_reload(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        config = {
+            'symbols': [{'name': 'BTCUSDT', 'timeframe': '4h'}],
+            'persistence': {'path': os.path.join(tmpdir, 'state.json')},
+            'profiler': {'enabled': False, 'interval': 0.001, 'dir': os.path.join(tmpdir, 'profiles')},
+        }
+        loop = MainLoop(config, MagicMock(), MagicMock(), TurtleSignalManager(), RiskManager(), MagicMock())
+        self.assertIsNone(loop.profiler)
+
+        loop.set_profiling(True)
+        self.addCleanup(loop.profiler.stop)
+        self.assertTrue(loop.profiler.running)
+        self.assertEqual(loop.profiler.thread_id, threading.main_thread().ident)
+        time.sleep(0.05)
+        loop.set_profiling(False)
+        self.assertFalse(loop.profiler.running)
+        self.assertEqual(len(os.listdir(os.path.join(tmpdir, 'profiles'))), 1)
+
+        loop.apply_config(dict(config, profiler=dict(config['profiler'], enabled=True)))
+        self.assertTrue(loop.profiler.running)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from src.core.modules_impl import TechnicalAnalysisEngine
+from src.core.panel_indicators import PanelIndicatorEngine
+from src.scanner import UniverseScanner
+from src.utils.kline_store import KlineStore, klines_to_columns
+from src.utils.rate_limiter import RateLimiter
+
+H4 = 4 * 3600 * 1000
+NOW_MS = 1_700_000_000_000 - (1_700_000_000_000 % H4)
+
+
+def make_klines(n, seed, trend=0.0, end_ms=NOW_MS):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(trend, 0.02, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, n))
+    ts = end_ms - H4 * np.arange(n)[::-1]
+    return [[int(t), str(o), str(h), str(l), str(c), "10.0", 0, "0", 0, "0", "0", "0"]
+            for t, o, h, l, c in zip(ts, open_, high, low, close)]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestPanelIndicators(unittest.TestCase):
+    def test_matches_per_symbol_engine(self):
+        columns = {'AAAUSDT': klines_to_columns(make_klines(300, 1)),
+                   'BBBUSDT': klines_to_columns(make_klines(150, 2))}  # 늦게 상장된 심볼
+        panel = PanelIndicatorEngine().calculate(PanelIndicatorEngine.build_panel(columns))
+
+        ta = TechnicalAnalysisEngine()
+        for symbol, cols in columns.items():
+            expected = ta.calculate_indicators(KlineStore.to_frame(cols), indicators={'N', 'ADX', 'ema_200', 'dc_90_high'})
+            for name in ('N', 'ADX', 'ema_200', 'dc_90_high'):
+                actual = panel[name][symbol].dropna().to_numpy()
+                np.testing.assert_allclose(actual, expected[name].dropna().to_numpy(), rtol=1e-10,
+                                           err_msg=f"{symbol} {name}")
+
+
+class TestKlineStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_update_replaces_overlap_and_persists(self):
+        store = KlineStore(self.tmpdir, max_bars=5)
+        klines = make_klines(6, 3)
+        store.update('AAAUSDT', '4h', klines_to_columns(klines[:4]))
+        revised = [list(k) for k in klines[3:]]
+        revised[0][4] = "123.0"  # 형성 중이던 봉의 종가가 바뀜
+        merged = store.update('AAAUSDT', '4h', klines_to_columns(revised))
+
+        self.assertEqual(len(merged['timestamp']), 5)
+        self.assertEqual(merged['close'][-3], 123.0)
+        reloaded = KlineStore(self.tmpdir).load('AAAUSDT', '4h')
+        np.testing.assert_array_equal(reloaded['timestamp'], merged['timestamp'])
+        self.assertEqual(KlineStore(self.tmpdir).symbols('4h'), ['AAAUSDT'])
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_waits_for_window(self):
+        clock = FakeClock()
+        limiter = RateLimiter(max_weight=10, window=60, clock=clock, sleep=clock.sleep)
+        for _ in range(5):
+            limiter.acquire(2)
+        self.assertEqual(clock.now, 0.0)
+        limiter.acquire(2)
+        self.assertGreaterEqual(clock.now, 60.0)
+        self.assertLessEqual(limiter.used_weight, 10)
+
+        limiter.pause(5)
+        before = clock.now
+        limiter.acquire(1)
+        self.assertGreaterEqual(clock.now - before, 5)
+
+
+class TestUniverseScanner(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.client = MagicMock()
+        self.client.get_exchange_info.return_value = {'symbols': [
+            {'symbol': 'UPUSDT', 'status': 'TRADING', 'quoteAsset': 'USDT'},
+            {'symbol': 'DOWNUSDT', 'status': 'TRADING', 'quoteAsset': 'USDT'},
+            {'symbol': 'OLDUSDT', 'status': 'BREAK', 'quoteAsset': 'USDT'},
+            {'symbol': 'UPBTC', 'status': 'TRADING', 'quoteAsset': 'BTC'},
+        ]}
+        up = make_klines(500, 4, trend=0.005)
+        # 마지막 봉에서 90봉 최고가를 크게 돌파
+        breakout = max(float(k[2]) for k in up[-91:-1]) * 1.1
+        up[-1][2], up[-1][4] = str(breakout * 1.01), str(breakout)
+        self.klines = {'UPUSDT': up, 'DOWNUSDT': make_klines(500, 5, trend=-0.01)}
+
+        def get_klines(symbol, interval, limit, startTime=None):
+            rows = self.klines[symbol]
+            if startTime is not None:
+                rows = [k for k in rows if k[0] >= startTime]
+            return rows[-limit:]
+
+        self.client.get_klines.side_effect = get_klines
+        self.scanner = UniverseScanner(self.client, store=KlineStore(self.tmpdir), interval='4h',
+                                       clock=lambda: NOW_MS / 1000 + 60)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_scan_ranks_breakouts_and_fetches_incrementally(self):
+        self.assertEqual(self.scanner.universe(), ['DOWNUSDT', 'UPUSDT'])
+        candidates = self.scanner.scan()
+        self.assertEqual([c['symbol'] for c in candidates], ['UPUSDT'])
+        self.assertGreater(candidates[0]['breakout_n'], 0)
+
+        self.client.get_klines.reset_mock()
+        self.scanner.scan(['UPUSDT', 'DOWNUSDT'])
+        for call in self.client.get_klines.call_args_list:
+            self.assertEqual(call.kwargs['startTime'], NOW_MS)
+            self.assertLessEqual(call.kwargs['limit'], 100)
+
+    def test_failed_symbol_is_skipped(self):
+        self.klines.pop('DOWNUSDT')
+        candidates = self.scanner.scan(['UPUSDT', 'DOWNUSDT'])
+        self.assertEqual([c['symbol'] for c in candidates], ['UPUSDT'])
+
+    def test_full_universe_evaluation_is_fast(self):
+        columns = {f"S{i}USDT": klines_to_columns(make_klines(500, i, trend=0.002)) for i in range(400)}
+        started = time.perf_counter()
+        self.scanner.evaluate(columns)
+        self.assertLess(time.perf_counter() - started, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from src.core.modules_impl import RiskManager
+from src.strategies import ShadowEvaluator, create_strategy
+from src.main_loop import MainLoop
+
+
+def bar(**overrides):
+    values = {'N': 2.0, 'ADX': 40.0, 'ema_200': 50.0, 'dc_90_high': 100.0, 'dc_45_low': 80.0,
+              'dc_55_high': 100.0, 'dc_20_low': 80.0, 'dc_20_high': 100.0, 'dc_10_low': 80.0,
+              'rsi_14': 60.0, 'volume': 10.0, 'vol_sma_20': 5.0}
+    values.update(overrides)
+    return pd.DataFrame([values] * 3)
+
+
+class TestShadowEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "shadow_state.json")
+        self.configs = [
+            {"name": "adx30", "strategy_params": {"adx_filter_threshold": 30.0}},
+            {"name": "adx50", "strategy_params": {"adx_filter_threshold": 50.0}},
+            {"name": "eth_only", "symbols": ["ETHUSDT"]},
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_virtual_round_trip_pnl(self):
+        shadow = ShadowEvaluator(self.configs, RiskManager(), filepath=self.path)
+        shadow.on_bar("BTCUSDT", bar(), 101.0, 2.0, 2.0)
+
+        self.assertEqual(shadow.positions["adx30"]["BTCUSDT"]["units_held"], 1)
+        self.assertEqual(shadow.positions["adx50"]["BTCUSDT"]["units_held"], 0)
+        self.assertNotIn("eth_only", shadow.positions)
+
+        unit_size = shadow.positions["adx30"]["BTCUSDT"]["unit_sizes"][0]
+        shadow.on_bar("BTCUSDT", bar(), 79.0, 2.0, 2.0)
+        shadow.close()
+
+        summary = shadow.summary()
+        self.assertEqual(summary["adx30"]["trades"], 1)
+        self.assertAlmostEqual(summary["adx30"]["realized_pnl"], (79.0 - 101.0) * unit_size)
+        self.assertEqual(summary["adx50"]["trades"], 0)
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)["stats"]["adx30"]["BTCUSDT"]["trades"], 1)
+
+    def test_state_restored_and_kept_on_reconfigure(self):
+        shadow = ShadowEvaluator(self.configs, RiskManager(), filepath=self.path)
+        shadow.on_bar("BTCUSDT", bar(), 101.0, 2.0, 2.0)
+        shadow.close()
+
+        restored = ShadowEvaluator(self.configs[:1], RiskManager(), filepath=self.path)
+        self.assertEqual(restored.positions["adx30"]["BTCUSDT"]["units_held"], 1)
+        restored.configure([{"name": "adx30", "strategy_params": {"adx_filter_threshold": 35.0}}])
+        self.assertEqual(restored.shadows["adx30"]["strategy"].adx_filter_threshold, 35.0)
+        self.assertEqual(restored.positions["adx30"]["BTCUSDT"]["units_held"], 1)
+        restored.close()
+
+    def test_required_indicators_follow_symbol_filter(self):
+        shadow = ShadowEvaluator([{"name": "adv", "strategy": "AdvancedTurtle", "symbols": ["ETHUSDT"]}],
+                                 RiskManager(), filepath=None)
+        self.assertEqual(shadow.required_indicators("BTCUSDT"), set())
+        self.assertIn("rsi_14", shadow.required_indicators("ETHUSDT"))
+
+
+class TestMainLoopShadow(unittest.TestCase):
+    @patch('src.main_loop.JSONPersistence')
+    def test_shadow_never_places_orders(self, mock_persistence_cls):
+        persistence = mock_persistence_cls.return_value
+        persistence.load.return_value = {"total_heat": 0.0, "symbols": {}}
+        persistence.get_symbol_state.side_effect = \
+            lambda state, symbol: state["symbols"].setdefault(symbol, {"units_held": 0})
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        config = {
+            "symbols": [{"name": "BTCUSDT", "timeframe": "4h"}],
+            "shadow": {"enabled": True, "path": os.path.join(tmpdir, "shadow.json"),
+                       "strategies": [{"name": "adv", "strategy": "AdvancedTurtle"}]},
+        }
+        exchange = MagicMock()
+        exchange.get_realtime_price.return_value = 101.0
+        exchange.get_asset_balance.return_value = 10000.0
+        ta = MagicMock()
+        ta.calculate_indicators.return_value = bar()
+        execution = MagicMock()
+
+        loop = MainLoop(config, exchange, ta, create_strategy(None, {"adx_filter_threshold": 99.0}),
+                        RiskManager(), execution, strategy_factory=create_strategy)
+        loop.run_once()
+        loop.shadow.close()
+
+        execution.execute_order.assert_not_called()
+        self.assertEqual(loop.shadow.positions["adv"]["BTCUSDT"]["units_held"], 1)
+        requested = ta.calculate_indicators.call_args.kwargs["indicators"]
+        self.assertTrue({"rsi_14", "vol_sma_20", "dc_90_high"} <= requested)
+
+
+if __name__ == '__main__':
+    unittest.main()
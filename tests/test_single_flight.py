@@ -0,0 +1,135 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.utils.single_flight import SingleFlight
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(2)
+            return "klines"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("BTCUSDT", slow)))
+                   for _ in range(5)]
+        for t in threads:
+            t.start()
+        while flight.shared < 4:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join(2)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["klines"] * 5)
+        self.assertEqual((flight.calls, flight.shared), (1, 4))
+
+    def test_error_propagates_to_waiters_and_is_not_cached(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(2)
+            raise RuntimeError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                flight.do("k", failing, ttl=10)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for t in threads:
+            t.start()
+        while flight.shared < 2:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join(2)
+
+        self.assertEqual(errors, ["boom"] * 3)
+        self.assertEqual(flight.do("k", lambda: "ok", ttl=10), "ok")
+
+    def test_ttl_cache(self):
+        clock = FakeClock()
+        flight = SingleFlight(clock=clock)
+        fn = MagicMock(side_effect=[1.0, 2.0, None, 3.0])
+
+        self.assertEqual(flight.do("t", fn, ttl=1.0), 1.0)
+        clock.now = 0.9
+        self.assertEqual(flight.do("t", fn, ttl=1.0), 1.0)
+        clock.now = 1.0
+        self.assertEqual(flight.do("t", fn, ttl=1.0), 2.0)
+        # 실패(None)는 보관하지 않는다
+        flight.forget("t")
+        self.assertIsNone(flight.do("t", fn, ttl=1.0))
+        self.assertEqual(flight.do("t", fn, ttl=1.0), 3.0)
+        self.assertEqual(fn.call_count, 4)
+
+
+class TestExchangeProviderCoalescing(unittest.TestCase):
+    def setUp(self):
+        patcher = patch('src.core.exchange_provider.Client')
+        self.client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        from src.core.exchange_provider import ExchangeProvider
+        self.exchange = ExchangeProvider(testnet=True, ticker_ttl=5.0)
+
+    def test_ticker_is_cached_within_ttl(self):
+        self.client.get_symbol_ticker.return_value = {'price': '100.5'}
+        self.assertEqual(self.exchange.get_realtime_price('BTCUSDT'), 100.5)
+        self.assertEqual(self.exchange.get_realtime_price('BTCUSDT'), 100.5)
+        self.exchange.get_realtime_price('ETHUSDT')
+        self.assertEqual(self.client.get_symbol_ticker.call_count, 2)
+
+    def test_concurrent_klines_share_one_request(self):
+        release = threading.Event()
+        kline = [1700000000000, '1', '2', '0.5', '1.5', '10', 0, '0', 0, '0', '0', '0']
+
+        def get_klines(**kwargs):
+            release.wait(2)
+            return [kline]
+
+        self.client.get_klines.side_effect = get_klines
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.exchange.get_market_data('BTCUSDT', '4h')))
+                   for _ in range(3)]
+        for t in threads:
+            t.start()
+        while self.exchange._flight.shared < 2:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join(2)
+
+        self.assertEqual(self.client.get_klines.call_count, 1)
+        self.assertEqual(len(results), 3)
+        # 호출자마다 독립된 복사본
+        results[0].loc[0, 'close'] = -1
+        self.assertEqual(results[1].loc[0, 'close'], 1.5)
+
+        # 진행 중인 요청이 없으면 캔들은 다시 조회한다
+        self.exchange.get_market_data('BTCUSDT', '4h')
+        self.assertEqual(self.client.get_klines.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
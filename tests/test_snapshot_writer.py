@@ -0,0 +1,102 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from src.utils.persistence import JSONPersistence
+from src.utils.snapshot_writer import AtomicSnapshotWriter, write_json_atomic
+
+
+class TestWriteJsonAtomic(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "state.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_failed_write_keeps_previous_file(self):
+        write_json_atomic(self.path, {"units_held": 1})
+        with self.assertRaises(TypeError):
+            write_json_atomic(self.path, {"bad": object()})
+
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {"units_held": 1})
+        self.assertEqual(os.listdir(self.tmpdir), ["state.json"])
+
+
+class TestAtomicSnapshotWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "state.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_rapid_saves_are_coalesced(self):
+        writer = AtomicSnapshotWriter(self.path, debounce=0.2, max_delay=2.0)
+        for i in range(50):
+            writer.submit({"counter": i})
+        writer.close()
+
+        self.assertLess(writer.writes, 5)
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {"counter": 49})
+
+    def test_snapshot_is_copied_on_submit(self):
+        writer = AtomicSnapshotWriter(self.path, debounce=0.05)
+        state = {"symbols": {"BTCUSDT": {"units_held": 1}}}
+        writer.submit(state)
+        state["symbols"]["BTCUSDT"]["units_held"] = 99
+        writer.close()
+
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)["symbols"]["BTCUSDT"]["units_held"], 1)
+
+    def test_fsync_only_on_cadence_and_flush(self):
+        with patch("src.utils.snapshot_writer.os.fsync") as mock_fsync:
+            writer = AtomicSnapshotWriter(self.path, debounce=0.0, fsync_interval=3600)
+            writer._last_fsync = time.monotonic()
+            writer.submit({"a": 1})
+            time.sleep(0.2)
+            self.assertEqual(mock_fsync.call_count, 0)
+            writer.close()
+            self.assertGreater(mock_fsync.call_count, 0)
+
+    def test_submit_after_close_raises(self):
+        writer = AtomicSnapshotWriter(self.path)
+        writer.close()
+        with self.assertRaises(RuntimeError):
+            writer.submit({})
+
+
+class TestJSONPersistenceAsync(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "state.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_save_returns_before_write_and_close_flushes(self):
+        p = JSONPersistence(self.path, async_write=True, debounce=10.0)
+        state = p.load()
+        p.get_symbol_state(state, "BTCUSDT")["units_held"] = 2
+        p.save(state)
+        self.assertFalse(os.path.exists(self.path))
+
+        p.close()
+        self.assertEqual(JSONPersistence(self.path).load()["symbols"]["BTCUSDT"]["units_held"], 2)
+
+    def test_sync_save_still_writes_immediately(self):
+        p = JSONPersistence(self.path)
+        p.save({"total_heat": 0.01, "symbols": {}})
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)["total_heat"], 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from src.utils.sqlite_persistence import SQLitePersistence
+
+
+class TestSQLitePersistence(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "state.db")
+        self.json_path = os.path.join(self.tmpdir, "state.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _rows(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return dict(conn.execute("SELECT symbol, updated_at FROM symbols").fetchall())
+        finally:
+            conn.close()
+
+    def test_empty_db_returns_default_state(self):
+        p = SQLitePersistence(self.db_path, json_path=self.json_path)
+        state = p.load()
+        self.assertEqual(state, {"total_heat": 0.0, "symbols": {}})
+        p.close()
+
+    def test_wal_mode_enabled(self):
+        p = SQLitePersistence(self.db_path, json_path=self.json_path)
+        mode = p._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode.lower(), "wal")
+        p.close()
+
+    def test_save_and_load_roundtrip(self):
+        p = SQLitePersistence(self.db_path, json_path=self.json_path)
+        state = p.load()
+        btc = p.get_symbol_state(state, "BTCUSDT")
+        btc["units_held"] = 2
+        btc["entry_prices"] = [100.0, 105.0]
+        state["total_heat"] = 0.02
+        p.save(state)
+        p.close()
+
+        reloaded = SQLitePersistence(self.db_path, json_path=self.json_path).load()
+        self.assertEqual(reloaded["total_heat"], 0.02)
+        self.assertEqual(reloaded["symbols"]["BTCUSDT"]["entry_prices"], [100.0, 105.0])
+
+    def test_only_changed_symbol_is_rewritten(self):
+        p = SQLitePersistence(self.db_path, json_path=self.json_path)
+        state = p.load()
+        p.get_symbol_state(state, "BTCUSDT")
+        p.get_symbol_state(state, "ETHUSDT")
+        p.save(state)
+        before = self._rows()
+
+        state["symbols"]["ETHUSDT"]["units_held"] = 1
+        p.save_symbol(state, "ETHUSDT")
+        after = self._rows()
+
+        self.assertEqual(before["BTCUSDT"], after["BTCUSDT"])
+        self.assertGreaterEqual(after["ETHUSDT"], before["ETHUSDT"])
+        self.assertEqual(p.load()["symbols"]["ETHUSDT"]["units_held"], 1)
+        p.close()
+
+    def test_removed_symbol_is_deleted(self):
+        p = SQLitePersistence(self.db_path, json_path=self.json_path)
+        state = p.load()
+        p.get_symbol_state(state, "BTCUSDT")
+        p.get_symbol_state(state, "ETHUSDT")
+        p.save(state)
+        del state["symbols"]["BTCUSDT"]
+        p.save(state)
+        self.assertEqual(set(self._rows()), {"ETHUSDT"})
+        p.close()
+
+    def test_invalid_synchronous_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            SQLitePersistence(self.db_path, json_path=self.json_path, synchronous="NORMAL; DROP TABLE meta")
+        p = SQLitePersistence(self.db_path, json_path=self.json_path, synchronous="full")
+        self.assertEqual(p._conn.execute("PRAGMA synchronous").fetchone()[0], 2)
+        p.close()
+
+    def test_concurrent_saves_keep_db_and_baseline_consistent(self):
+        p = SQLitePersistence(self.db_path, json_path=self.json_path)
+        p.load()
+        states = [
+            {"total_heat": 0.01, "symbols": {"BTCUSDT": {"units_held": 1}, "ETHUSDT": {"units_held": 2}}},
+            {"total_heat": 0.02, "symbols": {"ETHUSDT": {"units_held": 3}}},
+        ]
+
+        def writer(i):
+            for _ in range(200):
+                p.save(states[i])
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 어느 쪽이 마지막이었든 DB는 기준(_saved_rows)과 같아야 하므로 이후 저장이 빠짐없이 반영된다
+        p.save(states[1])
+        p.close()
+        self.assertEqual(SQLitePersistence(self.db_path, json_path=self.json_path).load(), states[1])
+
+    def test_migrates_existing_json_state(self):
+        legacy = {"total_heat": 0.01, "symbols": {"BTCUSDT": {"units_held": 1, "entry_prices": [50000]}}}
+        with open(self.json_path, "w") as f:
+            json.dump(legacy, f)
+
+        p = SQLitePersistence(self.db_path, json_path=self.json_path)
+        self.assertEqual(p.load(), legacy)
+        p.close()
+
+        # 두 번째 로드는 JSON이 아닌 DB에서 읽는다.
+        os.remove(self.json_path)
+        self.assertEqual(SQLitePersistence(self.db_path, json_path=self.json_path).load(), legacy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from src.utils.startup import StartupTimer
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_after(code):
+    """새 인터프리터에서 code 실행 후 무거운 모듈이 로드되었는지 반환한다."""
+    script = code + "\nimport sys\nprint(','.join(m for m in ('pandas', 'numpy', 'binance') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT_DIR,
+                            capture_output=True, text=True, check=True)
+    return set(filter(None, result.stdout.strip().split(",")))
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_packages_do_not_import_heavy_dependencies(self):
+        self.assertEqual(loaded_after("import src.core, src.utils"), set())
+
+    def test_notification_and_persistence_stay_light(self):
+        self.assertEqual(loaded_after(
+            "from src.core import NotificationManager, QueuedNotificationChannel\n"
+            "from src.utils import JSONPersistence, load_config"
+        ), set())
+
+    def test_attribute_access_imports_only_needed_module(self):
+        loaded = loaded_after("from src.core import TechnicalAnalysisEngine")
+        self.assertIn("pandas", loaded)
+        self.assertNotIn("binance", loaded)
+
+    def test_unknown_attribute_raises(self):
+        import src.core
+        with self.assertRaises(AttributeError):
+            src.core.DoesNotExist
+
+
+class TestStartupTimer(unittest.TestCase):
+    def test_summary_includes_measured_and_preloaded_steps(self):
+        timer = StartupTimer()
+        with timer.measure("config"):
+            pass
+        timer.preload("json")
+        timer.wait_preload()
+
+        summary = timer.summary()
+        self.assertIn("config", summary)
+        self.assertIn("json (background)", summary)
+
+    def test_failed_preload_is_logged_not_raised(self):
+        timer = StartupTimer()
+        with self.assertLogs("BATS-Startup", level="WARNING"):
+            timer.preload("module_that_does_not_exist")
+            timer.wait_preload()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from src.core.modules_impl import RiskManager, TechnicalAnalysisEngine
+from src.core.signal_manager import TurtleSignalManager, AdvancedTurtleManager
+from src.strategies import create_strategy, strategy_params_for, required_indicators
+from src.main_loop import MainLoop
+
+
+class TestStrategyRegistry(unittest.TestCase):
+    def test_create_by_config_name(self):
+        self.assertIsInstance(create_strategy("TurtleTrendFollowing"), TurtleSignalManager)
+        self.assertIsInstance(create_strategy(None), TurtleSignalManager)
+        advanced = create_strategy("AdvancedTurtle", {"rsi_threshold": 60.0})
+        self.assertIsInstance(advanced, AdvancedTurtleManager)
+        self.assertEqual(advanced.rsi_threshold, 60.0)
+
+    def test_unknown_strategy_raises(self):
+        with self.assertRaises(ValueError):
+            create_strategy("Martingale")
+
+    def test_symbol_params_override_global(self):
+        config = {"strategy_params": {"use_s3": True, "adx_filter_threshold": 25.0}}
+        params = strategy_params_for({"name": "ETHUSDT", "strategy_params": {"adx_filter_threshold": 30.0}}, config)
+        self.assertEqual(params, {"use_s3": True, "adx_filter_threshold": 30.0})
+        self.assertEqual(config["strategy_params"]["adx_filter_threshold"], 25.0)
+
+    def test_required_indicators_union(self):
+        union = required_indicators([create_strategy("TurtleTrendFollowing"), create_strategy("AdvancedTurtle")])
+        self.assertIn("rsi_14", union)
+        self.assertIn("dc_90_high", union)
+        self.assertIsNone(required_indicators([MagicMock()]))
+
+
+class TestIndicatorSelection(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        close = 100 + rng.standard_normal(300).cumsum()
+        self.df = pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1,
+                                'close': close, 'volume': rng.random(300)})
+        self.ta = TechnicalAnalysisEngine()
+
+    def test_subset_matches_full_calculation(self):
+        full = self.ta.calculate_indicators(self.df)
+        subset = self.ta.calculate_indicators(self.df, indicators={'N', 'dc_90_high'})
+
+        self.assertNotIn('ADX', subset.columns)
+        self.assertNotIn('rsi_14', subset.columns)
+        pd.testing.assert_series_equal(subset['N'], full['N'])
+        pd.testing.assert_series_equal(subset['dc_90_high'], full['dc_90_high'])
+
+    def test_resolve_includes_dependencies_in_order(self):
+        self.assertEqual(self.ta.resolve({'ADX'}), ['_tr', '_dm', 'ADX'])
+        self.assertEqual(self.ta.resolve({'N', 'ema_200'}), ['_tr', 'N', 'ema_200'])
+
+    def test_default_strategy_skips_unused_indicators(self):
+        required = TurtleSignalManager().required_indicators
+        self.assertEqual(required, {'N', 'ADX', 'ema_200', 'dc_90_high', 'dc_45_low'})
+
+        result = self.ta.calculate_indicators(self.df, indicators=required)
+        for unused in ('dc_55_high', 'dc_20_high', 'dc_20_low', 'dc_10_low', 'rsi_14', 'vol_sma_20'):
+            self.assertNotIn(unused, result.columns)
+
+    def test_open_position_keeps_its_exit_channel(self):
+        manager = TurtleSignalManager(use_s3=True)
+        self.assertNotIn('dc_10_low', manager.indicators_for({'units_held': 0, 'system_mode': 'S1'}))
+        self.assertIn('dc_10_low', manager.indicators_for({'units_held': 1, 'system_mode': 'S1'}))
+
+    def test_advanced_volume_filter_is_optional(self):
+        self.assertIn('vol_sma_20', AdvancedTurtleManager().required_indicators)
+        self.assertNotIn('vol_sma_20', AdvancedTurtleManager(volume_filter=False).required_indicators)
+
+    def test_unknown_indicator_raises(self):
+        with self.assertRaises(ValueError):
+            self.ta.calculate_indicators(self.df, indicators={'macd'})
+
+
+class TestMainLoopPerSymbolStrategy(unittest.TestCase):
+    @patch('src.main_loop.JSONPersistence')
+    def test_symbols_use_configured_strategy_and_indicators(self, mock_persistence_cls):
+        persistence = mock_persistence_cls.return_value
+        persistence.load.return_value = {"total_heat": 0.0, "symbols": {}}
+        persistence.get_symbol_state.side_effect = \
+            lambda state, symbol: state["symbols"].setdefault(symbol, {"units_held": 0})
+
+        config = {
+            "strategy_params": {"adx_filter_threshold": 25.0},
+            "symbols": [
+                {"name": "BTCUSDT", "timeframe": "4h"},
+                {"name": "ETHUSDT", "timeframe": "4h", "strategy": "AdvancedTurtle",
+                 "strategy_params": {"rsi_threshold": 60.0}},
+            ],
+        }
+        exchange = MagicMock()
+        exchange.get_realtime_price.return_value = 100.0
+        ta = MagicMock()
+        ta.calculate_indicators.return_value = pd.DataFrame({'N': [1.0] * 30})
+        default_manager = MagicMock()
+        default_manager.generate_signal.return_value = "HOLD"
+
+        loop = MainLoop(config, exchange, ta, default_manager, RiskManager(), MagicMock(),
+                        strategy_factory=create_strategy)
+        with patch.object(AdvancedTurtleManager, 'generate_signal', return_value="HOLD") as advanced_signal:
+            loop.run_once()
+
+        default_manager.generate_signal.assert_called_once()
+        advanced_signal.assert_called_once()
+        self.assertEqual(loop.symbol_strategies["ETHUSDT"].rsi_threshold, 60.0)
+        self.assertEqual(loop.symbol_strategies["ETHUSDT"].adx_filter_threshold, 25.0)
+
+        calls = ta.calculate_indicators.call_args_list
+        self.assertEqual(calls[0].kwargs, {})
+        self.assertEqual(calls[1].kwargs["indicators"], set(loop.symbol_strategies["ETHUSDT"].required_indicators))
+
+
+if __name__ == '__main__':
+    unittest.main()